@@ -117,6 +117,15 @@ strict_help = "Enable strict mode. This will cause MkDocs to abort the build on
 theme_help = "The theme to use when building your documentation."
 theme_choices = sorted(utils.get_theme_names())
 site_dir_help = "The directory to output the result of the documentation build."
+archive_help = (
+    "Write the built site into this archive instead of the site_dir "
+    "(.zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz)."
+)
+atomic_help = (
+    "Build into a staging directory, then swap it into the place of the site_dir at once "
+    "(overrides `atomic_build` from the config)."
+)
+allow_missing_help = "Treat a missing OLD manifest as an empty one (e.g. for the first upload)."
 use_directory_urls_help = "Use directory URLs when building pages (the default)."
 reload_help = "Enable the live reloading in the development server (this is the default)"
 no_reload_help = "Disable the live reloading in the development server."
@@ -145,6 +154,10 @@ watch_theme_help = (
     "Ignored when live reload is not used."
 )
 shell_help = "Use the shell when invoking Git."
+incremental_help = (
+    "Commit only the files that changed since the last deployment, "
+    "and don't push at all if none did."
+)
 watch_help = "A directory or file to watch for live reloading. Can be supplied multiple times."
 projects_file_help = (
     "URL or local path of the registry file that declares all known MkDocs-related projects."
@@ -272,12 +285,31 @@ def serve_command(**kwargs):
     serve.serve(**kwargs)
 
 
+def _validate_archive(ctx, param, value):
+    if value is not None:
+        from mkdocs.utils.archive import archive_format
+
+        try:
+            archive_format(value)
+        except ValueError as e:
+            raise click.BadParameter(str(e))
+    return value
+
+
 @cli.command(name="build")
 @click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
 @common_config_options
 @click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
+@click.option('--atomic/--no-atomic', 'atomic_build', default=None, help=atomic_help)
+@click.option(
+    '--archive',
+    type=click.Path(dir_okay=False),
+    callback=_validate_archive,
+    metavar='<FILE>',
+    help=archive_help,
+)
 @common_options
-def build_command(clean, **kwargs):
+def build_command(clean, archive, **kwargs):
     """Build the MkDocs documentation."""
     from mkdocs.commands import build
 
@@ -285,11 +317,36 @@ def build_command(clean, **kwargs):
     cfg = config.load_config(**kwargs)
     cfg.plugins.on_startup(command='build', dirty=not clean)
     try:
-        build.build(cfg, dirty=not clean)
+        build.build(cfg, dirty=not clean, archive=archive)
     finally:
         cfg.plugins.on_shutdown()
 
 
+@cli.command(name="diff-manifest")
+@click.argument('old', type=click.Path(dir_okay=False))
+@click.argument('new', type=click.Path(exists=True, dir_okay=False))
+@click.option('--allow-missing', is_flag=True, help=allow_missing_help)
+@common_options
+def diff_manifest_command(old, new, allow_missing):
+    """List the files added (A), changed (M) and removed (D) between two output manifests."""
+    from mkdocs.exceptions import Abort
+    from mkdocs.utils.manifest import diff_manifests, load_manifest
+
+    try:
+        old_files = {} if allow_missing and not os.path.exists(old) else load_manifest(old)
+        new_files = load_manifest(new)
+    except (OSError, ValueError) as e:
+        raise Abort(str(e))
+    diff = diff_manifests(old_files, new_files)
+    for status, paths in ('A', diff.added), ('M', diff.changed), ('D', diff.removed):
+        for path in paths:
+            print(f'{status}\t{path}')  # noqa: T201
+    log.info(
+        f"{len(diff.added)} added, {len(diff.changed)} changed, {len(diff.removed)} removed, "
+        f"{len(new_files) - len(diff.added) - len(diff.changed)} unchanged"
+    )
+
+
 @cli.command(name="gh-deploy")
 @click.option('-c', '--clean/--dirty', is_flag=True, default=True, help=clean_help)
 @click.option('-m', '--message', help=commit_message_help)
@@ -299,11 +356,21 @@ def build_command(clean, **kwargs):
 @click.option('--no-history', is_flag=True, help=no_history_help)
 @click.option('--ignore-version', is_flag=True, help=ignore_version_help)
 @click.option('--shell', is_flag=True, help=shell_help)
+@click.option('--incremental', is_flag=True, help=incremental_help)
 @common_config_options
 @click.option('-d', '--site-dir', type=click.Path(), help=site_dir_help)
 @common_options
 def gh_deploy_command(
-    clean, message, remote_branch, remote_name, force, no_history, ignore_version, shell, **kwargs
+    clean,
+    message,
+    remote_branch,
+    remote_name,
+    force,
+    no_history,
+    ignore_version,
+    shell,
+    incremental,
+    **kwargs,
 ):
     """Deploy your documentation to GitHub Pages."""
     from mkdocs.commands import build, gh_deploy
@@ -322,6 +389,7 @@ def gh_deploy_command(
         no_history=no_history,
         ignore_version=ignore_version,
         shell=shell,
+        incremental=incremental,
     )
 
 
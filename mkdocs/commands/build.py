@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import contextlib
 import gzip
+import hashlib
+import io
 import logging
 import os
 import time
@@ -15,9 +18,14 @@ from mkdocs import utils
 from mkdocs.exceptions import Abort, BuildError
 from mkdocs.structure.files import File, Files, InclusionLevel, get_files, set_exclusions
 from mkdocs.structure.nav import Navigation, get_navigation
-from mkdocs.structure.pages import Page
+from mkdocs.structure.pages import AnchorIndex, Page, RenderCache, TitleIndex
 from mkdocs.utils import DuplicateFilter  # noqa: F401 - legacy re-export
 from mkdocs.utils import templates
+from mkdocs.utils.archive import SiteArchive
+from mkdocs.utils.highlight import HighlightCache
+from mkdocs.utils.manifest import write_output_manifest
+from mkdocs.utils.publish import StagingDirectory
+from mkdocs.utils.sync import FileSync
 
 if TYPE_CHECKING:
     from mkdocs.config.defaults import MkDocsConfig
@@ -109,18 +117,27 @@ def _build_theme_template(
         if template_name == 'sitemap.xml':
             log.debug(f"Gzipping template: {template_name}")
             gz_filename = f'{output_path}.gz'
-            with open(gz_filename, 'wb') as f:
-                timestamp = utils.get_build_timestamp(
-                    pages=[f.page for f in files.documentation_pages() if f.page is not None]
-                )
-                with gzip.GzipFile(
-                    fileobj=f, filename=gz_filename, mode='wb', mtime=timestamp
-                ) as gz_buf:
-                    gz_buf.write(output.encode('utf-8'))
+            buf = io.BytesIO()
+            timestamp = utils.get_build_timestamp(
+                pages=[f.page for f in files.documentation_pages() if f.page is not None]
+            )
+            with gzip.GzipFile(
+                fileobj=buf, filename=gz_filename, mode='wb', mtime=timestamp
+            ) as gz_buf:
+                gz_buf.write(output.encode('utf-8'))
+            utils.write_file(buf.getvalue(), gz_filename)
     else:
         log.info(f"Template skipped: '{template_name}' generated empty output.")
 
 
+def _write_nav_json(nav: Navigation, config: MkDocsConfig) -> str:
+    """Write the navigation to a JSON file named by its hash, and return the file's URL."""
+    content = nav.to_json().encode('utf-8')
+    url = f'nav.{hashlib.sha256(content).hexdigest()[:12]}.json'
+    utils.write_file(content, os.path.join(config.site_dir, url))
+    return url
+
+
 def _build_extra_template(template_name: str, files: Files, config: MkDocsConfig, nav: Navigation):
     """Build user templates which are not part of the theme."""
     log.debug(f"Building extra template: {template_name}")
@@ -130,8 +147,20 @@ def _build_extra_template(template_name: str, files: Files, config: MkDocsConfig
         log.warning(f"Template skipped: '{template_name}' not found in docs_dir.")
         return
 
+    def load_template(name: str) -> tuple[str, str | None, None] | None:
+        # Only the template itself can be loaded, as with `jinja2.Template`.
+        if name != template_name:
+            return None
+        return file.content_string, file.abs_src_path, None
+
+    # The template gets the same environment as `jinja2.Template` would give it, but compiled
+    # templates are reused.
+    env = jinja2.Environment(
+        loader=jinja2.FunctionLoader(load_template),
+        bytecode_cache=templates.BytecodeCache.for_config(config),
+    )
     try:
-        template = jinja2.Template(file.content_string)
+        template = env.get_template(template_name)
     except Exception as e:
         log.warning(f"Error reading template '{template_name}': {e}")
         return
@@ -144,13 +173,22 @@ def _build_extra_template(template_name: str, files: Files, config: MkDocsConfig
         log.info(f"Template skipped: '{template_name}' generated empty output.")
 
 
-def _populate_page(page: Page, config: MkDocsConfig, files: Files, dirty: bool = False) -> None:
+def _populate_page(
+    page: Page,
+    config: MkDocsConfig,
+    files: Files,
+    dirty: bool = False,
+    render_cache: RenderCache | None = None,
+    title_index: TitleIndex | None = None,
+) -> None:
     """Read page content from docs_dir and render Markdown."""
     config._current_page = page
     try:
         # When --dirty is used, only read the page if the file has been modified since the
         # previous build of the output.
         if dirty and not page.file.is_modified():
+            # The title is still needed for the navigation of the pages that are built.
+            page.scan_title(config, title_index)
             return
 
         # Run the `pre_page` plugin event
@@ -164,7 +202,7 @@ def _populate_page(page: Page, config: MkDocsConfig, files: Files, dirty: bool =
             page.markdown, page=page, config=config, files=files
         )
 
-        page.render(config, files)
+        page.render(config, files, cache=render_cache)
         assert page.content is not None
 
         # Run `page_content` plugin events.
@@ -246,8 +284,33 @@ def _build_page(
         config._current_page = None
 
 
-def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = False) -> None:
-    """Perform a full site build."""
+def _get_file_sync(config: MkDocsConfig, previous_dir: str | None = None) -> FileSync:
+    """Return the engine that copies static files into the site_dir."""
+    manifest_path = None
+    if config.cache_dir:
+        manifest_path = os.path.join(config.cache_dir, 'static_files.json')
+    return FileSync(
+        config.site_dir,
+        manifest_path,
+        previous_dir=previous_dir,
+        hardlink=config.static_files.hardlink,
+        checksum=config.static_files.checksum,
+    )
+
+
+def build(
+    config: MkDocsConfig,
+    *,
+    serve_url: str | None = None,
+    dirty: bool = False,
+    archive: str | None = None,
+) -> None:
+    """
+    Perform a full site build.
+
+    If `archive` is given, the output is written into an archive at that path (see `SiteArchive`)
+    instead of the `site_dir`.
+    """
     logger = logging.getLogger('mkdocs')
 
     # Add CountHandler for strict mode
@@ -258,6 +321,21 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
 
     inclusion = InclusionLevel.is_in_serve if serve_url else InclusionLevel.is_included
 
+    # With `atomic_build`, everything is written into a staging directory (plugins see it as
+    # `site_dir` too), which replaces the actual `site_dir` only once the build has succeeded.
+    site_dir = config.site_dir
+    staging = None
+    site_archive = None
+    site_dir_existed = os.path.exists(site_dir)
+    if archive is not None:
+        site_archive = SiteArchive(archive, site_dir)
+        # There is nothing to compare with, so the build is always clean.
+        dirty = False
+    elif config.atomic_build and not dirty and not serve_url:
+        staging = StagingDirectory(site_dir)
+        staging.prepare()
+        config.site_dir = staging.path
+
     try:
         start = time.monotonic()
 
@@ -267,9 +345,15 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
         # Run `pre_build` plugin events.
         config.plugins.on_pre_build(config=config)
 
-        if not dirty:
+        file_sync = _get_file_sync(config, previous_dir=site_dir if staging else None)
+        if site_archive is not None:
+            site_archive.open()
+        elif staging is not None:
+            log.debug(f"Building into the staging directory '{staging.path}'")
+        elif not dirty:
             log.info("Cleaning site directory")
-            utils.clean_directory(config.site_dir)
+            # Static files that are unchanged since the last build are kept, to be skipped.
+            utils.clean_directory(config.site_dir, keep=file_sync.tracked_paths())
         else:  # pragma: no cover
             # Warn user about problems that may occur with --dirty option
             log.warning(
@@ -277,15 +361,17 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
                 " links within your site. This option is designed for site development purposes only."
             )
 
-        if not serve_url:  # pragma: no cover
-            log.info(f"Building documentation to directory: {config.site_dir}")
-            if dirty and site_directory_contains_stale_files(config.site_dir):
+        if site_archive is not None:
+            log.info(f"Building documentation to archive: {site_archive.path}")
+        elif not serve_url:  # pragma: no cover
+            log.info(f"Building documentation to directory: {site_dir}")
+            if dirty and site_directory_contains_stale_files(site_dir):
                 log.info("The directory contains stale files. Use --clean to remove them.")
 
         # First gather all data from all files/pages to ensure all data is consistent across all pages.
 
         files = get_files(config)
-        env = config.theme.get_env()
+        env = config.theme.get_env(templates.BytecodeCache.for_config(config))
         files.add_files_from_theme(env, config)
 
         # Run `files` plugin events.
@@ -299,15 +385,23 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
         nav = config.plugins.on_nav(nav, config=config, files=files)
 
         log.debug("Reading markdown pages.")
+        anchor_index = AnchorIndex.for_config(config)
         excluded = []
-        for file in files.documentation_pages(inclusion=inclusion):
-            log.debug(f"Reading: {file.src_uri}")
-            if file.page is None and file.inclusion.is_not_in_nav():
-                if serve_url and file.inclusion.is_excluded():
-                    excluded.append(urljoin(serve_url, file.url))
-                Page(None, file, config)
-            assert file.page is not None
-            _populate_page(file.page, config, files, dirty)
+        highlight_cache = HighlightCache.for_config(config)
+        render_cache = RenderCache.for_config(config)
+        title_index = TitleIndex.for_config(config) if dirty else None
+        with highlight_cache.activate() if highlight_cache else contextlib.nullcontext():
+            for file in files.documentation_pages(inclusion=inclusion):
+                log.debug(f"Reading: {file.src_uri}")
+                if file.page is None and file.inclusion.is_not_in_nav():
+                    if serve_url and file.inclusion.is_excluded():
+                        excluded.append(urljoin(serve_url, file.url))
+                    Page(None, file, config)
+                assert file.page is not None
+                _populate_page(file.page, config, files, dirty, render_cache, title_index)
+                anchor_index.add_page(file.page)
+        if title_index is not None:
+            title_index.save()
         if excluded:
             log.info(
                 "The following pages are being built only for the preview "
@@ -322,7 +416,14 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
         # with lower precedence get written first so that files with higher precedence can overwrite them.
 
         log.debug("Copying static assets.")
-        files.copy_static_files(dirty=dirty, inclusion=inclusion)
+        stats = files.copy_static_files(
+            dirty=dirty, inclusion=inclusion, sync=file_sync if site_archive is None else None
+        )
+        log.debug(f"Static assets: {stats}.")
+
+        if config.theme.get('client_navigation'):
+            # The theme renders the navigation with JavaScript from one file for the whole site.
+            nav.json_url = _write_nav_json(nav, config)
 
         for template in config.theme.static_templates:
             _build_theme_template(template, env, files, config, nav)
@@ -338,23 +439,42 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
                 file.page, config, doc_files, nav, env, dirty, excluded=file.inclusion.is_excluded()
             )
 
-        log_level = config.validation.links.anchors
-        for file in doc_files:
-            assert file.page is not None
-            file.page.validate_anchor_links(files=files, log_level=log_level)
+        anchor_index.validate(doc_files, log_level=config.validation.links.anchors)
+        anchor_index.save()
 
         # Run `post_build` plugin events.
         config.plugins.on_post_build(config=config)
 
+        if site_archive is not None and not site_dir_existed and os.path.exists(site_dir):
+            log.warning(
+                f"Some files were written directly into '{site_dir}' instead of the archive, "
+                "they are not included in it."
+            )
+
         if counts := warning_counter.get_counts():
             msg = ', '.join(f'{v} {k.lower()}s' for k, v in counts)
             raise Abort(f'Aborted with {msg} in strict mode!')
 
+        if site_archive is not None:
+            site_archive.close()
+        if staging is not None:
+            config.site_dir = site_dir
+            staging.publish()
+        if config.output_manifest and not serve_url:
+            if site_archive is not None:
+                log.warning("The 'output_manifest' is not written when building into an archive.")
+            else:
+                write_output_manifest(site_dir, config.output_manifest)
+
         log.info(f'Documentation built in {time.monotonic() - start:.2f} seconds')
 
     except Exception as e:
         # Run `build_error` plugin events.
         config.plugins.on_build_error(error=e)
+        if staging is not None:
+            staging.discard()
+        if site_archive is not None:
+            site_archive.discard()
         if isinstance(e, BuildError):
             log.error(str(e))
             raise Abort('Aborted with a BuildError!')
@@ -362,6 +482,7 @@ def build(config: MkDocsConfig, *, serve_url: str | None = None, dirty: bool = F
 
     finally:
         logger.removeHandler(warning_counter)
+        config.site_dir = site_dir
 
 
 def site_directory_contains_stale_files(site_directory: str) -> bool:
@@ -11,6 +11,7 @@ from packaging import version
 
 import mkdocs
 from mkdocs.exceptions import Abort
+from mkdocs.utils.git_import import GitImportError, commit_site, push_branch
 
 if TYPE_CHECKING:
     from mkdocs.config.defaults import MkDocsConfig
@@ -97,6 +98,31 @@ def _check_version(branch: str) -> None:
         raise Abort('Deployment Aborted!')
 
 
+def _deploy_incremental(
+    config: MkDocsConfig, message: str, force: bool, no_history: bool, shell: bool
+) -> bool:
+    """Commit only the changed files with `git fast-import` and push them, unless there are none."""
+    try:
+        commit = commit_site(
+            config.site_dir,
+            remote=config.remote_name,
+            branch=config.remote_branch,
+            message=message,
+            no_history=no_history,
+            cache_dir=config.cache_dir,
+            shell=shell,
+        )
+        if commit is None:
+            return False
+        push_branch(
+            config.remote_name, config.remote_branch, force=force or no_history, shell=shell
+        )
+    except GitImportError as e:
+        log.error(f"Failed to deploy to GitHub with error: \n{e}")
+        raise Abort('Deployment Aborted!')
+    return True
+
+
 def gh_deploy(
     config: MkDocsConfig,
     message: str | None = None,
@@ -104,6 +130,7 @@ def gh_deploy(
     no_history=False,
     ignore_version=False,
     shell=False,
+    incremental=False,
 ) -> None:
     if not _is_cwd_git_repo():
         log.error('Cannot deploy - this directory does not appear to be a git repository')
@@ -125,21 +152,26 @@ def gh_deploy(
         config.remote_branch,
     )
 
-    try:
-        ghp_import.ghp_import(
-            config.site_dir,
-            mesg=message,
-            remote=remote_name,
-            branch=remote_branch,
-            push=True,
-            force=force,
-            use_shell=shell,
-            no_history=no_history,
-            nojekyll=True,
-        )
-    except ghp_import.GhpError as e:
-        log.error(f"Failed to deploy to GitHub with error: \n{e.message}")
-        raise Abort('Deployment Aborted!')
+    if incremental:
+        if not _deploy_incremental(config, message, force, no_history, shell):
+            log.info(f"The site is unchanged since the last deployment to '{remote_branch}'.")
+            return
+    else:
+        try:
+            ghp_import.ghp_import(
+                config.site_dir,
+                mesg=message,
+                remote=remote_name,
+                branch=remote_branch,
+                push=True,
+                force=force,
+                use_shell=shell,
+                no_history=no_history,
+                nojekyll=True,
+            )
+        except ghp_import.GhpError as e:
+            log.error(f"Failed to deploy to GitHub with error: \n{e.message}")
+            raise Abort('Deployment Aborted!')
 
     cname_file = os.path.join(config.site_dir, 'CNAME')
     # Does this repository have a CNAME set for GitHub Pages?
@@ -36,6 +36,8 @@ def serve(
     """
     # Create a temporary build directory, and set some options to serve it
     site_dir = tempfile.mkdtemp(prefix='mkdocs_')
+    # Unless configured otherwise, keep the data reused across rebuilds only while serving.
+    cache_dir = tempfile.mkdtemp(prefix='mkdocs_cache_')
 
     def get_config():
         config = load_config(
@@ -43,6 +45,8 @@ def serve(
             site_dir=site_dir,
             **kwargs,
         )
+        if config.cache_dir is None:
+            config.cache_dir = cache_dir
         config.watch.extend(watch)
         return config
 
@@ -106,5 +110,6 @@ def serve(
             server.shutdown()
     finally:
         config.plugins.on_shutdown()
-        if isdir(site_dir):
-            shutil.rmtree(site_dir)
+        for path in (site_dir, cache_dir):
+            if isdir(path):
+                shutil.rmtree(path)
@@ -79,6 +79,24 @@ class MkDocsConfig(base.Config):
     site_dir = c.SiteDir(default='site')
     """The directory where the site will be built to"""
 
+    cache_dir = c.Optional(c.Dir(exists=False))
+    """A directory where data is kept between builds to make rebuilds faster."""
+
+    class StaticFiles(base.Config):
+        hardlink = c.Type(bool, default=False)
+        """Hardlink static files into the site directory instead of copying them, where possible."""
+
+        checksum = c.Type(bool, default=False)
+        """Also skip static files whose modification time changed but whose content didn't."""
+
+    static_files = c.SubConfig(StaticFiles)
+
+    atomic_build = c.Type(bool, default=False)
+    """Build into a staging directory next to `site_dir`, then swap it into its place."""
+
+    output_manifest = c.Optional(c.File(exists=False))
+    """A file to write the list of built files into, with their sizes and hashes."""
+
     copyright = c.Optional(c.Type(str))
     """A copyright notice to add to the footer of documentation."""
 
@@ -134,6 +152,12 @@ class MkDocsConfig(base.Config):
     )
     """PyMarkdown extension names."""
 
+    highlight_cache = c.Type(bool, default=False)
+    """Reuse the code that Markdown extensions highlighted with Pygments before."""
+
+    render_cache = c.Type(bool, default=False)
+    """Reuse the pages converted from the same Markdown before, only resolving their links again."""
+
     mdx_configs = c.Private[Dict[str, dict]]()
     """PyMarkdown extension configs. Populated from `markdown_extensions`."""
 
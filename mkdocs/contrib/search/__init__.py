@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import TYPE_CHECKING, List
+import threading
+from typing import TYPE_CHECKING, Callable, List, Literal
 
 from mkdocs import utils
 from mkdocs.config import base
 from mkdocs.config import config_options as c
-from mkdocs.contrib.search.search_index import SearchIndex
+from mkdocs.contrib.search.query_engine import QueryEngine
+from mkdocs.contrib.search.search_index import NodeIndexWorker, SearchIndex
 from mkdocs.plugins import BasePlugin
 
 if TYPE_CHECKING:
     from mkdocs.config.defaults import MkDocsConfig
+    from mkdocs.livereload import LiveReloadServer
     from mkdocs.structure.pages import Page
     from mkdocs.utils.templates import TemplateContext
 
@@ -62,6 +65,36 @@ class _PluginConfig(base.Config):
 class SearchPlugin(BasePlugin[_PluginConfig]):
     """Add a search feature to MkDocs."""
 
+    _node_worker: NodeIndexWorker | None = None
+    _query_engine: tuple[SearchIndex, QueryEngine] | None = None
+
+    def __init__(self) -> None:
+        self._query_lock = threading.Lock()
+
+    def on_startup(self, *, command: Literal['build', 'gh-deploy', 'serve'], dirty: bool) -> None:
+        """Keep a `node` worker for the pre-built index across the rebuilds of `mkdocs serve`."""
+        if command == 'serve':
+            self._node_worker = NodeIndexWorker()
+
+    def on_shutdown(self) -> None:
+        if self._node_worker is not None:
+            self._node_worker.close()
+
+    def on_serve(
+        self, server: LiveReloadServer, /, *, config: MkDocsConfig, builder: Callable
+    ) -> None:
+        """Provide the `/search?q=` endpoint of the dev server."""
+        server.search_handler = self.search
+
+    def search(self, query: str, limit: int = 10) -> list[dict]:
+        """Query the search index of the latest build, see `QueryEngine.search`."""
+        with self._query_lock:
+            if self._query_engine is None or self._query_engine[0] is not self.search_index:
+                engine = QueryEngine.from_search_index(self.search_index)
+                self._query_engine = (self.search_index, engine)
+            engine = self._query_engine[1]
+        return engine.search(query, limit=limit)
+
     def on_config(self, config: MkDocsConfig, **kwargs) -> MkDocsConfig:
         """Add plugin templates and scripts to config."""
         if config.theme.get('include_search_page'):
@@ -95,7 +128,7 @@ class SearchPlugin(BasePlugin[_PluginConfig]):
     def on_post_build(self, config: MkDocsConfig, **kwargs) -> None:
         """Build search index."""
         output_base_path = os.path.join(config.site_dir, 'search')
-        search_index = self.search_index.generate_search_index()
+        search_index = self.search_index.generate_search_index(worker=self._node_worker)
         json_output_path = os.path.join(output_base_path, 'search_index.json')
         utils.write_file(search_index.encode('utf-8'), json_output_path)
 
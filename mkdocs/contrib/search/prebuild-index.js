@@ -1,22 +1,15 @@
 var lunr = require('./templates/search/lunr'),
+    readline = require('readline'),
     stdin = process.stdin,
     stdout = process.stdout,
     buffer = [];
 
-stdin.resume();
-stdin.setEncoding('utf8');
+function configure(config) {
+  var lang = ['en'];
 
-stdin.on('data', function (data) {
-  buffer.push(data);
-});
-
-stdin.on('end', function () {
-  var data = JSON.parse(buffer.join('')),
-      lang = ['en'];
-
-  if (data.config) {
-    if (data.config.lang && data.config.lang.length) {
-      lang = data.config.lang;
+  if (config) {
+    if (config.lang && config.lang.length) {
+      lang = config.lang;
       if (lang.length > 1 || lang[0] !== "en") {
         require('./lunr-language/lunr.stemmer.support')(lunr);
         if (lang.length > 1) {
@@ -32,12 +25,15 @@ stdin.on('end', function () {
         }
       }
     }
-    if (data.config.separator && data.config.separator.length) {
-      lunr.tokenizer.separator = new RegExp(data.config.separator);
+    if (config.separator && config.separator.length) {
+      lunr.tokenizer.separator = new RegExp(config.separator);
     }
   }
+  return lang;
+}
 
-  var idx = lunr(function () {
+function buildIndex(lang, docs) {
+  return lunr(function () {
     if (lang.length === 1 && lang[0] !== "en" && lunr[lang[0]]) {
       this.use(lunr[lang[0]]);
     } else if (lang.length > 1) {
@@ -47,10 +43,53 @@ stdin.on('end', function () {
     this.field('text');
     this.ref('location');
 
-    data.docs.forEach(function (doc) {
+    docs.forEach(function (doc) {
       this.add(doc);
     }, this);
   });
+}
+
+if (process.argv[2] === '--worker') {
+  // Long-lived mode: one JSON message per line. The first message carries the config, each
+  // following one adds/removes documents by id and lists the ids to build the index from.
+  // Every message is answered with exactly one line: "index <json>" or "error <json>".
+  var lang = null,
+      docs = new Map();
 
-  stdout.write(JSON.stringify(idx));
-});
+  readline.createInterface({input: stdin, terminal: false}).on('line', function (line) {
+    try {
+      var msg = JSON.parse(line);
+      if (lang === null) {
+        lang = configure(msg.config);
+        stdout.write('index null\n');
+        return;
+      }
+      (msg.remove || []).forEach(function (id) {
+        docs.delete(id);
+      });
+      Object.keys(msg.add || {}).forEach(function (id) {
+        docs.set(id, msg.add[id]);
+      });
+      var idx = buildIndex(lang, msg.build.map(function (id) {
+        return docs.get(id);
+      }));
+      stdout.write('index ' + JSON.stringify(idx) + '\n');
+    } catch (e) {
+      stdout.write('error ' + JSON.stringify(String(e)) + '\n');
+    }
+  });
+} else {
+  stdin.resume();
+  stdin.setEncoding('utf8');
+
+  stdin.on('data', function (data) {
+    buffer.push(data);
+  });
+
+  stdin.on('end', function () {
+    var data = JSON.parse(buffer.join(''));
+    var idx = buildIndex(configure(data.config), data.docs);
+
+    stdout.write(JSON.stringify(idx));
+  });
+}
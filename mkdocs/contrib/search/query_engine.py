@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import json
+import math
+import re
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from mkdocs.contrib.search.search_index import SearchIndex
+
+_TRIM_RE = re.compile(r'^\W+|\W+$')
+
+
+class QueryEngine:
+    """
+    An in-process full-text query engine over the entries of a search index.
+
+    It keeps an inverted index of the terms found in the `title` and `text` of each entry and
+    ranks the matches with BM25. Each query term matches the exact term, other terms starting
+    with it, and terms within a small edit distance of it - with decreasing weight.
+
+    The vocabulary is kept as a sorted list, which serves as a flattened prefix trie: all terms
+    sharing a prefix are adjacent, so they can be found by bisection, and fuzzy matching can
+    reuse the edit distance computation for the common prefix of consecutive terms.
+    """
+
+    k1 = 1.2
+    b = 0.75
+    title_boost = 10
+    prefix_weight = 0.5
+    fuzzy_weight = 0.3
+    max_expansions = 50
+    """The maximum number of index terms that one query term can expand to."""
+    champion_size = 1000
+    """How many of the highest scoring entries of each term are kept for queries."""
+
+    def __init__(
+        self,
+        entries: Iterable[dict],
+        *,
+        separator: str = r'[\s\-]+',
+        min_search_length: int = 3,
+    ) -> None:
+        self._separator = re.compile(separator)
+        self.min_search_length = min_search_length
+        self.entries: list[dict] = []
+        frequencies: dict[str, dict[int, int]] = {}
+        lengths = []
+        for i, entry in enumerate(entries):
+            self.entries.append(entry)
+            counts = Counter(self.tokenize(entry.get('text') or ''))
+            for term in self.tokenize(entry.get('title') or ''):
+                counts[term] += self.title_boost
+            for term, count in counts.items():
+                frequencies.setdefault(term, {})[i] = count
+            lengths.append(sum(counts.values()))
+
+        # The BM25 score of each (term, entry) pair doesn't depend on the query, so it is computed
+        # upfront, and only the best scoring entries of each term are kept.
+        avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        norms = [
+            self.k1 * (1 - self.b + self.b * (length / avg_length if avg_length else 0.0))
+            for length in lengths
+        ]
+        self._document_frequency: dict[str, int] = {}
+        self._postings: dict[str, tuple[list[int], list[float]]] = {}
+        for term, tfs in frequencies.items():
+            idf = math.log(1 + (len(lengths) - len(tfs) + 0.5) / (len(tfs) + 0.5))
+            c = idf * (self.k1 + 1)
+            impacts = {i: c * tf / (tf + norms[i]) for i, tf in tfs.items()}
+            ids = list(impacts)
+            if len(ids) > self.champion_size:
+                ids = heapq.nlargest(self.champion_size, ids, key=impacts.__getitem__)
+            self._document_frequency[term] = len(tfs)
+            self._postings[term] = (ids, [impacts[i] for i in ids])
+        self._terms = sorted(self._postings)
+
+    @classmethod
+    def from_search_index(cls, search_index: SearchIndex) -> QueryEngine:
+        """Create a query engine from the entries collected by a `SearchIndex`."""
+        return cls(
+            search_index._entries,
+            separator=search_index.config.get('separator', r'[\s\-]+'),
+            min_search_length=search_index.config.get('min_search_length', 3),
+        )
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> QueryEngine:
+        """Create a query engine from the content of a built `search_index.json`."""
+        index = json.loads(data)
+        config = index.get('config') or {}
+        return cls(
+            index['docs'],
+            separator=config.get('separator', r'[\s\-]+'),
+            min_search_length=config.get('min_search_length', 3),
+        )
+
+    def tokenize(self, text: str) -> list[str]:
+        """Split the text into lowercase terms, the same way as the client-side search does."""
+        tokens = (
+            t if t[0].isalnum() and t[-1].isalnum() else _TRIM_RE.sub('', t)
+            for t in self._separator.split(text.lower())
+            if t
+        )
+        return [t for t in tokens if t]
+
+    def search(self, query: str, *, limit: int = 10) -> list[dict]:
+        """
+        Return up to `limit` entries matching the query, best matches first.
+
+        Each result is a dict with the keys `location`, `title`, `summary` and `score`.
+        """
+        scores: dict[int, float] = {}
+        for word in dict.fromkeys(self.tokenize(query)):
+            word_scores: dict[int, float] = {}
+            for term, weight in self._expand(word).items():
+                ids, impacts = self._postings[term]
+                for i, impact in zip(ids, impacts):
+                    score = weight * impact
+                    if score > word_scores.get(i, 0.0):
+                        word_scores[i] = score
+            for i, score in word_scores.items():
+                scores[i] = scores.get(i, 0.0) + score
+
+        results = []
+        for i, score in heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0])):
+            entry = self.entries[i]
+            results.append(
+                {
+                    'location': entry['location'],
+                    'title': entry['title'],
+                    'summary': entry['text'][:200],
+                    'score': round(score, 4),
+                }
+            )
+        return results
+
+    def _expand(self, word: str) -> dict[str, float]:
+        """Return the index terms that the query term matches, with their weights."""
+        expansions: dict[str, float] = {}
+        if word in self._postings:
+            expansions[word] = 1.0
+        if len(word) < self.min_search_length:
+            return expansions
+
+        prefixed = self._prefix_terms(word)
+        if len(prefixed) > self.max_expansions:
+            prefixed = heapq.nlargest(
+                self.max_expansions, prefixed, key=self._document_frequency.__getitem__
+            )
+        for term in prefixed:
+            expansions.setdefault(term, self.prefix_weight)
+
+        max_edits = 1 if len(word) < 8 else 2
+        for term, distance in self._fuzzy_terms(word, max_edits):
+            expansions.setdefault(term, self.fuzzy_weight / distance)
+            if len(expansions) >= 2 * self.max_expansions:
+                break
+        return expansions
+
+    def _prefix_terms(self, prefix: str) -> list[str]:
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, _prefix_upper_bound(prefix), lo=start)
+        return self._terms[start:end]
+
+    def _fuzzy_terms(self, word: str, max_edits: int) -> Iterator[tuple[str, int]]:
+        """
+        Yield index terms within `max_edits` (Levenshtein distance, at least 1) of the word.
+
+        Like most fuzzy search engines, the first character is assumed to be typed correctly,
+        which keeps the traversal within the terms that start with it.
+        """
+        terms = self._terms
+        i = bisect.bisect_left(terms, word[0])
+        end = bisect.bisect_left(terms, _prefix_upper_bound(word[0]), lo=i)
+        # rows[k] is the edit distance row of `word` against `current[:k]`.
+        rows = [list(range(len(word) + 1))]
+        current = ''
+        while i < end:
+            term = terms[i]
+            common = 0
+            for a, b in zip(current, term):
+                if a != b:
+                    break
+                common += 1
+            del rows[common + 1 :]
+            current = term[:common]
+
+            for ch in term[common:]:
+                prev = rows[-1]
+                row = [prev[0] + 1]
+                for j, wch in enumerate(word, 1):
+                    row.append(min(row[j - 1] + 1, prev[j] + 1, prev[j - 1] + (wch != ch)))
+                rows.append(row)
+                current += ch
+                if min(row) > max_edits:
+                    # No term starting with `current` can match - skip all of them.
+                    i = bisect.bisect_left(terms, _prefix_upper_bound(current), lo=i + 1, hi=end)
+                    break
+            else:
+                if 0 < rows[-1][-1] <= max_edits:
+                    yield term, rows[-1][-1]
+                i += 1
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Return the smallest string that is greater than every string starting with `prefix`."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
@@ -92,12 +92,26 @@ class SearchIndex:
         if toc_item is not None:
             self._add_entry(title=toc_item.title, text=text, loc=abs_url + toc_item.url)
 
-    def generate_search_index(self) -> str:
-        """Python to json conversion."""
+    def generate_search_index(self, *, worker: NodeIndexWorker | None = None) -> str:
+        """
+        Python to json conversion.
+
+        If a `worker` is given, it is used to pre-build the index instead of spawning
+        a new `node` process.
+        """
         page_dicts = {'docs': self._entries, 'config': self.config}
         data = json.dumps(page_dicts, sort_keys=True, separators=(',', ':'), default=str)
 
-        if self.config['prebuild_index'] in (True, 'node'):
+        if worker is not None and self.config['prebuild_index'] in (True, 'node'):
+            try:
+                idx = worker.build(self._entries, self.config)
+                # 'index' sorts last among the keys, so it can be spliced in without re-encoding.
+                data = f'{data[:-1]},"index":{idx}}}'
+                log.debug('Pre-built search index created successfully.')
+            except (OSError, ValueError) as e:
+                worker.close()
+                log.warning(f'Failed to pre-build search index. Error: {e}')
+        elif self.config['prebuild_index'] in (True, 'node'):
             try:
                 script_path = os.path.join(
                     os.path.dirname(os.path.abspath(__file__)), 'prebuild-index.js'
@@ -139,6 +153,84 @@ class SearchIndex:
         return data
 
 
+class NodeIndexWorker:
+    """
+    A long-lived `node` process which pre-builds the search index.
+
+    The process is started on the first call to `build` and kept running for the following
+    calls, as long as the search config doesn't change. It remembers the documents it was
+    sent, so each subsequent build only transfers the documents that were added or removed.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen | None = None
+        self._config_key: str | None = None
+        self._doc_ids: dict[str, str] = {}  # Serialized document -> its id in the worker.
+        self._next_id = 0
+
+    def build(self, entries: list[dict], config: dict) -> str:
+        """Return the serialized Lunr index of the entries. May raise OSError or ValueError."""
+        config_key = json.dumps(config, sort_keys=True, separators=(',', ':'), default=str)
+        if self._proc is None or self._proc.poll() is not None or config_key != self._config_key:
+            self.close()
+            self._start(config_key)
+
+        docs = [json.dumps(entry, sort_keys=True, separators=(',', ':')) for entry in entries]
+        doc_ids: dict[str, str] = {}
+        added = []
+        for doc in docs:
+            if doc in doc_ids:
+                continue
+            id_ = self._doc_ids.get(doc)
+            if id_ is None:
+                id_ = str(self._next_id)
+                self._next_id += 1
+                added.append(f'"{id_}":{doc}')
+            doc_ids[doc] = id_
+        removed = [id_ for doc, id_ in self._doc_ids.items() if doc not in doc_ids]
+        order = [doc_ids[doc] for doc in docs]
+
+        add = ','.join(added)
+        idx = self._request(
+            f'{{"add":{{{add}}},"remove":{json.dumps(removed)},"build":{json.dumps(order)}}}'
+        )
+        self._doc_ids = doc_ids
+        return idx
+
+    def _start(self, config_key: str) -> None:
+        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prebuild-index.js')
+        self._proc = subprocess.Popen(
+            ['node', script_path, '--worker'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            encoding='utf-8',
+        )
+        self._config_key = config_key
+        self._doc_ids = {}
+        self._request(f'{{"config":{config_key}}}')
+
+    def _request(self, message: str) -> str:
+        assert self._proc is not None and self._proc.stdin and self._proc.stdout
+        self._proc.stdin.write(message + '\n')
+        self._proc.stdin.flush()
+        status, _, result = self._proc.stdout.readline().rstrip('\n').partition(' ')
+        if status == 'index':
+            return result
+        if status == 'error':
+            raise ValueError(json.loads(result))
+        raise OSError('The search index worker exited unexpectedly.')
+
+    def close(self) -> None:
+        """Stop the `node` process, if it is running."""
+        proc, self._proc = self._proc, None
+        self._doc_ids = {}
+        if proc is not None:
+            try:
+                proc.communicate(timeout=5)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                proc.kill()
+
+
 class ContentSection:
     """
     Used by the ContentParser class to capture the information we
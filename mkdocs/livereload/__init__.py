@@ -3,6 +3,7 @@ from __future__ import annotations
 import functools
 import io
 import ipaddress
+import json
 import logging
 import mimetypes
 import os
@@ -118,6 +119,8 @@ class LiveReloadServer(socketserver.ThreadingMixIn, wsgiref.simple_server.WSGISe
         self.shutdown_delay = shutdown_delay
         # To allow custom error pages.
         self.error_handler: Callable[[int], bytes | None] = lambda code: None
+        # To allow a search API at `<mount_path>search?q=...`, returning JSON-serializable results.
+        self.search_handler: Callable[[str, int], Any] | None = None
 
         super().__init__((host, port), _Handler, bind_and_activate=False)
         self.set_app(self.serve_request)
@@ -282,6 +285,9 @@ class LiveReloadServer(socketserver.ThreadingMixIn, wsgiref.simple_server.WSGISe
                         self._epoch_cond.wait_for(condition, timeout=self.poll_response_timeout)
                     return [b"%d" % self._visible_epoch]
 
+        if path == self.mount_path + "search" and self.search_handler is not None:
+            return self._serve_search(environ, start_response)
+
         if (path + "/").startswith(self.mount_path):
             rel_file_path = path[len(self.mount_path) :]
 
@@ -324,6 +330,26 @@ class LiveReloadServer(socketserver.ThreadingMixIn, wsgiref.simple_server.WSGISe
         )
         return wsgiref.util.FileWrapper(file)
 
+    def _serve_search(self, environ, start_response) -> Iterable[bytes]:
+        assert self.search_handler is not None
+        params = urllib.parse.parse_qs(environ.get("QUERY_STRING", ""))
+        query = params.get("q", [""])[0]
+        try:
+            limit = int(params.get("limit", ["10"])[0])
+        except ValueError:
+            limit = 10
+
+        # Wait until the ongoing rebuild (if any) finishes, so we're not searching a half-built site.
+        with self._epoch_cond:
+            self._epoch_cond.wait_for(lambda: self._visible_epoch == self._wanted_epoch)
+
+        results = self.search_handler(query, limit)
+        content = json.dumps({"query": query, "results": results}).encode()
+        start_response(
+            "200 OK", [("Content-Type", "application/json"), ("Content-Length", str(len(content)))]
+        )
+        return [content]
+
     def _inject_js_into_html(self, content, epoch):
         try:
             body_end = content.rindex(b"</body>")
@@ -457,6 +457,45 @@ def event_priority(priority: float) -> Callable[[T], T]:
     return decorator
 
 
+# The events whose handlers can receive the HTML as a parsed document, see `parsed_html`.
+_PARSED_HTML_EVENTS = frozenset({'page_content', 'post_page', 'post_template'})
+
+
+def parsed_html(
+    parse: Callable[[str], Any], serialize: Callable[[Any], str] = str
+) -> Callable[[T], T]:
+    """
+    A decorator for a handler of an event that receives HTML, to receive it as a parsed document.
+
+    This applies to `on_page_content`, `on_post_page` and `on_post_template` only (MkDocs warns if
+    it's used on another event, whose handler still gets the plain value). Instead of the HTML
+    string, the handler is passed the result of `parse(html)`, which it can modify in place (and
+    return None) or replace by returning another document (or an HTML string).
+
+    Consecutive handlers of the event that use the same `parse` and `serialize` callables share
+    the same document: MkDocs parses the HTML once before the first of them, and calls
+    `serialize(document)` only once after the last of them. So, to share the parsing with other
+    plugins, pass a class or a module-level function rather than a new lambda or `partial`.
+
+    Usage example:
+
+    ```python
+    import bs4
+
+    @plugins.parsed_html(bs4.BeautifulSoup)
+    def on_page_content(self, soup: bs4.BeautifulSoup, **kwargs):
+        for table in soup.find_all('table'):
+            table['class'] = 'data'
+    ```
+    """
+
+    def decorator(event_method):
+        event_method.mkdocs_parsed_html = (parse, serialize)
+        return event_method
+
+    return decorator
+
+
 class CombinedEvent(Generic[P, T]):
     """
     A descriptor that allows defining multiple event handlers and declaring them under one event's name.
@@ -515,6 +554,15 @@ class PluginCollection(dict, MutableMapping[str, BasePlugin]):
                 self._register_event(event_name, sub, plugin_name=plugin_name)
         else:
             events = self.events[event_name]
+            if (
+                getattr(method, 'mkdocs_parsed_html', None) is not None
+                and event_name not in _PARSED_HTML_EVENTS
+            ):
+                log.warning(
+                    f"The 'parsed_html' decorator has no effect on 'on_{event_name}' "
+                    f"(registered by plugin '{plugin_name or '<unknown>'}'), only on "
+                    "'on_page_content', 'on_post_page' and 'on_post_template'."
+                )
             if event_name == 'page_read_source' and len(events) == 1:
                 plugin1 = self._event_origins.get(next(iter(events)), '<unknown>')
                 plugin2 = plugin_name or '<unknown>'
@@ -558,10 +606,29 @@ class PluginCollection(dict, MutableMapping[str, BasePlugin]):
         be modified by the event method.
         """
         pass_item = item is not None
+        use_codecs = pass_item and name in _PARSED_HTML_EVENTS
+        # The document shared by consecutive `parsed_html` handlers, and its (parse, serialize).
+        document: Any = None
+        document_codec: tuple[Callable, Callable] | None = None
         for method in self.events[name]:
             self._current_plugin = self._event_origins.get(method, '<unknown>')
             if log.getEffectiveLevel() <= logging.DEBUG:
                 log.debug(f"Running `{name}` event from plugin '{self._current_plugin}'")
+            codec = getattr(method, 'mkdocs_parsed_html', None) if use_codecs else None
+            if codec != document_codec and document_codec is not None:
+                item = document_codec[1](document)
+                document = document_codec = None
+            if codec is not None and document_codec is None and isinstance(item, str):
+                document = codec[0](item)
+                document_codec = codec
+            if document_codec is not None:
+                result = method(document, **kwargs)
+                if isinstance(result, str):
+                    item = result
+                    document = document_codec = None
+                elif result is not None:
+                    document = result
+                continue
             if pass_item:
                 result = method(item, **kwargs)
             else:
@@ -569,6 +636,8 @@ class PluginCollection(dict, MutableMapping[str, BasePlugin]):
             # keep item if method returned `None`
             if result is not None:
                 item = result
+        if document_codec is not None:
+            item = document_codec[1](document)
         self._current_plugin = None
         return item
 
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 class StructureItem(metaclass=abc.ABCMeta):
     """An item in MkDocs structure - see concrete subclasses Section, Page or Link."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def __init__(self):
         ...
@@ -5,28 +5,44 @@ import fnmatch
 import logging
 import os
 import posixpath
+import re
 import shutil
+import sys
 import warnings
-from functools import cached_property
+from functools import lru_cache
 from pathlib import PurePath, PurePosixPath
-from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Mapping, Sequence, overload
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    Union,
+    overload,
+)
 from urllib.parse import quote as urlquote
 
+import jinja2
 import pathspec
 import pathspec.gitignore
+import pathspec.patterns
 import pathspec.util
 
 from mkdocs import utils
+from mkdocs.utils.archive import SiteArchive
 
 if TYPE_CHECKING:
-    import jinja2.environment
-
     from mkdocs.config.defaults import MkDocsConfig
-    from mkdocs.structure.pages import Page
+    from mkdocs.structure.pages import Page, _LinkResolver
+    from mkdocs.utils.sync import FileSync, SyncStats
 
 
 log = logging.getLogger(__name__)
 
+ContentFactory = Callable[[], Union[str, bytes, Iterable[str], Iterable[bytes]]]
+"""A callable producing the content of a generated file, either whole or as an iterable of chunks."""
+
 
 class InclusionLevel(enum.Enum):
     EXCLUDED = -3
@@ -64,6 +80,7 @@ class Files:
 
     def __init__(self, files: Iterable[File]) -> None:
         self._src_uris = {f.src_uri: f for f in files}
+        self._link_resolver: _LinkResolver | None = None
 
     def __iter__(self) -> Iterator[File]:
         """Iterate over the files within."""
@@ -75,7 +92,7 @@ class Files:
 
     def __contains__(self, path: str) -> bool:
         """Soft-deprecated, prefer `get_file_from_path(path) is not None`."""
-        return PurePath(path).as_posix() in self._src_uris
+        return utils._as_posix(path) in self._src_uris
 
     @property
     def src_paths(self) -> dict[str, File]:
@@ -92,7 +109,20 @@ class Files:
 
     def get_file_from_path(self, path: str) -> File | None:
         """Return a File instance with File.src_uri equal to path."""
-        return self._src_uris.get(PurePath(path).as_posix())
+        return self._src_uris.get(utils._as_posix(path))
+
+    def extend(self, files: Iterable[File]) -> None:
+        """Add many files to the Files collection at once."""
+        new_files = {file.src_uri: file for file in files}
+        replaced = self._src_uris.keys() & new_files.keys()
+        if replaced:
+            warnings.warn(
+                "To replace an existing file, call `remove` before `extend`.", DeprecationWarning
+            )
+            for src_uri in replaced:
+                del self._src_uris[src_uri]
+        self._src_uris.update(new_files)
+        self._link_resolver = None
 
     def append(self, file: File) -> None:
         """Add file to the Files collection."""
@@ -102,6 +132,7 @@ class Files:
             )
             del self._src_uris[file.src_uri]
         self._src_uris[file.src_uri] = file
+        self._link_resolver = None
 
     def remove(self, file: File) -> None:
         """Remove file from Files collection."""
@@ -109,17 +140,36 @@ class Files:
             del self._src_uris[file.src_uri]
         except KeyError:
             raise ValueError(f'{file.src_uri!r} not in collection')
+        self._link_resolver = None
 
     def copy_static_files(
         self,
         dirty: bool = False,
         *,
         inclusion: Callable[[InclusionLevel], bool] = InclusionLevel.is_included,
-    ) -> None:
-        """Copy static files from source to destination."""
+        sync: FileSync | None = None,
+    ) -> SyncStats | None:
+        """
+        Copy static files from source to destination.
+
+        If a `sync` engine is given, the plain files that are copied from disk as-is are passed to
+        it in one batch, and the statistics of that sync are returned.
+        """
+        batch = []
         for file in self:
             if not file.is_documentation_page() and inclusion(file.inclusion):
-                file.copy_file(dirty)
+                if (
+                    sync is not None
+                    and file._is_plain_copy()
+                    and os.path.abspath(file.dest_dir) == sync.dest_dir
+                ):
+                    assert file.abs_src_path is not None
+                    batch.append((file.abs_src_path, file.dest_uri))
+                else:
+                    file.copy_file(dirty)
+        if sync is None:
+            return None
+        return sync.sync(batch, dirty=dirty)
 
     def documentation_pages(
         self, *, inclusion: Callable[[InclusionLevel], bool] = InclusionLevel.is_included
@@ -145,27 +195,21 @@ class Files:
 
     def add_files_from_theme(self, env: jinja2.Environment, config: MkDocsConfig) -> None:
         """Retrieve static files from Jinja environment and add to collection."""
+        theme_dirs = config.theme.dirs
+        loader = env.loader
+        if (
+            type(loader) is jinja2.FileSystemLoader
+            and not loader.followlinks
+            and loader.searchpath == [os.fspath(d) for d in theme_dirs]
+        ):
+            theme_files = _ThemeFilesIndex.get(theme_dirs, config.theme.static_templates).files
+        else:
+            theme_files = _list_theme_files(env, theme_dirs, config.theme.static_templates)
 
-        def filter(name):
-            # '.*' filters dot files/dirs at root level whereas '*/.*' filters nested levels
-            patterns = ['.*', '*/.*', '*.py', '*.pyc', '*.html', '*readme*', 'mkdocs_theme.yml']
-            # Exclude translation files
-            patterns.append("locales/*")
-            patterns.extend(f'*{x}' for x in utils.markdown_extensions)
-            patterns.extend(config.theme.static_templates)
-            for pattern in patterns:
-                if fnmatch.fnmatch(name.lower(), pattern):
-                    return False
-            return True
-
-        for path in env.list_templates(filter_func=filter):
+        for path, dir in theme_files.items():
             # Theme files do not override docs_dir files
             if self.get_file_from_path(path) is None:
-                for dir in config.theme.dirs:
-                    # Find the first theme dir which contains path
-                    if os.path.isfile(os.path.join(dir, path)):
-                        self.append(File(path, dir, config.site_dir, config.use_directory_urls))
-                        break
+                self.append(File(path, dir, config.site_dir, config.use_directory_urls))
 
     @property
     def _files(self) -> Iterable[File]:
@@ -176,6 +220,113 @@ class Files:
     def _files(self, value: Iterable[File]):
         warnings.warn("Do not access Files._files.", DeprecationWarning)
         self._src_uris = {f.src_uri: f for f in value}
+        self._link_resolver = None
+
+
+def _encode_chunks(chunks: Iterable[str] | Iterable[bytes]) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+# '.*' filters dot files/dirs at root level whereas '*/.*' filters nested levels.
+# 'locales/*' excludes translation files.
+_THEME_EXCLUDE = [
+    '.*',
+    '*/.*',
+    '*.py',
+    '*.pyc',
+    '*.html',
+    '*readme*',
+    'mkdocs_theme.yml',
+    'locales/*',
+    *(f'*{x}' for x in utils.markdown_extensions),
+]
+
+
+@lru_cache(maxsize=None)
+def _theme_exclude_re(static_templates: frozenset[str]) -> re.Pattern:
+    """Compile the patterns of theme files that aren't copied to the site into a single regex."""
+    patterns = [*_THEME_EXCLUDE, *sorted(static_templates)]
+    return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
+
+
+def _is_theme_file_excluded(path: str, static_templates: frozenset[str]) -> bool:
+    return _theme_exclude_re(static_templates).match(os.path.normcase(path.lower())) is not None
+
+
+def _list_theme_files(
+    env: jinja2.Environment, theme_dirs: Sequence[str], static_templates: Iterable[str]
+) -> dict[str, str]:
+    """List the static files through the Jinja loader, with the theme dir providing each of them."""
+    static = frozenset(static_templates)
+    result = {}
+    for path in env.list_templates(filter_func=lambda p: not _is_theme_file_excluded(p, static)):
+        for dir in theme_dirs:
+            # Find the first theme dir which contains path
+            if os.path.isfile(os.path.join(dir, path)):
+                result[path] = dir
+                break
+    return result
+
+
+class _ThemeFilesIndex:
+    """
+    The static files of a theme, mapped to the theme dir providing each of them.
+
+    Indexes are cached, and only rebuilt when the mtime of any directory within the theme dirs
+    changes (i.e. when files are added, removed or renamed).
+    """
+
+    _cache: dict[tuple[tuple[str, ...], frozenset[str]], _ThemeFilesIndex] = {}
+
+    def __init__(self, theme_dirs: Sequence[str], static_templates: frozenset[str]) -> None:
+        self.dir_mtimes: dict[str, int] = {}
+        found: dict[str, str] = {}
+        for theme_dir in theme_dirs:
+            try:
+                self.dir_mtimes[theme_dir] = os.stat(theme_dir).st_mtime_ns
+            except OSError:
+                continue
+            self._scan(theme_dir, theme_dir, '', static_templates, found)
+        self.files = dict(sorted(found.items()))
+
+    def _scan(
+        self,
+        theme_dir: str,
+        path: str,
+        prefix: str,
+        static_templates: frozenset[str],
+        found: dict[str, str],
+    ) -> None:
+        # Like Jinja's loader, this doesn't follow symlinks to directories.
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            name = prefix + entry.name
+            if entry.is_dir(follow_symlinks=False):
+                self.dir_mtimes[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+                self._scan(theme_dir, entry.path, name + '/', static_templates, found)
+            elif name not in found and not _is_theme_file_excluded(name, static_templates):
+                if entry.is_file():
+                    found[name] = theme_dir
+
+    def is_current(self) -> bool:
+        """Whether no directories of the theme changed since the index was built."""
+        try:
+            return all(os.stat(d).st_mtime_ns == m for d, m in self.dir_mtimes.items())
+        except OSError:
+            return False
+
+    @classmethod
+    def get(cls, theme_dirs: Sequence[str], static_templates: Iterable[str]) -> _ThemeFilesIndex:
+        key = (tuple(theme_dirs), frozenset(static_templates))
+        index = cls._cache.get(key)
+        if index is None or not index.is_current():
+            index = cls._cache[key] = cls(*key)
+        return index
 
 
 class File:
@@ -212,6 +363,27 @@ class File:
     additional transformations to the path, based on `use_directory_urls`.
     """
 
+    # A site can have 100k files, so the attributes are kept in slots rather than a `__dict__`
+    # (which is still available for attributes added by plugins), and the absolute paths are
+    # derived when needed instead of being stored.
+    __slots__ = (
+        'src_uri',
+        'use_directory_urls',
+        'src_dir',
+        'dest_dir',
+        'inclusion',
+        'generated_by',
+        '_content',
+        'page',
+        '_name',
+        '_dest_uri',
+        '_url',
+        '_abs_src_path',
+        '_abs_dest_path',
+        '__dict__',
+        '__weakref__',
+    )
+
     src_uri: str
     """The pure path (always '/'-separated) of the source file relative to the source directory."""
 
@@ -232,15 +404,15 @@ class File:
     dest_dir: str
     """The OS path of the destination directory (top-level site_dir) that the file should be copied to."""
 
-    inclusion: InclusionLevel = InclusionLevel.UNDEFINED
+    inclusion: InclusionLevel
     """Whether the file will be excluded from the built site."""
 
-    generated_by: str | None = None
+    generated_by: str | None
     """If not None, indicates that a plugin generated this file on the fly.
 
     The value is the plugin's entrypoint name and can be used to find the plugin by key in the PluginCollection."""
 
-    _content: str | bytes | None = None
+    _content: str | bytes | ContentFactory | None
     """If set, the file's content will be read from here.
 
     This logic is handled by `content_bytes`/`content_string`, which should be used instead of
@@ -264,7 +436,7 @@ class File:
     def dest_path(self, value: str):
         self.dest_uri = PurePath(value).as_posix()
 
-    page: Page | None = None
+    page: Page | None
 
     @overload
     @classmethod
@@ -273,12 +445,15 @@ class File:
         config: MkDocsConfig,
         src_uri: str,
         *,
-        content: str | bytes,
+        content: str | bytes | ContentFactory,
         inclusion: InclusionLevel = InclusionLevel.UNDEFINED,
     ) -> File:
         """
         Create a virtual file backed by in-memory content.
 
+        The content can also be a callable that returns it (possibly as an iterable of chunks). It
+        is then only produced when the content is read or written out, and isn't kept in memory.
+
         It will pretend to be a file in the docs dir at `src_uri`.
         """
 
@@ -304,7 +479,7 @@ class File:
         config: MkDocsConfig,
         src_uri: str,
         *,
-        content: str | bytes | None = None,
+        content: str | bytes | ContentFactory | None = None,
         abs_src_path: str | None = None,
         inclusion: InclusionLevel = InclusionLevel.UNDEFINED,
     ) -> File:
@@ -337,13 +512,16 @@ class File:
         dest_uri: str | None = None,
         inclusion: InclusionLevel = InclusionLevel.UNDEFINED,
     ) -> None:
-        self.src_path = path
-        self.src_dir = src_dir
-        self.dest_dir = dest_dir
+        self.src_uri = utils._as_posix(path)
+        self.src_dir = None if src_dir is None else _intern_dir(src_dir)
+        self.dest_dir = _intern_dir(dest_dir)
         self.use_directory_urls = use_directory_urls
         if dest_uri is not None:
             self.dest_uri = dest_uri
         self.inclusion = inclusion
+        self.generated_by = None
+        self._content = None
+        self.page = None
 
     def __repr__(self):
         return (
@@ -364,11 +542,13 @@ class File:
 
     def _get_stem(self) -> str:
         """Soft-deprecated, do not use."""
-        filename = posixpath.basename(self.src_uri)
-        stem, ext = posixpath.splitext(filename)
+        filename = self.src_uri.rpartition('/')[2]
+        # Like `posixpath.splitext`, leading dots don't start an extension.
+        dot = filename.rfind('.')
+        stem = filename[:dot] if dot > 0 and filename[:dot].lstrip('.') else filename
         return 'index' if stem == 'README' else stem
 
-    name = cached_property(_get_stem)
+    name = utils._slot_property(_get_stem, cache=False)
     """Return the name of the file without its extension."""
 
     def _get_dest_path(self, use_directory_urls: bool | None = None) -> str:
@@ -377,16 +557,17 @@ class File:
             parent, filename = posixpath.split(self.src_uri)
             if use_directory_urls is None:
                 use_directory_urls = self.use_directory_urls
-            if not use_directory_urls or self.name == 'index':
+            name = self.name
+            if not use_directory_urls or name == 'index':
                 # index.md or README.md => index.html
                 # foo.md => foo.html
-                return posixpath.join(parent, self.name + '.html')
+                return posixpath.join(parent, name + '.html')
             else:
                 # foo.md => foo/index.html
-                return posixpath.join(parent, self.name, 'index.html')
+                return posixpath.join(parent, name, 'index.html')
         return self.src_uri
 
-    dest_uri = cached_property(_get_dest_path)
+    dest_uri = utils._slot_property(_get_dest_path)
     """The pure path (always '/'-separated) of the destination file relative to the destination directory."""
 
     def _get_url(self, use_directory_urls: bool | None = None) -> str:
@@ -397,13 +578,14 @@ class File:
             use_directory_urls = self.use_directory_urls
         if use_directory_urls and filename == 'index.html':
             url = (dirname or '.') + '/'
-        return urlquote(url)
+        quoted = urlquote(url)
+        # Most URLs need no quoting, then the same string as `dest_uri` can be kept.
+        return url if quoted == url else quoted
 
-    url = cached_property(_get_url)
+    url = utils._slot_property(_get_url)
     """The URI of the destination file relative to the destination directory as a string."""
 
-    @cached_property
-    def abs_src_path(self) -> str | None:
+    def _get_abs_src_path(self) -> str | None:
         """
         The absolute concrete path of the source file. Will use backslashes on Windows.
 
@@ -413,11 +595,14 @@ class File:
             return None
         return os.path.normpath(os.path.join(self.src_dir, self.src_uri))
 
-    @cached_property
-    def abs_dest_path(self) -> str:
+    abs_src_path = utils._slot_property(_get_abs_src_path, cache=False)
+
+    def _get_abs_dest_path(self) -> str:
         """The absolute concrete path of the destination file. Will use backslashes on Windows."""
         return os.path.normpath(os.path.join(self.dest_dir, self.dest_uri))
 
+    abs_dest_path = utils._slot_property(_get_abs_dest_path, cache=False)
+
     def url_relative_to(self, other: File | str) -> str:
         """Return url for file relative to other file."""
         return utils.get_relative_url(self.url, other.url if isinstance(other, File) else other)
@@ -431,14 +616,16 @@ class File:
 
         If used as a setter, it defines the content of the file, and `abs_src_path` becomes unset.
         """
-        content = self._content
+        content = self._get_content()
         if content is None:
             assert self.abs_src_path is not None
             with open(self.abs_src_path, 'rb') as f:
                 return f.read()
-        if not isinstance(content, bytes):
-            content = content.encode()
-        return content
+        if isinstance(content, str):
+            return content.encode()
+        if isinstance(content, bytes):
+            return content
+        return b''.join(_encode_chunks(content))
 
     @content_bytes.setter
     def content_bytes(self, value: bytes):
@@ -455,14 +642,16 @@ class File:
 
         If used as a setter, it defines the content of the file, and `abs_src_path` becomes unset.
         """
-        content = self._content
+        content = self._get_content()
         if content is None:
             assert self.abs_src_path is not None
             with open(self.abs_src_path, encoding='utf-8-sig', errors='strict') as f:
                 return f.read()
-        if not isinstance(content, str):
-            content = content.decode('utf-8-sig', errors='strict')
-        return content
+        if isinstance(content, str):
+            return content
+        if not isinstance(content, bytes):
+            content = b''.join(_encode_chunks(content))
+        return content.decode('utf-8-sig', errors='strict')
 
     @content_string.setter
     def content_string(self, value: str):
@@ -477,20 +666,55 @@ class File:
             return
         log.debug(f"Copying media file: '{self.src_uri}'")
         output_path = self.abs_dest_path
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        content = self._content
+        content = self._get_content()
         if content is None:
             assert self.abs_src_path is not None
             try:
                 utils.copy_file(self.abs_src_path, output_path)
             except shutil.SameFileError:
                 pass  # Let plugins write directly into site_dir.
-        elif isinstance(content, str):
+            return
+        if SiteArchive.current is not None and self._write_to_archive(content, output_path):
+            return
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if isinstance(content, str):
             with open(output_path, 'w', encoding='utf-8') as output_file:
                 output_file.write(content)
-        else:
+        elif isinstance(content, bytes):
             with open(output_path, 'wb') as output_file:
                 output_file.write(content)
+        else:
+            # Stream the chunks to disk as they are produced.
+            with open(output_path, 'wb') as output_file:
+                for chunk in _encode_chunks(content):
+                    output_file.write(chunk)
+
+    def _write_to_archive(
+        self, content: str | bytes | Iterable[str] | Iterable[bytes], output_path: str
+    ) -> bool:
+        archive = SiteArchive.current
+        assert archive is not None
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        if isinstance(content, bytes):
+            return archive.write_bytes(output_path, content)
+        return archive.write_chunks(output_path, _encode_chunks(content))
+
+    def _get_content(self) -> str | bytes | Iterable[str] | Iterable[bytes] | None:
+        """Return `_content`, calling it first if it is a factory."""
+        content = self._content
+        if callable(content):
+            return content()
+        return content
+
+    def _is_plain_copy(self) -> bool:
+        """Whether copying this file is just copying `abs_src_path` to `abs_dest_path`."""
+        return (
+            self._content is None
+            and self.abs_src_path is not None
+            and type(self).copy_file is File.copy_file
+            and type(self).abs_dest_path is File.abs_dest_path
+        )
 
     def is_modified(self) -> bool:
         if self._content is not None:
@@ -521,41 +745,236 @@ class File:
         return self.src_uri.endswith('.css')
 
 
+def _intern_dir(path: str) -> str:
+    """Let all the files share one string object per directory."""
+    return sys.intern(str(path)) if isinstance(path, str) else path
+
+
 _default_exclude = pathspec.gitignore.GitIgnoreSpec.from_lines(['.*', '/templates/'])
 
 
+class _InclusionMatcher:
+    """
+    Classifies paths into their `InclusionLevel` per the `exclude_docs`, `draft_docs` and `not_in_nav` specs.
+
+    The patterns of all three specs are first checked together in a single pass, so a path that
+    matches none of them (the most common case) is classified without consulting each spec. Whether
+    a directory is excluded as a whole is memoized, and decides the level of all files within it.
+    """
+
+    _last: _InclusionMatcher | None = None
+
+    def __init__(
+        self,
+        exclude_docs: pathspec.PathSpec | None,
+        draft_docs: pathspec.PathSpec | None,
+        not_in_nav: pathspec.PathSpec | None,
+    ) -> None:
+        self.config_specs = (exclude_docs, draft_docs, not_in_nav)
+        self.exclude = _default_exclude + exclude_docs if exclude_docs else _default_exclude
+        self.drafts = draft_docs
+        self.nav_exclude = not_in_nav
+        self._any_pattern: _AnyPatternMatcher | None
+        try:
+            self._any_pattern = _AnyPatternMatcher((self.exclude, draft_docs, not_in_nav))
+        except (ValueError, re.error):
+            self._any_pattern = None
+        self._reincluded = _negated_prefixes(self.exclude)
+        self._excluded_dirs: dict[str, bool] = {}
+
+    @classmethod
+    def for_config(cls, config: MkDocsConfig) -> _InclusionMatcher:
+        """Return the matcher for the config, reusing the last one if the specs are the same."""
+        specs = (config.get('exclude_docs'), config.get('draft_docs'), config.get('not_in_nav'))
+        matcher = cls._last
+        if matcher is None or any(a is not b for a, b in zip(matcher.config_specs, specs)):
+            matcher = cls._last = cls(*specs)
+        return matcher
+
+    def is_excluded_dir(self, dir_uri: str) -> bool:
+        """Whether all files within the directory are excluded, so it doesn't need to be walked."""
+        result = self._excluded_dirs.get(dir_uri)
+        if result is None:
+            parent = posixpath.dirname(dir_uri)
+            if parent and self.is_excluded_dir(parent):
+                result = True
+            else:
+                # Unless a negated pattern could re-include something inside it.
+                prefix = dir_uri + '/'
+                result = (
+                    self._could_match(prefix)
+                    and self.exclude.match_file(prefix)
+                    and all(
+                        p is not None and not (p.startswith(prefix) or prefix.startswith(p))
+                        for p in self._reincluded
+                    )
+                )
+            self._excluded_dirs[dir_uri] = result
+        return result
+
+    def _could_match(self, path: str) -> bool:
+        return self._any_pattern is None or self._any_pattern.match(path)
+
+    def classify(self, src_uri: str) -> InclusionLevel:
+        """Return the inclusion level of a file, the same as matching each spec in turn would."""
+        parent = posixpath.dirname(src_uri)
+        if parent and self.is_excluded_dir(parent):
+            return InclusionLevel.EXCLUDED
+        if not self._could_match(src_uri):
+            return InclusionLevel.INCLUDED
+        if self.exclude.match_file(src_uri):
+            return InclusionLevel.EXCLUDED
+        if self.drafts and self.drafts.match_file(src_uri):
+            return InclusionLevel.DRAFT
+        if self.nav_exclude and self.nav_exclude.match_file(src_uri):
+            return InclusionLevel.NOT_IN_NAV
+        return InclusionLevel.INCLUDED
+
+
+class _AnyPatternMatcher:
+    """
+    Tells whether a path matches any of the patterns of some specs (including negated ones).
+
+    Patterns that match a name at any depth (e.g. `*.py`, `node_modules/`) are combined into one
+    regex for directory names, whose result is memoized per directory, and one for file names. All
+    other patterns are combined into one regex that is matched against the whole path.
+    """
+
+    def __init__(self, specs: Iterable[pathspec.PathSpec | None]) -> None:
+        any_name: list[str] = []
+        file_name: list[str] = []
+        whole_path: list[str] = []
+        for spec in specs:
+            for pattern in spec.patterns if spec else ():
+                if pattern.include is None:
+                    continue
+                regex = getattr(pattern, 'regex', None)
+                if not isinstance(regex, re.Pattern) or not isinstance(regex.pattern, str):
+                    raise ValueError(f"Unsupported pattern: {pattern!r}")
+                if regex.flags & ~re.UNICODE:
+                    raise ValueError(f"Unsupported pattern flags: {pattern!r}")
+                name_glob = _name_glob(pattern)
+                if name_glob is not None:
+                    glob, dir_only = name_glob
+                    any_name.append(glob)
+                    if not dir_only:
+                        file_name.append(glob)
+                else:
+                    # Named groups can't be repeated across alternatives, and aren't needed here.
+                    whole_path.append(re.sub(r'\(\?P<\w+>', '(?:', regex.pattern))
+        self._dir_name = _NameMatcher(any_name)
+        self._file_name = _NameMatcher(file_name)
+        self._whole_path = _compile_alternatives(whole_path)
+        self._dirs: dict[str, bool] = {}
+
+    def match(self, path: str) -> bool:
+        dir_uri, _, name = path.rpartition('/')
+        return bool(
+            (dir_uri and self._match_dir(dir_uri))
+            or self._file_name.match(name)
+            or self._whole_path.match(path)
+        )
+
+    def _match_dir(self, dir_uri: str) -> bool:
+        """Whether any name in this directory path matches a pattern."""
+        result = self._dirs.get(dir_uri)
+        if result is None:
+            parent, _, name = dir_uri.rpartition('/')
+            result = bool((parent and self._match_dir(parent)) or self._dir_name.match(name))
+            self._dirs[dir_uri] = result
+        return result
+
+
+def _name_glob(pattern: pathspec.Pattern) -> tuple[str, bool] | None:
+    """
+    If the gitignore pattern has no '/' (other than a trailing one), so it matches a single name at
+    any depth, return its glob, and whether it matches only a directory. E.g. `*.py` or `build/`.
+
+    Only the plain globs, with no escapes, character classes or `**`, are recognized, from the
+    pattern's original text. The others are matched through their regex.
+    """
+    if not isinstance(pattern, pathspec.patterns.GitWildMatchPattern):
+        return None
+    original = pattern.pattern
+    if not isinstance(original, str) or original != original.strip():
+        return None
+    text = original
+    if not pattern.include:
+        if not text.startswith('!'):
+            return None
+        text = text[1:]
+    dir_only = text.endswith('/')
+    glob = text[:-1] if dir_only else text
+    if not glob or glob.startswith(('#', '!')) or any(c in glob for c in '/\\[') or '**' in glob:
+        return None
+    return glob, dir_only
+
+
+class _NameMatcher:
+    """Matches a single file or directory name against several plain globs (with `*` and `?`)."""
+
+    def __init__(self, globs: Iterable[str]) -> None:
+        exact = set()
+        prefixes = []
+        suffixes = []
+        other = []
+        for glob in globs:
+            # The most common globs are handled without regexes: 'name', 'prefix*' and '*suffix'.
+            if not _has_wildcards(glob):
+                exact.add(glob)
+            elif glob.endswith('*') and not _has_wildcards(glob[:-1]):
+                prefixes.append(glob[:-1])
+            elif glob.startswith('*') and not _has_wildcards(glob[1:]):
+                suffixes.append(glob[1:])
+            else:
+                other.append(_glob_to_regex(glob))
+        self._exact = frozenset(exact)
+        self._prefixes = tuple(prefixes)
+        self._suffixes = tuple(suffixes)
+        self._other = _compile_alternatives(other)
+
+    def match(self, name: str) -> bool:
+        return (
+            name in self._exact
+            or name.startswith(self._prefixes)
+            or name.endswith(self._suffixes)
+            or self._other.fullmatch(name) is not None
+        )
+
+
+def _has_wildcards(glob: str) -> bool:
+    return '*' in glob or '?' in glob
+
+
+def _glob_to_regex(glob: str) -> str:
+    """Translate a plain glob (with only `*` and `?` as special characters) matching one name."""
+    return ''.join('[^/]*' if c == '*' else '[^/]' if c == '?' else re.escape(c) for c in glob)
+
+
+def _compile_alternatives(parts: list[str]) -> re.Pattern:
+    if not parts:
+        return re.compile('(?!)')
+    return re.compile('|'.join(f'(?:{part})' for part in parts))
+
+
 def set_exclusions(files: Iterable[File], config: MkDocsConfig) -> None:
     """Re-calculate which files are excluded, based on the patterns in the config."""
-    exclude: pathspec.gitignore.GitIgnoreSpec | None = config.get('exclude_docs')
-    exclude = _default_exclude + exclude if exclude else _default_exclude
-    drafts: pathspec.gitignore.GitIgnoreSpec | None = config.get('draft_docs')
-    nav_exclude: pathspec.gitignore.GitIgnoreSpec | None = config.get('not_in_nav')
-
+    matcher = _InclusionMatcher.for_config(config)
     for file in files:
         if file.inclusion == InclusionLevel.UNDEFINED:
-            if exclude.match_file(file.src_uri):
-                file.inclusion = InclusionLevel.EXCLUDED
-            elif drafts and drafts.match_file(file.src_uri):
-                file.inclusion = InclusionLevel.DRAFT
-            elif nav_exclude and nav_exclude.match_file(file.src_uri):
-                file.inclusion = InclusionLevel.NOT_IN_NAV
-            else:
-                file.inclusion = InclusionLevel.INCLUDED
+            file.inclusion = matcher.classify(file.src_uri)
 
 
 def get_files(config: MkDocsConfig) -> Files:
     """Walk the `docs_dir` and return a Files collection."""
     files: list[File] = []
     conflicting_files: list[tuple[File, File]] = []
-    for source_dir, dirnames, filenames in os.walk(config['docs_dir'], followlinks=True):
-        relative_dir = os.path.relpath(source_dir, config['docs_dir'])
-        dirnames.sort()
-        filenames.sort(key=_file_sort_key)
-
+    matcher = _InclusionMatcher.for_config(config)
+    for relative_dir, filenames in _walk_docs_dir(config['docs_dir'], matcher):
         files_by_dest: dict[str, File] = {}
         for filename in filenames:
             file = File(
-                os.path.join(relative_dir, filename),
+                posixpath.join(relative_dir, filename),
                 config['docs_dir'],
                 config['site_dir'],
                 config['use_directory_urls'],
@@ -594,12 +1013,94 @@ def file_sort_key(f: File, /):
 
     To sort a list of `File`, pass as the `key` argument to `sort`.
     """
-    parts = PurePosixPath(f.src_uri).parts
+    src_uri = f.src_uri
+    if not src_uri or src_uri[0] == '/' or utils._UNNORMALIZED_PATH_RE.search(src_uri):
+        parts = PurePosixPath(src_uri).parts
+    else:
+        parts = tuple(src_uri.split('/'))
     if not parts:
         return ()
     return (parts[:-1], f.name != "index", parts[-1])
 
 
+def _walk_docs_dir(docs_dir: str, matcher: _InclusionMatcher) -> Iterator[tuple[str, list[str]]]:
+    """
+    Walk the `docs_dir` top-down, following symlinks, like `os.walk` does.
+
+    Yield each directory's path relative to `docs_dir` (with '/' separators, '' for the root) and
+    its sorted file names. Directories that are excluded as a whole aren't entered at all.
+    Symlinks back to a parent directory are skipped.
+    """
+
+    def walk(
+        path: str, dir_uri: str, ancestors: frozenset[tuple[int, int]]
+    ) -> Iterator[tuple[str, list[str]]]:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        filenames = []
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                subdirs.append(entry)
+            else:
+                filenames.append(entry.name)
+        filenames.sort(key=_file_sort_key)
+        yield dir_uri, filenames
+
+        for entry in sorted(subdirs, key=lambda e: e.name):
+            sub_uri = f'{dir_uri}/{entry.name}' if dir_uri else entry.name
+            if matcher.is_excluded_dir(sub_uri):
+                log.debug(f"Skipping excluded directory: '{sub_uri}'")
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in ancestors:
+                log.warning(
+                    f"Skipping the directory '{sub_uri}' in the docs_dir because it is a symlink "
+                    f"to one of its parent directories."
+                )
+                continue
+            yield from walk(entry.path, sub_uri, ancestors | {key})
+
+    try:
+        st = os.stat(docs_dir)
+    except OSError:
+        return
+    yield from walk(docs_dir, '', frozenset({(st.st_dev, st.st_ino)}))
+
+
+def _negated_prefixes(spec: pathspec.PathSpec) -> list[str | None]:
+    """
+    Return the literal path prefix of each negated pattern in the spec.
+
+    `None` stands for a pattern which isn't anchored to a directory, so it could match anywhere.
+    """
+    prefixes: list[str | None] = []
+    for pattern in spec.patterns:
+        if pattern.include is not False:
+            continue
+        text = str(getattr(pattern, 'pattern', '') or '').lstrip('!')
+        if '/' not in text.rstrip('/'):
+            prefixes.append(None)
+            continue
+        for i, ch in enumerate(text):
+            if ch in '*?[\\':
+                text = text[:i]
+                break
+        prefixes.append(text.lstrip('/'))
+    return prefixes
+
+
 def _file_sort_key(f: str):
     """Always sort `index` or `README` as first filename in list. This works only on basenames of files."""
     return (os.path.splitext(f)[0] not in ('index', 'README'), f)
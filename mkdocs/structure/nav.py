@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 from typing import TYPE_CHECKING, Iterator, TypeVar
 from urllib.parse import urlsplit
@@ -35,6 +36,22 @@ class Navigation:
     pages: list[Page]
     """A flat list of all [page][mkdocs.structure.pages.Page] objects contained in the navigation."""
 
+    json_url: str | None = None
+    """The URL of the file the navigation was written to as JSON, relative to the site root, if the
+    theme enables `client_navigation`. Otherwise `None`."""
+
+    def to_json(self) -> str:
+        """
+        Return the navigation as JSON: a list of the top-level items, where a section has a `title`
+        and `children`, a page has a `title` and a `url` relative to the site root, and a link also
+        has `"is_link": true`.
+        """
+        return json.dumps(
+            [_item_to_data(item) for item in self.items],
+            ensure_ascii=False,
+            separators=(',', ':'),
+        )
+
     def __str__(self) -> str:
         return '\n'.join(item._indent_print() for item in self)
 
@@ -127,6 +144,15 @@ class Link(StructureItem):
     """Indicates that the navigation object is a "link" object. Always `True` for link objects."""
 
 
+def _item_to_data(item: StructureItem) -> dict:
+    if isinstance(item, Section):
+        return {'title': item.title, 'children': [_item_to_data(child) for child in item.children]}
+    data = {'title': item.title, 'url': getattr(item, 'url', None)}
+    if isinstance(item, Link):
+        data['is_link'] = True
+    return data
+
+
 def get_navigation(files: Files, config: MkDocsConfig) -> Navigation:
     """Build site navigation from config and files."""
     documentation_pages = files.documentation_pages()
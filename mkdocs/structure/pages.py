@@ -1,10 +1,27 @@
 from __future__ import annotations
 
 import enum
+import functools
+import hashlib
+import json
 import logging
+import os
 import posixpath
+import re
+import sys
 import warnings
-from typing import TYPE_CHECKING, Any, Callable, Iterator, MutableMapping, Sequence
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Container,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+)
 from urllib.parse import unquote as urlunquote
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
@@ -12,27 +29,81 @@ import markdown
 import markdown.extensions.toc
 import markdown.htmlparser  # type: ignore
 import markdown.postprocessors
+import markdown.serializers
 import markdown.treeprocessors
-from markdown.util import AMP_SUBSTITUTE
+from markdown.util import AMP_SUBSTITUTE, STX
 
+import mkdocs
 from mkdocs import utils
 from mkdocs.structure import StructureItem
+from mkdocs.structure.files import File, InclusionLevel, _InclusionMatcher
 from mkdocs.structure.toc import get_toc
-from mkdocs.utils import _removesuffix, get_build_date, get_markdown_title, meta, weak_property
+from mkdocs.utils import (
+    _removesuffix,
+    _slot_property,
+    get_build_date,
+    get_markdown_title,
+    meta,
+    weak_property,
+)
 from mkdocs.utils.rendering import get_heading_text
 
 if TYPE_CHECKING:
     from xml.etree import ElementTree as etree
 
     from mkdocs.config.defaults import MkDocsConfig
-    from mkdocs.structure.files import File, Files
+    from mkdocs.structure.files import Files
     from mkdocs.structure.toc import TableOfContents
 
 
 log = logging.getLogger(__name__)
 
+# The first heading of a page, if it's an ATX or a setext H1, as Python-Markdown matches them.
+_ATX_H1_RE = re.compile(r'#(?!#)(?P<text>.*?)#*\s*$')
+_SETEXT_H1_RE = re.compile(r'=+\s*$')
+
+_TITLE_INDEX_NAME = 'page_titles.json'
+_TITLE_INDEX_VERSION = 1
+_ANCHOR_INDEX_NAME = 'anchors.json'
+_ANCHOR_INDEX_VERSION = 1
+
+_RENDER_CACHE_VERSION = 1
+_RENDER_CACHE_MEMORY_SIZE = 2**10
+
+# Stands for the URL of a link in a rendered page until it's resolved against the current files.
+_LINK_PLACEHOLDER = '\x02mkdocs-link:{}\x03'
+_LINK_PLACEHOLDER_RE = re.compile('\x02mkdocs-link:([0-9]+)\x03')
+
+# Raw HTML without any of these attributes can't add anchors to the page, so it isn't parsed.
+_RAW_HTML_ANCHOR_RE = re.compile(r'\b(?:id|name)\s*=', re.IGNORECASE)
+
 
 class Page(StructureItem):
+    # Like `File`, pages keep their attributes in slots to stay small on large sites. `__dict__`
+    # is still there for the `title` override and for attributes added by plugins.
+    __slots__ = (
+        'file',
+        'parent',
+        'previous_page',
+        'next_page',
+        '__active',
+        'update_date',
+        '_site_url',
+        '_canonical_url',
+        '_abs_url',
+        'edit_url',
+        'markdown',
+        '_title_from_render',
+        '_title_from_scan',
+        'content',
+        'toc',
+        'meta',
+        'present_anchor_ids',
+        'links_to_anchors',
+        '__dict__',
+        '__weakref__',
+    )
+
     def __init__(self, title: str | None, file: File, config: MkDocsConfig) -> None:
         file.page = self
         self.file = file
@@ -40,7 +111,7 @@ class Page(StructureItem):
             self.title = title
 
         # Navigation attributes
-        self.children = None
+        self.parent = None
         self.previous_page = None
         self.next_page = None
         self.active = False
@@ -55,9 +126,12 @@ class Page(StructureItem):
         # Placeholders to be filled in later in the build process.
         self.markdown = None
         self._title_from_render: str | None = None
+        self._title_from_scan: str | None = None
         self.content = None
         self.toc = []  # type: ignore
         self.meta = {}
+        self.present_anchor_ids = None
+        self.links_to_anchors = None
 
     def __eq__(self, other) -> bool:
         return (
@@ -98,17 +172,35 @@ class Page(StructureItem):
     file: File
     """The documentation [`File`][mkdocs.structure.files.File] that the page is being rendered from."""
 
-    abs_url: str | None
-    """The absolute URL of the page from the server root as determined by the value
-    assigned to the [site_url][] configuration setting. The value includes any
-    subdirectory included in the `site_url`, but not the domain. [base_url][] should
-    not be used with this variable."""
+    def _get_abs_url(self) -> str | None:
+        """
+        The absolute URL of the page from the server root as determined by the value
+        assigned to the [site_url][] configuration setting. The value includes any
+        subdirectory included in the `site_url`, but not the domain. [base_url][] should
+        not be used with this variable.
+        """
+        canonical_url = self.canonical_url
+        if canonical_url is None:
+            return None
+        return urlsplit(canonical_url).path
+
+    abs_url = _slot_property(_get_abs_url, cache=False)
 
-    canonical_url: str | None
-    """The full, canonical URL to the current page as determined by the value assigned
-    to the [site_url][] configuration setting. The value includes the domain and any
-    subdirectory included in the `site_url`. [base_url][] should not be used with this
-    variable."""
+    _site_url: str | None
+    """The `site_url` that `canonical_url` and `abs_url` are derived from, ending with a slash."""
+
+    def _get_canonical_url(self) -> str | None:
+        """
+        The full, canonical URL to the current page as determined by the value assigned
+        to the [site_url][] configuration setting. The value includes the domain and any
+        subdirectory included in the `site_url`. [base_url][] should not be used with this
+        variable.
+        """
+        if self._site_url is None:
+            return None
+        return urljoin(self._site_url, self.url)
+
+    canonical_url = _slot_property(_get_canonical_url, cache=False)
 
     @property
     def active(self) -> bool:
@@ -159,14 +251,15 @@ class Page(StructureItem):
     """Indicates that the navigation object is a "link" object. Always `False` for page objects."""
 
     def _set_canonical_url(self, base: str | None) -> None:
+        # The URLs are derived on access, so that all pages can share the one `site_url` string.
         if base:
             if not base.endswith('/'):
                 base += '/'
-            self.canonical_url = canonical_url = urljoin(base, self.url)
-            self.abs_url = urlsplit(canonical_url).path
+            self._site_url = sys.intern(base)
         else:
-            self.canonical_url = None
-            self.abs_url = None
+            self._site_url = None
+        del self.canonical_url
+        del self.abs_url
 
     def _set_edit_url(
         self,
@@ -229,7 +322,8 @@ class Page(StructureItem):
         """
         Returns the title for the current page.
 
-        Before calling `read_source()`, this value is empty. It can also be updated by `render()`.
+        Before calling `read_source()`, this value is empty, unless `scan_title()` was called.
+        It can also be updated by `render()`.
 
         Checks these in order and uses the first that returns a valid title:
 
@@ -239,7 +333,7 @@ class Page(StructureItem):
         - convert filename to title
         """
         if self.markdown is None:
-            return None
+            return self._title_from_scan
 
         if 'title' in self.meta:
             return self.meta['title']
@@ -251,6 +345,9 @@ class Page(StructureItem):
             if title_from_md is not None:
                 return title_from_md
 
+        return self._default_title()
+
+    def _default_title(self) -> str:
         if self.is_homepage:
             return 'Home'
 
@@ -260,41 +357,71 @@ class Page(StructureItem):
             title = title.capitalize()
         return title
 
-    def render(self, config: MkDocsConfig, files: Files) -> None:
-        """Convert the Markdown source file to HTML as per the config."""
-        if self.markdown is None:
-            raise RuntimeError("`markdown` field hasn't been set (via `read_source`)")
+    def scan_title(self, config: MkDocsConfig, index: TitleIndex | None = None) -> str | None:
+        """
+        Find the title of the page without reading all of it or rendering it.
 
-        md = markdown.Markdown(
-            extensions=config['markdown_extensions'],
-            extension_configs=config['mdx_configs'] or {},
-        )
+        Only the meta-data and the first heading of the source are looked at, and the heading's
+        text is taken as is, so any Markdown in it isn't rendered. The result is what `title`
+        returns until `read_source()` is called.
+
+        If an `index` is given, the title is taken from it while the source file is unchanged.
+        """
+        if index is not None and not config.plugins.events['page_read_source']:
+            try:
+                source_title = index[self.file]
+            except KeyError:
+                source_title = index[self.file] = _scan_source_title(self.file.content_string)
+        else:
+            source = config.plugins.on_page_read_source(page=self, config=config)
+            if source is None:
+                source = self.file.content_string
+            source_title = _scan_source_title(source)
+        self._title_from_scan = source_title or self._default_title()
+        return self._title_from_scan
 
-        raw_html_ext = _RawHTMLPreprocessor()
-        raw_html_ext._register(md)
+    def render(self, config: MkDocsConfig, files: Files, cache: RenderCache | None = None) -> None:
+        """
+        Convert the Markdown source file to HTML as per the config.
 
-        extract_anchors_ext = _ExtractAnchorsTreeprocessor(self.file, files, config)
-        extract_anchors_ext._register(md)
+        With a `cache`, a source that was converted before with the same extensions isn't
+        converted again, only its links are resolved against `files`.
+        """
+        if self.markdown is None:
+            raise RuntimeError("`markdown` field hasn't been set (via `read_source`)")
 
         relative_path_ext = _RelativePathTreeprocessor(self.file, files, config)
-        relative_path_ext._register(md)
-
-        extract_title_ext = _ExtractTitleTreeprocessor()
-        extract_title_ext._register(md)
+        rendered = cache.get(self.markdown) if cache is not None else None
+        if rendered is None:
+            md = markdown.Markdown(
+                extensions=config['markdown_extensions'],
+                extension_configs=config['mdx_configs'] or {},
+            )
+            if cache is not None:
+                relative_path_ext.deferred_links = []
+            relative_path_ext._register(md)
+
+            rendered = _RenderedPage(
+                content=md.convert(self.markdown),
+                links=relative_path_ext.deferred_links or [],
+                toc_tokens=getattr(md, 'toc_tokens', []),
+                title=relative_path_ext.title,
+                anchor_ids=sorted(relative_path_ext.present_anchor_ids),
+            )
+            if cache is not None and relative_path_ext.cacheable:
+                cache.set(self.markdown, rendered)
 
-        self.content = md.convert(self.markdown)
-        self.toc = get_toc(getattr(md, 'toc_tokens', []))
-        self._title_from_render = extract_title_ext.title
-        self.present_anchor_ids = (
-            extract_anchors_ext.present_anchor_ids | raw_html_ext.present_anchor_ids
-        )
+        self.content = relative_path_ext.relink(rendered.content, rendered.links)
+        self.toc = get_toc(rendered.toc_tokens)
+        self._title_from_render = rendered.title
+        self.present_anchor_ids = set(rendered.anchor_ids)
         if log.getEffectiveLevel() > logging.DEBUG:
             self.links_to_anchors = relative_path_ext.links_to_anchors
 
-    present_anchor_ids: set[str] | None = None
+    present_anchor_ids: set[str] | None
     """Anchor IDs that this page contains (can be linked to in this page)."""
 
-    links_to_anchors: dict[File, dict[str, str]] | None = None
+    links_to_anchors: dict[File, dict[str, str]] | None
     """Links to anchors in other files that this page contains.
 
     The structure is: `{file_that_is_linked_to: {'anchor': 'original_link/to/some_file.md#anchor'}}`.
@@ -304,61 +431,373 @@ class Page(StructureItem):
     def validate_anchor_links(self, *, files: Files, log_level: int) -> None:
         if not self.links_to_anchors:
             return
-        for to_file, links in self.links_to_anchors.items():
-            for anchor, original_link in links.items():
-                page = to_file.page
-                if page is None:
-                    continue
-                if page.present_anchor_ids is None:  # Page was somehow not rendered.
-                    continue
-                if anchor in page.present_anchor_ids:
-                    continue
-                context = ""
-                if to_file == self.file:
-                    problem = "there is no such anchor on this page"
-                    if anchor.startswith('fnref:'):
-                        context = " This seems to be a footnote that is never referenced."
-                else:
-                    problem = f"the doc '{to_file.src_uri}' does not contain an anchor '#{anchor}'"
-                log.log(
-                    log_level,
-                    f"Doc file '{self.file.src_uri}' contains a link '{original_link}', but {problem}.{context}",
-                )
+        pages = {to_file.src_uri: to_file.page for to_file in self.links_to_anchors}
+        links = {to_file.src_uri: links for to_file, links in self.links_to_anchors.items()}
+
+        def get_anchors(src_uri: str) -> Container[str] | None:
+            page = pages[src_uri]
+            # If the page was somehow not rendered, its anchors aren't known.
+            return page.present_anchor_ids if page is not None else None
+
+        for problem in _anchor_link_problems(self.file.src_uri, links, get_anchors):
+            log.log(log_level, problem)
+
+
+def _anchor_link_problems(
+    src_uri: str,
+    links_to_anchors: Mapping[str, Mapping[str, str]],
+    get_anchors: Callable[[str], Container[str] | None],
+) -> list[str]:
+    """Check the links to anchors of the page at `src_uri`, returning a message for each broken one."""
+    problems = []
+    for to_uri, links in links_to_anchors.items():
+        present_anchor_ids = get_anchors(to_uri)
+        if present_anchor_ids is None:
+            continue
+        for anchor, original_link in links.items():
+            if anchor in present_anchor_ids:
+                continue
+            context = ""
+            if to_uri == src_uri:
+                problem = "there is no such anchor on this page"
+                if anchor.startswith('fnref:'):
+                    context = " This seems to be a footnote that is never referenced."
+            else:
+                problem = f"the doc '{to_uri}' does not contain an anchor '#{anchor}'"
+            problems.append(
+                f"Doc file '{src_uri}' contains a link '{original_link}', but {problem}.{context}"
+            )
+    return problems
 
 
-class _ExtractAnchorsTreeprocessor(markdown.treeprocessors.Treeprocessor):
-    def __init__(self, file: File, files: Files, config: MkDocsConfig) -> None:
-        self.present_anchor_ids: set[str] = set()
+class AnchorIndex:
+    """
+    The anchors that each page contains and its links to anchors, by the `src_uri` of the page.
 
-    def run(self, root: etree.Element) -> None:
-        add = self.present_anchor_ids.add
-        for element in root.iter():
-            if anchor := element.get('id'):
-                add(anchor)
-            if element.tag == 'a':
-                if anchor := element.get('name'):
-                    add(anchor)
+    Pages are added as they are rendered. If a previous build saved the index in `cache_dir`,
+    `validate` checks again only the links of pages that changed or that link to a page whose
+    anchors changed, and reports the problems found the previous time for the other pages.
+    Pages that weren't rendered again (with `--dirty`) keep their entries from the previous build.
+    """
 
-    def _register(self, md: markdown.Markdown) -> None:
-        md.treeprocessors.register(self, "mkdocs_extract_anchors", priority=5)  # Same as 'toc'.
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.pages: dict[str, dict[str, Any]] = {}
+        self._previous: dict[str, dict[str, Any]] = {}
+        if self.path and os.path.isfile(self.path):
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == _ANCHOR_INDEX_VERSION:
+                    self._previous = data['pages']
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                log.debug(f"Not using the previous index of anchors: {e}")
+
+    @classmethod
+    def for_config(cls, config: MkDocsConfig) -> AnchorIndex:
+        cache_dir = config.get('cache_dir')
+        return cls(os.path.join(cache_dir, _ANCHOR_INDEX_NAME) if cache_dir else None)
+
+    def add_page(self, page: Page) -> None:
+        """Record the anchors and the links to anchors of a page that was just rendered."""
+        if page.present_anchor_ids is None:
+            return
+        self.pages[page.file.src_uri] = {
+            'anchors': sorted(page.present_anchor_ids),
+            'links': {
+                to_file.src_uri: dict(links)
+                for to_file, links in (page.links_to_anchors or {}).items()
+            },
+            'problems': None,
+        }
+
+    def validate(self, files: Iterable[File], *, log_level: int) -> None:
+        """Report the broken links to anchors of the pages of `files`, in their order."""
+        files = list(files)
+        for file in files:
+            if file.src_uri not in self.pages and file.src_uri in self._previous:
+                self.pages[file.src_uri] = self._previous[file.src_uri]
+        changed = {
+            src_uri
+            for src_uri in self.pages.keys() | self._previous.keys()
+            if (self.pages.get(src_uri) or {}).get('anchors')
+            != (self._previous.get(src_uri) or {}).get('anchors')
+        }
+        anchor_sets: dict[str, set[str]] = {}
+
+        def get_anchors(src_uri: str) -> Container[str] | None:
+            if src_uri not in self.pages:
+                return None
+            if src_uri not in anchor_sets:
+                anchor_sets[src_uri] = set(self.pages[src_uri]['anchors'])
+            return anchor_sets[src_uri]
+
+        for file in files:
+            entry = self.pages.get(file.src_uri)
+            if entry is None:
+                continue
+            previous = self._previous.get(file.src_uri)
+            if (
+                previous is None
+                or previous.get('problems') is None
+                or previous['links'] != entry['links']
+                or not changed.isdisjoint(entry['links'])
+            ):
+                entry['problems'] = _anchor_link_problems(file.src_uri, entry['links'], get_anchors)
+            else:
+                entry['problems'] = previous['problems']
+            for problem in entry['problems']:
+                log.log(log_level, problem)
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        # Written atomically, so that an interrupted build can't leave a truncated index.
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'version': _ANCHOR_INDEX_VERSION, 'pages': self.pages}))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.debug(f"Could not save the index of anchors: {e}")
+
+
+def _scan_source_title(source: str) -> str | None:
+    """Return the title from the meta-data of a page's source, or else its first H1."""
+    pos, data = meta.split_data(source)
+    if 'title' in data:
+        return str(data['title'])
+    lines: list[str] = []
+    while pos < len(source) and len(lines) < 2:
+        end = source.find('\n', pos)
+        end = len(source) if end == -1 else end
+        line = source[pos:end]
+        pos = end + 1
+        if lines or line.strip():
+            lines.append(line)
+    if lines and (m := _ATX_H1_RE.match(lines[0])):
+        return m.group('text').strip() or None
+    if len(lines) == 2 and _SETEXT_H1_RE.match(lines[1]) and not lines[0].startswith('    '):
+        return lines[0].strip()
+    return None
+
+
+class TitleIndex:
+    """
+    The titles that the sources of pages give them, found by `Page.scan_title`.
+
+    An entry is only used while the size and modification time of the source file stay the same.
+    The index is kept in `cache_dir`, if it's configured, so that the titles of a large site are
+    known without reading its pages again. A dirty build uses it for the pages that it doesn't
+    read, whose titles still appear in the navigation.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, list] = {}
+        if self.path and os.path.isfile(self.path):
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == _TITLE_INDEX_VERSION:
+                    if not isinstance(data['entries'], dict):
+                        raise TypeError(f"Invalid entries: {type(data['entries']).__name__}")
+                    self.entries = data['entries']
+            except (OSError, ValueError, KeyError, AttributeError, TypeError) as e:
+                log.debug(f"Not using the index of page titles: {e}")
+
+    @classmethod
+    def for_config(cls, config: MkDocsConfig) -> TitleIndex:
+        cache_dir = config.get('cache_dir')
+        return cls(os.path.join(cache_dir, _TITLE_INDEX_NAME) if cache_dir else None)
+
+    @staticmethod
+    def _stat(file: File) -> os.stat_result | None:
+        if file.generated_by or file.abs_src_path is None:
+            return None
+        try:
+            return os.stat(file.abs_src_path)
+        except OSError:
+            return None
+
+    def __getitem__(self, file: File) -> str | None:
+        entry = self.entries.get(file.src_uri)
+        if isinstance(entry, list) and len(entry) == 3 and (st := self._stat(file)) is not None:
+            if entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                return entry[2]
+        raise KeyError(file.src_uri)
+
+    def __setitem__(self, file: File, title: str | None) -> None:
+        if (st := self._stat(file)) is not None:
+            self.entries[file.src_uri] = [st.st_size, st.st_mtime_ns, title]
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        # Written atomically, as several builds may share the `cache_dir`.
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'version': _TITLE_INDEX_VERSION, 'entries': self.entries}))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.debug(f"Could not save the index of page titles: {e}")
+
+
+class _RenderedPage(NamedTuple):
+    content: str
+    """The HTML of the page, with placeholders for the `links` if they were deferred."""
+    links: list[str]
+    toc_tokens: list
+    title: str | None
+    anchor_ids: list[str]
+
+
+def _describe_option(value: Any) -> Any:
+    """Return a JSON-serializable description of a Markdown extension option, or raise ValueError."""
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return sorted((str(k), _describe_option(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_describe_option(v) for v in value]
+    if isinstance(value, functools.partial):
+        return [
+            'partial',
+            _describe_option(value.func),
+            _describe_option(value.args),
+            _describe_option(value.keywords),
+        ]
+    module, qualname = getattr(value, '__module__', None), getattr(value, '__qualname__', None)
+    if callable(value) and isinstance(module, str) and isinstance(qualname, str):
+        if '<' not in qualname:
+            return f'{module}.{qualname}'
+    raise ValueError(f"Can't describe {value!r}")
+
+
+class RenderCache:
+    """
+    Pages converted from Markdown to HTML, before their links are resolved.
+
+    A page is kept by its Markdown source and the extensions that converted it, with a
+    placeholder for each link to be resolved. When the same source is rendered again, only its
+    links are resolved against the files of the current build, so adding, removing or renaming a
+    file doesn't require converting all the pages that link to others.
+
+    The pages are kept in memory, which lasts across the builds of `mkdocs serve`, and also as one
+    file each in `cache_dir` if it's configured.
+    """
+
+    _memory: dict[str, str] = {}
+
+    def __init__(self, path: str | None = None, config_key: str = '') -> None:
+        self.path = path
+        self.config_key = config_key
+
+    @classmethod
+    def for_config(cls, config: MkDocsConfig) -> RenderCache | None:
+        if not config.get('render_cache'):
+            return None
+        try:
+            description = _describe_option(
+                [config['markdown_extensions'], config['mdx_configs'] or {}]
+            )
+        except ValueError as e:
+            log.debug(f"Not caching rendered pages, the Markdown extensions aren't comparable: {e}")
+            return None
+        config_key = hashlib.sha256(
+            json.dumps(
+                [_RENDER_CACHE_VERSION, mkdocs.__version__, markdown.__version__, description]
+            ).encode('utf-8')
+        ).hexdigest()
+        cache_dir = config.get('cache_dir')
+        return cls(os.path.join(cache_dir, 'render') if cache_dir else None, config_key)
+
+    def _key(self, source: str) -> str:
+        h = hashlib.sha256(self.config_key.encode('utf-8'))
+        h.update(b'\0')
+        h.update(source.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
+    def get(self, source: str) -> _RenderedPage | None:
+        key = self._key(source)
+        text = self._memory.get(key)
+        if text is None and self.path:
+            try:
+                with open(os.path.join(self.path, key[:2], key), encoding='utf-8') as f:
+                    text = f.read()
+            except (OSError, ValueError):
+                return None
+            self._remember(key, text)
+        if text is None:
+            return None
+        try:
+            return _RenderedPage(*json.loads(text))
+        except (TypeError, ValueError) as e:
+            log.debug(f"Ignoring an invalid rendered page in the cache: {e}")
+            return None
+
+    def set(self, source: str, rendered: _RenderedPage) -> None:
+        key = self._key(source)
+        text = json.dumps(rendered)
+        self._remember(key, text)
+        if not self.path:
+            return
+        path = os.path.join(self.path, key[:2], key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.debug(f"Could not cache the rendered page: {e}")
+
+    @classmethod
+    def _remember(cls, key: str, text: str) -> None:
+        memory = cls._memory
+        if len(memory) >= _RENDER_CACHE_MEMORY_SIZE:
+            del memory[next(iter(memory))]
+        memory[key] = text
 
 
 class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
+    md: markdown.Markdown
+
     def __init__(self, file: File, files: Files, config: MkDocsConfig) -> None:
         self.file = file
         self.files = files
         self.config = config
         self.links_to_anchors: dict[File, dict[str, str]] = {}
+        self.present_anchor_ids: set[str] = set()
+        self._links = _LinkResolver.for_files(files)
+        self.title: str | None = None
+        # If it's a list, links are replaced with placeholders, to be resolved by `relink`.
+        self.deferred_links: list[str] | None = None
+        # Whether the output doesn't depend on the files, so that it can be cached.
+        self.cacheable = True
 
     def run(self, root: etree.Element) -> etree.Element:
         """
         Update urls on anchors and images to make them relative.
 
         Iterates through the full document tree looking for specific
-        tags and then makes them relative based on the site navigation
+        tags and then makes them relative based on the site navigation.
+        The same pass also collects the anchor IDs present in the page,
+        and the title if the page starts with a `h1`.
         """
+        if len(root) and root[0].tag == 'h1':
+            self.title = get_heading_text(root[0], self.md)
+
+        add_anchor = self.present_anchor_ids.add
         for element in root.iter():
+            if anchor := element.get('id'):
+                add_anchor(anchor)
             if element.tag == 'a':
+                if anchor := element.get('name'):
+                    add_anchor(anchor)
                 key = 'href'
             elif element.tag == 'img':
                 key = 'src'
@@ -367,16 +806,51 @@ class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
 
             url = element.get(key)
             assert url is not None
+            if self.deferred_links is not None:
+                if STX not in url:
+                    element.set(key, _LINK_PLACEHOLDER.format(len(self.deferred_links)))
+                    self.deferred_links.append(url)
+                    continue
+                # Markdown replaces its own placeholders in a URL after this, so it's resolved
+                # now. Only an obfuscated email address is left as is whatever the files are.
+                if AMP_SUBSTITUTE not in url or url.startswith(('/', '\\')):
+                    self.cacheable = False
             new_url = self.path_to_url(url)
             element.set(key, new_url)
 
+        self._extract_raw_html_anchors()
         return root
 
+    def relink(self, content: str, links: Sequence[str]) -> str:
+        """Replace the placeholders of deferred `links` in the HTML `content` with their URLs."""
+        if not links:
+            return content
+        escape = markdown.serializers._escape_attrib_html  # type: ignore[attr-defined]
+        urls = [escape(self.path_to_url(url)) for url in links]
+        return _LINK_PLACEHOLDER_RE.sub(lambda m: urls[int(m[1])], content)
+
+    def _extract_raw_html_anchors(self) -> None:
+        """Collect anchor IDs from the raw HTML that the page has, only parsing what can contain them."""
+        html = []
+        for block in self.md.htmlStash.rawHtmlBlocks:
+            if isinstance(block, str):
+                if _RAW_HTML_ANCHOR_RE.search(block):
+                    html.append(block)
+            else:
+                for element in block.iter():
+                    if anchor := element.get('id'):
+                        self.present_anchor_ids.add(anchor)
+                    if element.tag == 'a' and (anchor := element.get('name')):
+                        self.present_anchor_ids.add(anchor)
+        if html:
+            parser = _HTMLHandler()
+            parser.feed('\n'.join(html))
+            parser.close()
+            self.present_anchor_ids |= parser.present_anchor_ids
+
     @classmethod
     def _target_uri(cls, src_path: str, dest_path: str) -> str:
-        return posixpath.normpath(
-            posixpath.join(posixpath.dirname(src_path), dest_path).lstrip('/')
-        )
+        return _join_uri(posixpath.dirname(src_path), dest_path)
 
     @classmethod
     def _possible_target_uris(
@@ -417,6 +891,11 @@ class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
                     tried.add(guess)
 
     def path_to_url(self, url: str) -> str:
+        # The common case of a link to an existing file is resolved only once for all pages in a directory.
+        link = self._links.resolve_link(self.file.src_uri, url)
+        if link is not None:
+            return self._link_to_file(url, *link)
+
         scheme, netloc, path, query, anchor = urlsplit(url)
 
         absolute_link = None
@@ -439,19 +918,17 @@ class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
             return url
 
         path = urlunquote(path)
-        # Determine the filepath of the target.
-        possible_target_uris = self._possible_target_uris(
-            self.file, path, self.config.use_directory_urls
-        )
 
+        # For absolute path (already has a warning), the primary lookup path should be preserved as a tip option.
+        tried_primary = not warning
         if warning:
-            # For absolute path (already has a warning), the primary lookup path should be preserved as a tip option.
             target_uri = url
             target_file = None
         else:
-            # Validate that the target exists in files collection.
-            target_uri = next(possible_target_uris)
-            target_file = self.files.get_file_from_path(target_uri)
+            # Determine the filepath of the target and validate that it exists in files collection.
+            target_uri, target_file = self._links.resolve(self.file.src_uri, path)
+            if target_file is None:
+                target_file = self._file_in_excluded_dir(target_uri)
 
         if target_file is None and not warning:
             # Primary lookup path had no match, definitely produce a warning, just choose which one.
@@ -477,6 +954,11 @@ class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
             # There was no match, so try to guess what other file could've been intended.
             if warning_level > logging.DEBUG:
                 suggest_url = ''
+                possible_target_uris = self._possible_target_uris(
+                    self.file, path, self.config.use_directory_urls
+                )
+                if tried_primary:
+                    next(possible_target_uris)
                 for path in possible_target_uris:
                     if self.files.get_file_from_path(path) is not None:
                         if anchor and path == self.file.src_uri:
@@ -497,7 +979,33 @@ class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
 
         assert target_uri is not None
         assert target_file is not None
+        return self._link_to_file(url, target_uri, target_file, query, anchor)
 
+    def _file_in_excluded_dir(self, target_uri: str) -> File | None:
+        """
+        Return an excluded file for `target_uri` if it's in a directory that is excluded as a whole.
+
+        Such directories aren't walked by `get_files`, so their files aren't in the collection,
+        but a link to one of them is still reported as a link to an excluded file.
+        """
+        parent = posixpath.dirname(target_uri)
+        if not parent or parent.startswith('..'):
+            return None
+        if not _InclusionMatcher.for_config(self.config).is_excluded_dir(parent):
+            return None
+        if not os.path.isfile(os.path.join(self.config.docs_dir, target_uri)):
+            return None
+        return File(
+            target_uri,
+            self.config.docs_dir,
+            self.config.site_dir,
+            self.config.use_directory_urls,
+            inclusion=InclusionLevel.EXCLUDED,
+        )
+
+    def _link_to_file(
+        self, url: str, target_uri: str, target_file: File, query: str, anchor: str
+    ) -> str:
         if anchor:
             # Register that this page links to the target file with an anchor.
             self.links_to_anchors.setdefault(target_file, {}).setdefault(anchor, url)
@@ -516,25 +1024,83 @@ class _RelativePathTreeprocessor(markdown.treeprocessors.Treeprocessor):
         return urlunsplit(('', '', path, query, anchor))
 
     def _register(self, md: markdown.Markdown) -> None:
+        self.md = md
         md.treeprocessors.register(self, "relpath", 0)
 
 
-class _RawHTMLPreprocessor(markdown.preprocessors.Preprocessor):
-    def __init__(self) -> None:
-        super().__init__()
-        self.present_anchor_ids: set[str] = set()
+def _join_uri(src_dir: str, path: str) -> str:
+    """Like `posixpath.normpath(posixpath.join(src_dir, path).lstrip('/'))`, but faster for plain paths."""
+    uri = f'{src_dir}/{path}' if src_dir and not path.startswith('/') else path
+    uri = uri.lstrip('/')
+    if not uri or uri[0] == '.' or uri[-1] == '/' or '//' in uri or '/.' in uri:
+        return posixpath.normpath(uri)
+    return uri
 
-    def run(self, lines: list[str]) -> list[str]:
-        parser = _HTMLHandler()
-        parser.feed('\n'.join(lines))
-        parser.close()
-        self.present_anchor_ids = parser.present_anchor_ids
-        return lines
 
-    def _register(self, md: markdown.Markdown) -> None:
-        md.preprocessors.register(
-            self, "mkdocs_raw_html", priority=21  # Right before 'html_block'.
-        )
+class _Link(NamedTuple):
+    target_uri: str
+    target_file: File
+    query: str
+    anchor: str
+
+
+class _LinkResolver:
+    """
+    Resolves the links between the files of a build, remembering the results.
+
+    It is created once per `Files` collection. A link is resolved only once for all pages in the
+    same directory.
+    """
+
+    def __init__(self, files: Files) -> None:
+        self._files = files
+        self._links: dict[tuple[str, str], _Link | None] = {}
+        self._targets: dict[tuple[str, str], tuple[str, File | None]] = {}
+
+    @classmethod
+    def for_files(cls, files: Files) -> _LinkResolver:
+        """Return the resolver of the collection, which is reset whenever files are added or removed."""
+        resolver = getattr(files, '_link_resolver', None)
+        if resolver is None:
+            resolver = files._link_resolver = cls(files)
+        return resolver
+
+    def resolve_link(self, src_uri: str, url: str) -> _Link | None:
+        """
+        Return the target of a link from the file `src_uri` to an existing file.
+
+        Returns None for any other link - external, absolute, broken and so on, which are
+        left to `_RelativePathTreeprocessor.path_to_url` to handle.
+        """
+        key = (src_uri.rpartition('/')[0], url)
+        try:
+            return self._links[key]
+        except KeyError:
+            pass
+        link = None
+        if not url.startswith(('/', '\\')) and AMP_SUBSTITUTE not in url:
+            scheme, netloc, path, query, anchor = urlsplit(url)
+            if not scheme and not netloc and path:
+                target_uri, target_file = self.resolve(src_uri, urlunquote(path))
+                if target_file is not None:
+                    link = _Link(target_uri, target_file, query, anchor)
+        self._links[key] = link
+        return link
+
+    def resolve(self, src_uri: str, path: str) -> tuple[str, File | None]:
+        """Return the URI that `path` points to from the file `src_uri`, and the file there if any."""
+        key = (src_uri.rpartition('/')[0], path)
+        try:
+            return self._targets[key]
+        except KeyError:
+            pass
+        target_uri = _join_uri(key[0], path)
+        if '\\' in target_uri:
+            target_file = self._files.get_file_from_path(target_uri)
+        else:
+            target_file = self._files.src_uris.get(target_uri)
+        result = self._targets[key] = (target_uri, target_file)
+        return result
 
 
 class _HTMLHandler(markdown.htmlparser.htmlparser.HTMLParser):  # type: ignore[name-defined]
@@ -549,21 +1115,5 @@ class _HTMLHandler(markdown.htmlparser.htmlparser.HTMLParser):  # type: ignore[n
         return super().handle_starttag(tag, attrs)
 
 
-class _ExtractTitleTreeprocessor(markdown.treeprocessors.Treeprocessor):
-    title: str | None = None
-    md: markdown.Markdown
-
-    def run(self, root: etree.Element) -> etree.Element:
-        for el in root:
-            if el.tag == 'h1':
-                self.title = get_heading_text(el, self.md)
-            break
-        return root
-
-    def _register(self, md: markdown.Markdown) -> None:
-        self.md = md
-        md.treeprocessors.register(self, "mkdocs_extract_title", priority=1)  # Close to the end.
-
-
 class _AbsoluteLinksValidationValue(enum.IntEnum):
     RELATIVE_TO_DOCS = -1
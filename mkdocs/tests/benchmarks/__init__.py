@@ -0,0 +1,8 @@
+"""
+# MkDocs micro-benchmarks.
+
+These are not run as part of the test suite. Each module is a script that prints its timings,
+e.g. from the root of the MkDocs git repo:
+
+    python -m mkdocs.tests.benchmarks.search_query --help
+"""
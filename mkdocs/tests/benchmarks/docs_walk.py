@@ -0,0 +1,79 @@
+"""Measure `get_files` on a docs_dir where most entries are in excluded directories."""
+
+from __future__ import annotations
+
+import os
+import statistics
+import tempfile
+import time
+
+import click
+
+from mkdocs.structure.files import File, get_files, set_exclusions
+from mkdocs.tests.base import load_config
+
+
+def make_tree(root: str, sections: int, files_per_dir: int, excluded_ratio: float) -> int:
+    """Create `sections` directories of Markdown files, each with a vendored `node_modules`."""
+    count = 0
+    vendored_dirs = max(1, round(excluded_ratio / (1 - excluded_ratio)))
+    for i in range(sections):
+        section = os.path.join(root, f'section{i}')
+        dirs = [section] + [
+            os.path.join(section, 'node_modules', f'pkg{j}') for j in range(vendored_dirs)
+        ]
+        for d in dirs:
+            os.makedirs(d)
+            for k in range(files_per_dir):
+                open(os.path.join(d, f'file{k}.md' if d == section else f'file{k}.js'), 'w').close()
+                count += 1
+    return count
+
+
+def walk_all(config) -> list[File]:
+    """The previous implementation: list every file, then compute the exclusions."""
+    files = []
+    for source_dir, _, filenames in os.walk(config['docs_dir'], followlinks=True):
+        relative_dir = os.path.relpath(source_dir, config['docs_dir'])
+        for filename in filenames:
+            files.append(
+                File(
+                    os.path.join(relative_dir, filename),
+                    config['docs_dir'],
+                    config['site_dir'],
+                    config['use_directory_urls'],
+                )
+            )
+    set_exclusions(files, config)
+    return files
+
+
+@click.command()
+@click.option('--sections', default=200, show_default=True, help="Number of doc directories.")
+@click.option('--files-per-dir', default=50, show_default=True, help="Files in each directory.")
+@click.option('--excluded', default=0.9, show_default=True, help="Share of excluded entries.")
+@click.option('--repeat', default=5, show_default=True, help="Number of timed runs.")
+def main(sections: int, files_per_dir: int, excluded: float, repeat: int):
+    with tempfile.TemporaryDirectory(prefix='mkdocs_bench_') as tdir:
+        docs_dir = os.path.join(tdir, 'docs')
+        total = make_tree(docs_dir, sections, files_per_dir, excluded)
+        config = load_config(
+            docs_dir=docs_dir, site_dir=os.path.join(tdir, 'site'), exclude_docs='node_modules/'
+        )
+        click.echo(f"Created {total} files")
+
+        for name, func in (('os.walk + set_exclusions', walk_all), ('get_files', get_files)):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                files = func(config)
+                timings.append((time.perf_counter() - start) * 1000)
+            included = sum(1 for f in files if f.inclusion.is_included())
+            click.echo(
+                f"{name:>25}: median {statistics.median(timings):.1f}ms "
+                f"({len(files)} files listed, {included} included)"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measure the memory taken by `File` and `Page` objects of a large site.
+
+Run it on two revisions to compare their representation of files and pages.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+import click
+
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page
+from mkdocs.tests.base import load_config
+
+
+def make_files(count: int, docs_dir: str, site_dir: str, use_directory_urls: bool) -> list[File]:
+    """Create `count` files spread over nested directories, one Markdown page in every four."""
+    files = []
+    for i in range(count):
+        ext = 'md' if i % 4 == 0 else 'png'
+        path = f'section{i % 50}/chapter{i % 1000}/file{i}.{ext}'
+        files.append(File(path, docs_dir, site_dir, use_directory_urls))
+    return files
+
+
+def touch(files: list[File]) -> None:
+    """Access the attributes that a build derives for every file."""
+    for f in files:
+        _ = (f.url, f.dest_uri, f.name, f.abs_src_path, f.abs_dest_path, f.edit_uri)
+
+
+@click.command()
+@click.option('--count', default=100_000, show_default=True, help="Number of files.")
+@click.option('--use-directory-urls/--no-use-directory-urls', default=True, show_default=True)
+def main(count: int, use_directory_urls: bool):
+    with tempfile.TemporaryDirectory(prefix='mkdocs_bench_') as tdir:
+        os.mkdir(os.path.join(tdir, 'docs'))
+        config = load_config(
+            docs_dir=os.path.join(tdir, 'docs'),
+            site_dir=os.path.join(tdir, 'site'),
+            site_url='https://example.org/docs/',
+            repo_url='https://github.com/example/docs',
+            use_directory_urls=use_directory_urls,
+        )
+
+    def build() -> tuple[list[File], list[Page]]:
+        files = make_files(count, config.docs_dir, config.site_dir, use_directory_urls)
+        touch(files)
+        pages = [Page(None, f, config) for f in Files(files).documentation_pages()]
+        return files, pages
+
+    # Time a first run, then measure the memory of a second one (tracing slows it down a lot).
+    start = time.perf_counter()
+    build()
+    duration = time.perf_counter() - start
+    gc.collect()
+
+    tracemalloc.start()
+    files = make_files(count, config.docs_dir, config.site_dir, use_directory_urls)
+    touch(files)
+    files_size = tracemalloc.get_traced_memory()[0]
+    pages = [Page(None, f, config) for f in Files(files).documentation_pages()]
+    pages_size = tracemalloc.get_traced_memory()[0] - files_size
+    tracemalloc.stop()
+
+    click.echo(f"Created {len(files)} files and {len(pages)} pages in {duration * 1000:.0f}ms")
+    click.echo(f"Files: {files_size / 2**20:.1f} MiB ({files_size / len(files):.0f} B each)")
+    click.echo(f"Pages: {pages_size / 2**20:.1f} MiB ({pages_size / len(pages):.0f} B each)")
+
+
+if __name__ == '__main__':
+    main()
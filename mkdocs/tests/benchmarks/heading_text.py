@@ -0,0 +1,85 @@
+"""Measure `get_heading_text` on the headings of API reference pages."""
+
+from __future__ import annotations
+
+import copy
+import random
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+import click
+import markdown
+import markdown.treeprocessors
+
+from mkdocs.utils import rendering
+
+if TYPE_CHECKING:
+    from xml.etree import ElementTree as etree
+
+HEADINGS = [
+    '`{name}(path, *, strict=False)`',
+    'The `{name}` class',
+    '{name}\\_with\\_escapes',
+    '<code>{name}</code> &amp; friends',
+    'Deprecated: [`{name}`](#other){{ #{name}-deprecated }}',
+    '**{name}** returns `list[str]` ![icon](icon.png)',
+    '{name}[^1]',
+]
+
+
+def make_page(headings: int, rnd: random.Random) -> str:
+    """Return an API reference page with `headings` headings and a few lines under each one."""
+    lines = []
+    for i in range(headings):
+        heading = rnd.choice(HEADINGS).format(name=f'func_{i}')
+        lines.append(f'{"#" * rnd.randint(2, 4)} {heading}\n\nDescription of `func_{i}`.\n')
+    lines.append('[^1]: A footnote.\n')
+    return '\n'.join(lines)
+
+
+class _CollectHeadings(markdown.treeprocessors.Treeprocessor):
+    def run(self, root: etree.Element) -> None:
+        self.headings = [el for el in root.iter() if el.tag in ('h2', 'h3', 'h4')]
+
+
+def previous(el: etree.Element, md: markdown.Markdown) -> str:
+    """The previous implementation: render the heading and cut out its tags one by one."""
+    el = copy.deepcopy(el)
+    rendering._remove_anchorlink(el)
+    rendering._remove_fnrefs(el)
+    rendering._extract_alt_texts(el)
+    text = rendering._render_inner_html(el, md)
+    while (start := text.find('<!--')) != -1 and (end := text.find('-->', start)) != -1:
+        text = text[:start] + text[end + 3 :]
+    while (start := text.find('<')) != -1 and (end := text.find('>', start)) != -1:
+        text = text[:start] + text[end + 1 :]
+    return ' '.join(text.split())
+
+
+@click.command()
+@click.option('--headings', default=2000, show_default=True, help="Headings on the page.")
+@click.option('--repeat', default=5, show_default=True, help="Number of timed runs.")
+def main(headings: int, repeat: int):
+    md = markdown.Markdown(
+        extensions=['toc', 'attr_list', 'footnotes'], extension_configs={'toc': {'permalink': True}}
+    )
+    collector = _CollectHeadings(md)
+    md.treeprocessors.register(collector, 'collect_headings', priority=-1)
+    md.convert(make_page(headings, random.Random(0)))
+    els = collector.headings
+    click.echo(f"{len(els)} headings")
+
+    assert [previous(el, md) for el in els] == [rendering.get_heading_text(el, md) for el in els]
+    for name, func in (('previous', previous), ('current', rendering.get_heading_text)):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for el in els:
+                func(el, md)
+            timings.append((time.perf_counter() - start) * 1000)
+        click.echo(f"{name:>10}: median {statistics.median(timings):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
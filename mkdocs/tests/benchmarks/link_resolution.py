@@ -0,0 +1,104 @@
+"""Measure how fast the links of Markdown pages are resolved to relative URLs."""
+
+from __future__ import annotations
+
+import os
+import posixpath
+import random
+import statistics
+import tempfile
+import time
+from urllib.parse import unquote as urlunquote
+from urllib.parse import urlsplit, urlunsplit
+
+import click
+
+from mkdocs import utils
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import _RelativePathTreeprocessor
+from mkdocs.tests.base import load_config
+
+
+def make_files(pages: int, docs_dir: str, site_dir: str, use_directory_urls: bool) -> list[File]:
+    """Create `pages` Markdown files in 20 directories, with an image next to each one."""
+    files = []
+    for i in range(pages):
+        section = f'section{i % 20}'
+        files.append(File(f'{section}/page{i}.md', docs_dir, site_dir, use_directory_urls))
+        files.append(File(f'{section}/img/fig{i}.png', docs_dir, site_dir, use_directory_urls))
+    return files
+
+
+def make_links(page: File, files: list[File], count: int, rnd: random.Random) -> list[str]:
+    """
+    Return relative links from `page`, some of them with an anchor.
+
+    Like on real sites, half of the links point to a few popular files, the rest to any file.
+    """
+    page_dir = posixpath.dirname(page.src_uri)
+    links = []
+    popular = files[:100]
+    for i in range(count):
+        target = rnd.choice(popular if i % 2 else files)
+        link = posixpath.relpath(target.src_uri, page_dir)
+        links.append(link + '#section' if rnd.random() < 0.3 else link)
+    return links
+
+
+def resolve_previous(page: File, files: Files, url: str) -> str:
+    """The steps that resolving a link took before, without the warnings for broken links."""
+    scheme, netloc, path, query, anchor = urlsplit(url)
+    path = urlunquote(path)
+    target_uri = posixpath.normpath(
+        posixpath.join(posixpath.dirname(page.src_uri), path).lstrip('/')
+    )
+    target_file = files.get_file_from_path(target_uri)
+    assert target_file is not None
+    path = utils.get_relative_url(target_file.url, page.url)
+    return urlunsplit(('', '', path, query, anchor))
+
+
+@click.command()
+@click.option('--pages', default=2000, show_default=True, help="Number of pages.")
+@click.option('--links', default=40, show_default=True, help="Links in each page.")
+@click.option('--repeat', default=5, show_default=True, help="Number of timed runs.")
+@click.option('--use-directory-urls/--no-use-directory-urls', default=True, show_default=True)
+def main(pages: int, links: int, repeat: int, use_directory_urls: bool):
+    with tempfile.TemporaryDirectory(prefix='mkdocs_bench_') as tdir:
+        os.mkdir(os.path.join(tdir, 'docs'))
+        config = load_config(
+            docs_dir=os.path.join(tdir, 'docs'),
+            site_dir=os.path.join(tdir, 'site'),
+            use_directory_urls=use_directory_urls,
+        )
+    file_list = make_files(pages, config.docs_dir, config.site_dir, use_directory_urls)
+    rnd = random.Random(0)
+    page_links = [
+        (f, make_links(f, file_list, links, rnd)) for f in file_list if f.is_documentation_page()
+    ]
+    click.echo(f"{len(page_links)} pages with {links} links each")
+
+    def previous() -> list[str]:
+        files = Files(file_list)
+        return [resolve_previous(f, files, url) for f, urls in page_links for url in urls]
+
+    def current() -> list[str]:
+        files = Files(file_list)
+        result: list[str] = []
+        for f, urls in page_links:
+            processor = _RelativePathTreeprocessor(f, files, config)
+            result.extend(processor.path_to_url(url) for url in urls)
+        return result
+
+    assert previous() == current()
+    for name, func in (('previous', previous), ('resolver', current)):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - start) * 1000)
+        click.echo(f"{name:>10}: median {statistics.median(timings):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Measure rendering the pages of a site with a large nav, with and without cached nav fragments."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import statistics
+import time
+from unittest import mock
+
+import click
+
+from mkdocs.commands.build import get_context
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.nav import get_navigation
+from mkdocs.structure.pages import Page
+from mkdocs.tests.base import load_config
+from mkdocs.utils import templates
+
+
+def render_uncached(self, item, site, filename, context, caller):
+    """The previous behavior: the nav is rendered in full for every page."""
+    return caller()
+
+
+@click.command()
+@click.option('--theme', default='mkdocs', show_default=True, help="The theme to render with.")
+@click.option('--sections', default=10, show_default=True, help="Sections in the nav.")
+@click.option('--pages', default=50, show_default=True, help="Pages in each section.")
+@click.option('--repeat', default=3, show_default=True, help="Number of timed runs.")
+def main(theme: str, sections: int, pages: int, repeat: int):
+    # The build date is a part of the pages.
+    os.environ['SOURCE_DATE_EPOCH'] = '0'
+    nav_config = [
+        {f'Section {s}': [{f'Page {p}': f'section{s}/page{p}.md'} for p in range(pages)]}
+        for s in range(sections)
+    ]
+    config = load_config(theme={'name': theme}, nav=[{'Home': 'index.md'}, *nav_config])
+    files = Files(
+        [File('index.md', 'docs', 'site', True)]
+        + [
+            File(f'section{s}/page{p}.md', 'docs', 'site', True)
+            for s in range(sections)
+            for p in range(pages)
+        ]
+    )
+    nav = get_navigation(files, config)
+    doc_files = files.documentation_pages()
+    for file in doc_files:
+        assert isinstance(file.page, Page)
+        file.page.content = '<p>Content</p>'
+    click.echo(f"{len(doc_files)} pages")
+
+    def render_all() -> list[str]:
+        env = config.theme.get_env()
+        template = env.get_template('main.html')
+        output = []
+        for file in doc_files:
+            page = file.page
+            assert page is not None
+            page.active = True
+            output.append(template.render(get_context(nav, doc_files, config, page)))
+            page.active = False
+        return output
+
+    with mock.patch.object(templates.NavFragmentExtension, '_render', render_uncached):
+        expected = render_all()
+    assert render_all() == expected
+    for name, patch in (
+        ('previous', mock.patch.object(templates.NavFragmentExtension, '_render', render_uncached)),
+        ('current', contextlib.nullcontext()),
+    ):
+        timings = []
+        with patch:
+            for _ in range(repeat):
+                start = time.perf_counter()
+                render_all()
+                timings.append((time.perf_counter() - start) * 1000)
+        click.echo(f"{name:>10}: median {statistics.median(timings):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Measure how fast the navigation of a large site gets the titles of its pages."""
+
+from __future__ import annotations
+
+import os
+import statistics
+import tempfile
+import time
+
+import click
+
+from mkdocs.structure.files import get_files
+from mkdocs.structure.nav import get_navigation
+from mkdocs.structure.pages import TitleIndex
+from mkdocs.tests.base import load_config
+
+
+def make_pages(docs_dir: str, pages: int, paragraphs: int) -> None:
+    """Create `pages` Markdown files in 50 directories, half with a title in their meta-data."""
+    body = ''.join(f'Paragraph {i} with *some* [text](#here).\n\n' for i in range(paragraphs))
+    for i in range(pages):
+        section = os.path.join(docs_dir, f'section{i % 50}')
+        os.makedirs(section, exist_ok=True)
+        header = f'---\ntitle: Page {i}\n---\n\n' if i % 2 else f'# Page {i}\n\n'
+        with open(os.path.join(section, f'page{i}.md'), 'w', encoding='utf-8') as f:
+            f.write(header + body)
+
+
+@click.command()
+@click.option('--pages', default=10000, show_default=True, help="Number of pages.")
+@click.option('--paragraphs', default=50, show_default=True, help="Paragraphs in each page.")
+@click.option('--repeat', default=3, show_default=True, help="Number of timed runs.")
+def main(pages: int, paragraphs: int, repeat: int):
+    with tempfile.TemporaryDirectory(prefix='mkdocs_bench_') as tdir:
+        docs_dir = os.path.join(tdir, 'docs')
+        make_pages(docs_dir, pages, paragraphs)
+        config = load_config(
+            docs_dir=docs_dir,
+            site_dir=os.path.join(tdir, 'site'),
+            cache_dir=os.path.join(tdir, 'cache'),
+        )
+        click.echo(f"Created {pages} pages")
+
+        def read_sources() -> list[str | None]:
+            nav = get_navigation(get_files(config), config)
+            for page in nav.pages:
+                page.read_source(config)
+            return [page.title for page in nav.pages]
+
+        def scan(index: TitleIndex | None) -> list[str | None]:
+            nav = get_navigation(get_files(config), config)
+            for page in nav.pages:
+                page.scan_title(config, index)
+            return [page.title for page in nav.pages]
+
+        def scan_cold() -> list[str | None]:
+            return scan(None)
+
+        def scan_warm() -> list[str | None]:
+            index = TitleIndex.for_config(config)
+            titles = scan(index)
+            index.save()
+            return titles
+
+        assert read_sources() == scan_cold() == scan_warm()
+        for name, func in (
+            ('read_source', read_sources),
+            ('scan_title', scan_cold),
+            ('scan_title + index', scan_warm),
+        ):
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                func()
+                timings.append((time.perf_counter() - start) * 1000)
+            click.echo(f"{name:>20}: median {statistics.median(timings):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
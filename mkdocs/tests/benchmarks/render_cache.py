@@ -0,0 +1,74 @@
+"""Measure rendering pages again after a file was added, with and without the render cache."""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+import click
+
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.pages import Page, RenderCache
+from mkdocs.tests.base import load_config
+
+
+def make_page(index: int, pages: int, rnd: random.Random) -> str:
+    """Return a page with a few sections, each linking to other pages."""
+    lines = [f'# Page {index}\n']
+    for section in range(10):
+        links = ', '.join(
+            f'[page {i}](../section{i % 20}/page{i}.md#page-{i})'
+            for i in rnd.sample(range(pages), 5)
+        )
+        lines.append(f'## Section {section}\n\nSome *text* with `code` that links to {links}.\n')
+        lines.append('```\nsome code\n```\n\n| a | b |\n|---|---|\n| 1 | 2 |\n')
+    return '\n'.join(lines)
+
+
+def render_all(
+    pages: list[Page], files: Files, config, cache: RenderCache | None
+) -> list[str | None]:
+    for page in pages:
+        page.render(config, files, cache=cache)
+    return [page.content for page in pages]
+
+
+@click.command()
+@click.option('--pages', default=500, show_default=True, help="Pages on the site.")
+@click.option('--repeat', default=5, show_default=True, help="Number of timed runs.")
+def main(pages: int, repeat: int):
+    config = load_config(render_cache=True, markdown_extensions=['toc', 'tables', 'fenced_code'])
+    rnd = random.Random(0)
+    sources = [make_page(i, pages, rnd) for i in range(pages)]
+
+    def make_build(extra_files: int) -> tuple[list[Page], Files]:
+        page_files = [
+            File(f'section{i % 20}/page{i}.md', 'docs', 'site', True) for i in range(pages)
+        ]
+        files = Files(
+            page_files + [File(f'new{i}.md', 'docs', 'site', True) for i in range(extra_files)]
+        )
+        built = []
+        for file, source in zip(page_files, sources):
+            page = Page(None, file, config)
+            page.markdown = source
+            built.append(page)
+        return built, files
+
+    cache = RenderCache.for_config(config)
+    render_all(*make_build(0), config, cache)
+    # Every run is a build that has one more file than the previous one.
+    for name, run_cache in (('previous', None), ('current', cache)):
+        timings = []
+        for run in range(repeat):
+            built, files = make_build(run + 1)
+            start = time.perf_counter()
+            result = render_all(built, files, config, run_cache)
+            timings.append((time.perf_counter() - start) * 1000)
+        assert result == render_all(*make_build(repeat), config, None)
+        click.echo(f"{name:>10}: median {statistics.median(timings):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
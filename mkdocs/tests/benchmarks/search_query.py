@@ -0,0 +1,66 @@
+"""Measure the latency of `QueryEngine.search` on a large synthetic corpus."""
+
+from __future__ import annotations
+
+import random
+import statistics
+import string
+import time
+
+import click
+
+from mkdocs.contrib.search.query_engine import QueryEngine
+
+
+def make_corpus(sections: int, vocabulary: int, seed: int = 0) -> list[dict]:
+    """Generate search entries with Zipf-distributed words, similar to real documentation."""
+    rnd = random.Random(seed)
+    words = sorted(
+        {
+            ''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 12)))
+            for _ in range(vocabulary)
+        }
+    )
+    weights = [1 / rank for rank in range(1, len(words) + 1)]
+    entries = []
+    for i in range(sections):
+        title = ' '.join(rnd.choices(words, weights, k=rnd.randint(1, 5)))
+        text = ' '.join(rnd.choices(words, weights, k=rnd.randint(20, 200)))
+        entries.append({'title': title, 'text': text, 'location': f'page{i // 10}/#section{i}'})
+    return entries
+
+
+@click.command()
+@click.option('--sections', default=50_000, show_default=True, help="Number of index entries.")
+@click.option('--vocabulary', default=30_000, show_default=True, help="Number of distinct words.")
+@click.option('--queries', default=200, show_default=True, help="Number of queries to run.")
+def main(sections: int, vocabulary: int, queries: int):
+    entries = make_corpus(sections, vocabulary)
+
+    start = time.perf_counter()
+    engine = QueryEngine(entries)
+    click.echo(f"Indexed {sections} sections in {time.perf_counter() - start:.2f}s")
+
+    rnd = random.Random(1)
+    kinds = {
+        'exact': lambda w: w,
+        'prefix': lambda w: w[: max(3, len(w) // 2)],
+        'typo': lambda w: w[:1] + w[2:] if len(w) > 3 else w,
+    }
+    for kind, transform in kinds.items():
+        timings = []
+        for _ in range(queries):
+            words = rnd.choice(entries)['text'].split()
+            query = ' '.join(transform(w) for w in rnd.sample(words, min(2, len(words))))
+            start = time.perf_counter()
+            engine.search(query)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        click.echo(
+            f"{kind:>6} queries: median {statistics.median(timings):.2f}ms, "
+            f"p95 {timings[int(len(timings) * 0.95)]:.2f}ms, max {timings[-1]:.2f}ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
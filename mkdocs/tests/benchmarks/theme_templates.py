@@ -0,0 +1,49 @@
+"""Measure loading the templates of a theme in a new environment, as every rebuild does."""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import click
+import jinja2
+
+from mkdocs.tests.base import load_config
+from mkdocs.utils import templates
+
+
+@click.command()
+@click.option('--theme', default='mkdocs', show_default=True, help="The theme to load.")
+@click.option('--repeat', default=10, show_default=True, help="Number of timed runs.")
+def main(theme: str, repeat: int):
+    config = load_config(theme={'name': theme})
+    names = [
+        name for name in config.theme.get_env().list_templates() if name.endswith(('.html', '.xml'))
+    ]
+    click.echo(f"{len(names)} templates")
+
+    def load_all(bytecode_cache: jinja2.BytecodeCache) -> list[jinja2.Template]:
+        env = config.theme.get_env(bytecode_cache)
+        return [env.get_template(name) for name in names]
+
+    class NoCache(jinja2.BytecodeCache):
+        """The previous behavior: every new environment compiles the templates again."""
+
+        def load_bytecode(self, bucket):
+            pass
+
+        def dump_bytecode(self, bucket):
+            pass
+
+    for name, cache in (('previous', NoCache()), ('current', templates.BytecodeCache())):
+        load_all(cache)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load_all(cache)
+            timings.append((time.perf_counter() - start) * 1000)
+        click.echo(f"{name:>10}: median {statistics.median(timings):.1f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import io
+import json
 import os.path
 import re
+import tarfile
 import textwrap
+import threading
 import unittest
+import zipfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest import mock
@@ -15,12 +20,13 @@ import markdown.preprocessors
 
 from mkdocs.commands import build
 from mkdocs.config import base
-from mkdocs.exceptions import PluginError
+from mkdocs.exceptions import Abort, PluginError
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.nav import get_navigation
-from mkdocs.structure.pages import Page
+from mkdocs.structure.pages import AnchorIndex, Page, _anchor_link_problems
 from mkdocs.tests.base import PathAssertionMixin, load_config, tempdir
 from mkdocs.utils import meta
+from mkdocs.utils.manifest import build_manifest, load_manifest
 
 if TYPE_CHECKING:
     from mkdocs.config.defaults import MkDocsConfig
@@ -239,7 +245,10 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         cfg = load_config(site_dir=site_dir)
         env = cfg.theme.get_env()
         build._build_theme_template('sitemap.xml', env, Files([]), cfg, mock.Mock())
-        mock_write_file.assert_called_once()
+        self.assertEqual(
+            [args[1] for args, kwargs in mock_write_file.call_args_list],
+            [os.path.join(site_dir, 'sitemap.xml'), os.path.join(site_dir, 'sitemap.xml.gz')],
+        )
         mock_build_template.assert_called_once()
         mock_gzip_gzipfile.assert_called_once()
 
@@ -281,6 +290,19 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         files = Files(fs)
         build._build_extra_template('foo.html', files, cfg, mock.Mock())
 
+    @tempdir()
+    @mock.patch(
+        'mkdocs.structure.files.open',
+        mock.mock_open(read_data="a{% include 'other.html' ignore missing %}b"),
+    )
+    def test_extra_template_loads_only_itself(self, site_dir):
+        cfg = load_config(site_dir=site_dir)
+        fs = [File('foo.html', cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)]
+        files = Files(fs)
+        with mock.patch('mkdocs.utils.write_file') as mock_write_file:
+            build._build_extra_template('foo.html', files, cfg, mock.Mock())
+        mock_write_file.assert_called_once_with(b'ab', fs[0].abs_dest_path)
+
     @mock.patch('mkdocs.structure.files.open', mock.mock_open(read_data='template content'))
     def test_skip_missing_extra_template(self):
         cfg = load_config()
@@ -349,6 +371,36 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(page.markdown, None)
         self.assertEqual(page.content, None)
 
+    @tempdir(files={'index.md': 'page content', 'other.md': '# Other page\n\ncontent'})
+    @tempdir()
+    @tempdir()
+    def test_dirty_build_titles(self, cache_dir, site_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, cache_dir=cache_dir)
+        build.build(cfg)
+        self.assertPathNotExists(cache_dir, 'page_titles.json')
+        with open(os.path.join(docs_dir, 'index.md'), 'w') as f:
+            f.write('new content')
+        os.utime(os.path.join(docs_dir, 'index.md'), (2**31, 2**31))
+
+        with self.assertLogs('mkdocs', level='WARNING'), mock.patch.object(
+            Page, 'read_source', autospec=True, side_effect=Page.read_source
+        ) as mock_read:
+            build.build(cfg, dirty=True)
+        self.assertEqual([c.args[0].file.src_uri for c in mock_read.call_args_list], ['index.md'])
+        # The navigation has the title of the page that wasn't read.
+        with open(os.path.join(site_dir, 'index.html')) as f:
+            self.assertIn('Other page', f.read())
+        self.assertPathIsFile(cache_dir, 'page_titles.json')
+
+        # The next dirty build takes the title from the index.
+        with self.assertLogs('mkdocs', level='WARNING'), mock.patch(
+            'mkdocs.structure.pages._scan_source_title'
+        ) as mock_scan:
+            build.build(cfg, dirty=True)
+        mock_scan.assert_not_called()
+        with open(os.path.join(site_dir, 'index.html')) as f:
+            self.assertIn('Other page', f.read())
+
     @tempdir(files={'index.md': 'new page content'})
     @mock.patch('mkdocs.structure.files.open', side_effect=OSError('Error message.'))
     def test_populate_page_read_error(self, docs_dir, mock_open):
@@ -558,6 +610,172 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         self.assertPathNotExists(site_dir, 'main.html')
         self.assertPathNotExists(site_dir, 'locales')
 
+    @tempdir(files={'index.md': 'page content', 'about.md': 'page content'})
+    @tempdir()
+    def test_client_navigation(self, site_dir, docs_dir):
+        for theme in ('mkdocs', 'readthedocs'):
+            with self.subTest(theme=theme):
+                cfg = load_config(
+                    docs_dir=docs_dir,
+                    site_dir=site_dir,
+                    theme={'name': theme, 'client_navigation': True},
+                    nav=[{'Home': 'index.md'}, {'About': 'about.md'}],
+                )
+                build.build(cfg)
+
+                nav_files = [name for name in os.listdir(site_dir) if name.startswith('nav.')]
+                self.assertEqual(len(nav_files), 1)
+                self.assertRegex(nav_files[0], r'^nav\.[0-9a-f]{12}\.json$')
+                with open(os.path.join(site_dir, nav_files[0]), encoding='utf-8') as f:
+                    self.assertEqual(
+                        json.load(f),
+                        [{'title': 'Home', 'url': ''}, {'title': 'About', 'url': 'about/'}],
+                    )
+                # The pages refer to the file instead of containing the navigation.
+                with open(os.path.join(site_dir, 'about', 'index.html'), encoding='utf-8') as f:
+                    output = f.read()
+                self.assertIn(f'data-mkdocs-nav="../{nav_files[0]}"', output)
+                self.assertNotIn('>Home</a>', output)
+
+    @tempdir(files={'index.md': 'page content', 'img/a.png': 'image', 'b.png': 'image'})
+    @tempdir()
+    @tempdir()
+    def test_skip_unchanged_static_files(self, cache_dir, site_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, cache_dir=cache_dir)
+        build.build(cfg)
+        self.assertPathIsFile(cache_dir, 'static_files.json')
+        inode = os.stat(os.path.join(site_dir, 'img', 'a.png')).st_ino
+
+        os.remove(os.path.join(docs_dir, 'b.png'))
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, cache_dir=cache_dir)
+        with self.assertLogs('mkdocs', level='DEBUG') as cm:
+            build.build(cfg)
+        self.assertIn(
+            "DEBUG:mkdocs.utils.sync:Skip copying unmodified file: 'img/a.png'", cm.output
+        )
+        self.assertEqual(os.stat(os.path.join(site_dir, 'img', 'a.png')).st_ino, inode)
+        self.assertPathIsFile(site_dir, 'index.html')
+        self.assertPathNotExists(site_dir, 'b.png')
+
+    @tempdir(files={'index.md': 'page content', 'img/a.png': 'image', 'b.png': 'image'})
+    @tempdir()
+    @tempdir()
+    def test_atomic_build(self, cache_dir, root_dir, docs_dir):
+        site_dir = os.path.join(root_dir, 'site')
+        cfg = load_config(
+            docs_dir=docs_dir, site_dir=site_dir, cache_dir=cache_dir, atomic_build=True
+        )
+        build.build(cfg)
+        self.assertEqual(cfg.site_dir, site_dir)
+        self.assertPathIsFile(site_dir, 'index.html')
+        inode = os.stat(os.path.join(site_dir, 'img', 'a.png')).st_ino
+        site_inode = os.stat(site_dir).st_ino
+
+        os.remove(os.path.join(docs_dir, 'b.png'))
+        cfg = load_config(
+            docs_dir=docs_dir, site_dir=site_dir, cache_dir=cache_dir, atomic_build=True
+        )
+        with self.assertLogs('mkdocs', level='DEBUG') as cm:
+            build.build(cfg)
+        for thread in threading.enumerate():
+            if thread.name == 'mkdocs-remove-old-site':
+                thread.join()
+        self.assertIn(
+            "DEBUG:mkdocs.utils.sync:Skip copying unmodified file: 'img/a.png'", cm.output
+        )
+        self.assertNotIn("INFO:mkdocs.commands.build:Cleaning site directory", cm.output)
+        # A new directory took the place of the site_dir, with the unchanged file linked into it.
+        self.assertNotEqual(os.stat(site_dir).st_ino, site_inode)
+        self.assertEqual(os.stat(os.path.join(site_dir, 'img', 'a.png')).st_ino, inode)
+        self.assertPathIsFile(site_dir, 'index.html')
+        self.assertPathNotExists(site_dir, 'b.png')
+        self.assertEqual(os.listdir(root_dir), ['site'])
+
+    @tempdir(files={'index.md': 'page content'})
+    @tempdir()
+    def test_atomic_build_error(self, root_dir, docs_dir):
+        site_dir = os.path.join(root_dir, 'site')
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, atomic_build=True)
+        build.build(cfg)
+
+        with open(os.path.join(docs_dir, 'index.md'), 'w') as f:
+            f.write('[link](missing.md)')
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, atomic_build=True, strict=True)
+        with self.assertLogs('mkdocs'), self.assertRaises(Abort):
+            build.build(cfg)
+        self.assertEqual(cfg.site_dir, site_dir)
+        with open(os.path.join(site_dir, 'index.html')) as f:
+            self.assertIn('page content', f.read())
+        self.assertEqual(os.listdir(root_dir), ['site'])
+
+    @tempdir(files={'index.md': 'page content', 'img/a.png': 'image'})
+    @tempdir()
+    @mock.patch.dict(os.environ, {'SOURCE_DATE_EPOCH': '1700000000'})
+    def test_build_archive(self, root_dir, docs_dir):
+        site_dir = os.path.join(root_dir, 'site')
+        for name in 'site.tar.gz', 'site.zip':
+            with self.subTest(name):
+                archive = os.path.join(root_dir, name)
+                cfg = load_config(docs_dir=docs_dir, site_dir=site_dir)
+                build.build(cfg, archive=archive)
+                self.assertPathNotExists(site_dir)
+                with open(archive, 'rb') as f:
+                    content = f.read()
+
+                if name.endswith('.zip'):
+                    with zipfile.ZipFile(archive) as zf:
+                        names = zf.namelist()
+                        self.assertEqual(zf.read('img/a.png'), b'image')
+                        dates = {info.date_time for info in zf.infolist()}
+                    self.assertEqual(dates, {(2023, 11, 14, 22, 13, 20)})
+                else:
+                    with tarfile.open(archive) as tf:
+                        names = tf.getnames()
+                        self.assertEqual(tf.extractfile('img/a.png').read(), b'image')
+                        dates = {info.mtime for info in tf.getmembers()}
+                    self.assertEqual(dates, {1700000000})
+                self.assertIn('index.html', names)
+                self.assertIn('sitemap.xml.gz', names)
+                self.assertIn('css/base.css', names)
+
+                # Building the same site again produces the same archive.
+                cfg = load_config(docs_dir=docs_dir, site_dir=site_dir)
+                build.build(cfg, archive=archive)
+                with open(archive, 'rb') as f:
+                    self.assertEqual(f.read(), content)
+
+    @tempdir(files={'index.md': '[link](missing.md)'})
+    @tempdir(files={'site.zip': 'old'})
+    def test_build_archive_error(self, root_dir, docs_dir):
+        archive = os.path.join(root_dir, 'site.zip')
+        cfg = load_config(docs_dir=docs_dir, site_dir=os.path.join(root_dir, 'site'), strict=True)
+        with self.assertLogs('mkdocs'), self.assertRaises(Abort):
+            build.build(cfg, archive=archive)
+        with open(archive) as f:
+            self.assertEqual(f.read(), 'old')
+        self.assertEqual(os.listdir(root_dir), ['site.zip'])
+
+    @tempdir(files={'index.md': 'page content', 'img/a.png': 'image'})
+    @tempdir()
+    def test_build_output_manifest(self, root_dir, docs_dir):
+        site_dir = os.path.join(root_dir, 'site')
+        manifest_path = os.path.join(root_dir, 'manifest.json')
+        cfg = load_config(docs_dir=docs_dir, site_dir=site_dir, output_manifest=manifest_path)
+        build.build(cfg)
+        files = load_manifest(manifest_path)
+        self.assertEqual(
+            files['img/a.png'],
+            {
+                'size': 5,
+                'sha256': hashlib.sha256(b'image').hexdigest(),
+                'content_type': 'image/png',
+                'mtime_ns': os.stat(os.path.join(site_dir, 'img', 'a.png')).st_mtime_ns,
+            },
+        )
+        self.assertEqual(files['index.html']['content_type'], 'text/html')
+        self.assertEqual(files['sitemap.xml.gz']['content_type'], 'application/gzip')
+        self.assertEqual(sorted(files), sorted(build_manifest(site_dir)))
+
     @contextlib.contextmanager
     def _assert_build_logs(self, expected):
         with self.assertLogs('mkdocs') as cm:
@@ -680,6 +898,39 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
 
             self.assertPathNotExists(site_dir, '.zoo.html')
 
+    @tempdir(
+        files={
+            'index.md': '[d](drafts/wip.md), [m](drafts/missing.md)',
+            'drafts/wip.md': 'work in progress',
+        }
+    )
+    @tempdir()
+    def test_link_to_excluded_dir(self, site_dir, docs_dir):
+        cfg = load_config(
+            docs_dir=docs_dir,
+            site_dir=site_dir,
+            use_directory_urls=False,
+            exclude_docs='drafts/',
+            strict=True,
+        )
+        expected_logs = '''
+            INFO:Doc file 'index.md' contains a link to 'drafts/wip.md' which is excluded from the built site.
+            WARNING:Doc file 'index.md' contains a link 'drafts/missing.md', but the target is not found among documentation files.
+        '''
+        with self._assert_build_logs(expected_logs), self.assertRaises(Abort):
+            build.build(cfg)
+
+        with open(os.path.join(docs_dir, 'index.md'), 'w') as f:
+            f.write('[d](drafts/wip.md)')
+        expected_logs = '''
+            INFO:Doc file 'index.md' contains a link to 'drafts/wip.md' which is excluded from the built site.
+        '''
+        with self._assert_build_logs(expected_logs):
+            build.build(cfg)
+        self.assertPathNotExists(site_dir, 'drafts')
+        with open(os.path.join(site_dir, 'index.html')) as f:
+            self.assertIn('<a href="drafts/wip.html">d</a>', f.read())
+
     @tempdir(
         files={
             'foo/README.md': 'page1 content',
@@ -740,6 +991,54 @@ class BuildTests(PathAssertionMixin, unittest.TestCase):
         with self._assert_build_logs(expected_logs):
             build.build(cfg)
 
+    @tempdir(
+        files={
+            'foo.md': '[bar](bar.md#heading2)',
+            'bar.md': '## heading1',
+            'baz.md': '[bar](bar.md)',
+        }
+    )
+    @tempdir()
+    @tempdir()
+    def test_anchor_validation_incremental(self, cache_dir, site_dir, docs_dir):
+        cfg = load_config(
+            docs_dir=docs_dir,
+            site_dir=site_dir,
+            cache_dir=cache_dir,
+            validation={'anchors': 'warn'},
+        )
+        expected_logs = '''
+            WARNING:Doc file 'foo.md' contains a link 'bar.md#heading2', but the doc 'bar.md' does not contain an anchor '#heading2'.
+        '''
+        with self._assert_build_logs(expected_logs):
+            build.build(cfg)
+
+        # Nothing changed, so the problem is reported again without checking any links.
+        with mock.patch(
+            'mkdocs.structure.pages._anchor_link_problems', wraps=_anchor_link_problems
+        ) as mock_check:
+            with self._assert_build_logs(expected_logs):
+                build.build(cfg)
+        mock_check.assert_not_called()
+
+        # Only the page that links to the changed page is checked again.
+        Path(docs_dir, 'bar.md').write_text('## heading2')
+        with mock.patch(
+            'mkdocs.structure.pages._anchor_link_problems', wraps=_anchor_link_problems
+        ) as mock_check:
+            with self._assert_build_logs(''):
+                build.build(cfg)
+        self.assertEqual([c.args[0] for c in mock_check.call_args_list], ['foo.md'])
+
+        # An interrupted save leaves the previous index intact.
+        index = AnchorIndex.for_config(cfg)
+        with mock.patch('json.dumps', side_effect=KeyboardInterrupt):
+            with self.assertRaises(KeyboardInterrupt):
+                index.save()
+        self.assertEqual(
+            AnchorIndex.for_config(cfg)._previous.keys(), {'foo.md', 'bar.md', 'baz.md'}
+        )
+
     @tempdir(
         files={
             'test/foo.md': '[bar](bar.md#heading1)',
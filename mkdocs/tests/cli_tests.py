@@ -8,6 +8,11 @@ from unittest import mock
 from click.testing import CliRunner
 
 from mkdocs import __main__ as cli
+from mkdocs.utils.manifest import ManifestEntry, write_manifest
+
+
+def _entry(sha256):
+    return ManifestEntry(size=1, sha256=sha256, content_type='text/plain', mtime_ns=0)
 
 
 class CLITests(unittest.TestCase):
@@ -231,6 +236,7 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=None,
             site_dir=None,
+            atomic_build=None,
         )
         for log_name in 'mkdocs', 'mkdocs.structure.pages', 'mkdocs.plugins.foo':
             self.assertEqual(logging.getLogger(log_name).getEffectiveLevel(), logging.INFO)
@@ -285,6 +291,7 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=None,
             site_dir=None,
+            atomic_build=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -302,6 +309,7 @@ class CLITests(unittest.TestCase):
             theme='readthedocs',
             use_directory_urls=None,
             site_dir=None,
+            atomic_build=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -319,6 +327,7 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=True,
             site_dir=None,
+            atomic_build=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -336,6 +345,7 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=False,
             site_dir=None,
+            atomic_build=None,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -353,6 +363,43 @@ class CLITests(unittest.TestCase):
             theme=None,
             use_directory_urls=None,
             site_dir='custom',
+            atomic_build=None,
+        )
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_archive(self, mock_build, mock_load_config):
+        result = self.runner.invoke(
+            cli.cli, ['build', '--archive', 'site.tar.gz'], catch_exceptions=False
+        )
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        args, kwargs = mock_build.call_args
+        self.assertEqual(kwargs['archive'], 'site.tar.gz')
+
+        mock_build.reset_mock()
+        result = self.runner.invoke(
+            cli.cli, ['build', '--archive', 'site.rar'], catch_exceptions=False
+        )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("Unsupported archive type 'site.rar'", result.output)
+        self.assertEqual(mock_build.call_count, 0)
+
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    def test_build_atomic(self, mock_build, mock_load_config):
+        result = self.runner.invoke(cli.cli, ['build', '--atomic'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_build.call_count, 1)
+        mock_load_config.assert_called_once_with(
+            config_file=None,
+            strict=None,
+            theme=None,
+            use_directory_urls=None,
+            site_dir=None,
+            atomic_build=True,
         )
 
     @mock.patch('mkdocs.config.load_config', autospec=True)
@@ -375,6 +422,30 @@ class CLITests(unittest.TestCase):
         for log_name in 'mkdocs', 'mkdocs.structure.pages', 'mkdocs.plugins.foo':
             self.assertEqual(logging.getLogger(log_name).getEffectiveLevel(), logging.ERROR)
 
+    def test_diff_manifest(self):
+        with self.runner.isolated_filesystem():
+            write_manifest('old.json', {'a.html': _entry('1'), 'b.css': _entry('2')})
+            write_manifest('new.json', {'a.html': _entry('3'), 'c.js': _entry('4')})
+            result = self.runner.invoke(
+                cli.cli, ['diff-manifest', 'old.json', 'new.json'], catch_exceptions=False
+            )
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(result.stdout, 'A\tc.js\nM\ta.html\nD\tb.css\n')
+
+            result = self.runner.invoke(cli.cli, ['diff-manifest', 'missing.json', 'new.json'])
+            self.assertEqual(result.exit_code, 1)
+            result = self.runner.invoke(
+                cli.cli, ['diff-manifest', '--allow-missing', 'missing.json', 'new.json']
+            )
+            self.assertEqual(result.exit_code, 0)
+            self.assertEqual(result.stdout, 'A\ta.html\nA\tc.js\n')
+
+            with open('bad.json', 'w') as f:
+                f.write('[]')
+            result = self.runner.invoke(cli.cli, ['diff-manifest', 'old.json', 'bad.json'])
+            self.assertEqual(result.exit_code, 1)
+            self.assertIn("'bad.json' is not a valid manifest.", result.output)
+
     @mock.patch('mkdocs.commands.new.new', autospec=True)
     def test_new(self, mock_new):
         result = self.runner.invoke(cli.cli, ["new", "project"], catch_exceptions=False)
@@ -397,6 +468,7 @@ class CLITests(unittest.TestCase):
         self.assertEqual(g_kwargs['force'], False)
         self.assertTrue('ignore_version' in g_kwargs)
         self.assertEqual(g_kwargs['ignore_version'], False)
+        self.assertEqual(g_kwargs['incremental'], False)
         self.assertEqual(mock_build.call_count, 1)
         b_args, b_kwargs = mock_build.call_args
         self.assertTrue('dirty' in b_kwargs)
@@ -542,6 +614,17 @@ class CLITests(unittest.TestCase):
         self.assertEqual(mock_build.call_count, 1)
         self.assertEqual(mock_load_config.call_count, 1)
 
+    @mock.patch('mkdocs.config.load_config', autospec=True)
+    @mock.patch('mkdocs.commands.build.build', autospec=True)
+    @mock.patch('mkdocs.commands.gh_deploy.gh_deploy', autospec=True)
+    def test_gh_deploy_incremental(self, mock_gh_deploy, mock_build, mock_load_config):
+        result = self.runner.invoke(cli.cli, ['gh-deploy', '--incremental'], catch_exceptions=False)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_gh_deploy.call_count, 1)
+        g_args, g_kwargs = mock_gh_deploy.call_args
+        self.assertEqual(g_kwargs['incremental'], True)
+
     @mock.patch('mkdocs.config.load_config', autospec=True)
     @mock.patch('mkdocs.commands.build.build', autospec=True)
     @mock.patch('mkdocs.commands.gh_deploy.gh_deploy', autospec=True)
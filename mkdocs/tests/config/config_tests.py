@@ -115,6 +115,7 @@ class ConfigTests(unittest.TestCase):
                     'hljs_style': 'github',
                     'hljs_languages': [],
                     'hljs_style_dark': 'github-dark',
+                    'client_navigation': False,
                     'navigation_depth': 2,
                     'nav_style': 'primary',
                     'shortcuts': {'help': 191, 'next': 78, 'previous': 80, 'search': 83},
@@ -134,6 +135,7 @@ class ConfigTests(unittest.TestCase):
                     'hljs_style': 'github',
                     'include_homepage_in_sidebar': True,
                     'prev_next_buttons_location': 'bottom',
+                    'client_navigation': False,
                     'navigation_depth': 4,
                     'sticky_navigation': True,
                     'logo': None,
@@ -155,6 +157,7 @@ class ConfigTests(unittest.TestCase):
                     'hljs_style': 'github',
                     'include_homepage_in_sidebar': True,
                     'prev_next_buttons_location': 'bottom',
+                    'client_navigation': False,
                     'navigation_depth': 4,
                     'sticky_navigation': True,
                     'logo': None,
@@ -181,6 +184,7 @@ class ConfigTests(unittest.TestCase):
                     'hljs_style': 'github',
                     'include_homepage_in_sidebar': True,
                     'prev_next_buttons_location': 'bottom',
+                    'client_navigation': False,
                     'navigation_depth': 4,
                     'sticky_navigation': True,
                     'logo': None,
@@ -205,6 +209,7 @@ class ConfigTests(unittest.TestCase):
                     'hljs_style': 'github',
                     'hljs_languages': [],
                     'hljs_style_dark': 'github-dark',
+                    'client_navigation': False,
                     'navigation_depth': 2,
                     'nav_style': 'primary',
                     'shortcuts': {'help': 191, 'next': 78, 'previous': 80, 'search': 83},
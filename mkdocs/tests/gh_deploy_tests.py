@@ -1,3 +1,6 @@
+import os
+import shutil
+import subprocess
 import unittest
 from unittest import mock
 
@@ -6,7 +9,7 @@ from ghp_import import GhpError  # type: ignore
 from mkdocs import __version__
 from mkdocs.commands import gh_deploy
 from mkdocs.exceptions import Abort
-from mkdocs.tests.base import load_config
+from mkdocs.tests.base import load_config, tempdir
 
 
 class TestGitHubDeploy(unittest.TestCase):
@@ -183,3 +186,89 @@ class TestGitHubDeployLogs(unittest.TestCase):
             '\n'.join(cm.output),
             'WARNING:mkdocs.commands.gh_deploy:Version check skipped: No version specified in previous deployment.',
         )
+
+
+@unittest.skipUnless(shutil.which('git'), "git is not installed")
+@mock.patch.dict(
+    os.environ,
+    {
+        'GIT_AUTHOR_NAME': 'Test',
+        'GIT_AUTHOR_EMAIL': 'test@example.com',
+        'GIT_COMMITTER_NAME': 'Test',
+        'GIT_COMMITTER_EMAIL': 'test@example.com',
+        'GIT_CONFIG_NOSYSTEM': '1',
+    },
+)
+@mock.patch('mkdocs.commands.gh_deploy._check_version', mock.Mock())
+class TestIncrementalDeploy(unittest.TestCase):
+    def _git(self, *args, cwd):
+        return subprocess.run(
+            ['git', *args], cwd=cwd, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+    def _deploy(self, work_dir, config, **kwargs):
+        cwd = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            with self.assertLogs('mkdocs', level='DEBUG') as cm:
+                gh_deploy.gh_deploy(config, incremental=True, **kwargs)
+        finally:
+            os.chdir(cwd)
+        return [r.getMessage() for r in cm.records]
+
+    def _remote_files(self, remote_dir):
+        return self._git('ls-tree', '-r', '--name-only', 'gh-pages', cwd=remote_dir).split('\n')
+
+    @tempdir(files={'site/index.html': 'page', 'site/img/a.png': 'image', 'work/README': ''})
+    def test_deploy_incremental(self, tdir):
+        remote_dir = os.path.join(tdir, 'remote.git')
+        work_dir = os.path.join(tdir, 'work')
+        site_dir = os.path.join(tdir, 'site')
+        self._git('init', '--bare', '-q', remote_dir, cwd=tdir)
+        self._git('init', '-q', cwd=work_dir)
+        self._git('remote', 'add', 'origin', remote_dir, cwd=work_dir)
+        config = load_config(
+            remote_branch='gh-pages', site_dir=site_dir, cache_dir=os.path.join(tdir, 'cache')
+        )
+
+        msgs = self._deploy(work_dir, config)
+        self.assertIn("Committed 3 changed files of 3 to 'gh-pages', sending 3 new blobs.", msgs)
+        self.assertEqual(self._remote_files(remote_dir), ['.nojekyll', 'img/a.png', 'index.html'])
+        first = self._git('rev-parse', 'gh-pages', cwd=remote_dir)
+
+        with open(os.path.join(site_dir, 'index.html'), 'w') as f:
+            f.write('new page')
+        with open(os.path.join(site_dir, 'b.png'), 'w') as f:
+            f.write('image')
+        os.remove(os.path.join(site_dir, 'img', 'a.png'))
+        msgs = self._deploy(work_dir, config)
+        # The unchanged content of 'b.png' is already there as a blob.
+        self.assertIn("Committed 3 changed files of 3 to 'gh-pages', sending 1 new blobs.", msgs)
+        self.assertEqual(self._remote_files(remote_dir), ['.nojekyll', 'b.png', 'index.html'])
+        self.assertEqual(self._git('rev-parse', 'gh-pages^', cwd=remote_dir), first)
+        self.assertEqual(self._git('show', 'gh-pages:index.html', cwd=remote_dir), 'new page')
+        second = self._git('rev-parse', 'gh-pages', cwd=remote_dir)
+
+        with mock.patch('mkdocs.commands.gh_deploy.push_branch') as mock_push:
+            msgs = self._deploy(work_dir, config)
+        mock_push.assert_not_called()
+        self.assertIn("The site is unchanged since the last deployment to 'gh-pages'.", msgs)
+        self.assertEqual(self._git('rev-parse', 'gh-pages', cwd=work_dir), second)
+
+        with open(os.path.join(site_dir, 'index.html'), 'w') as f:
+            f.write('page')
+        # With `--shell`, git is invoked through the shell.
+        with mock.patch('subprocess.Popen', wraps=subprocess.Popen) as mock_popen:
+            self._deploy(work_dir, config, no_history=True, shell=True)
+        commands = [c.args[0] for c in mock_popen.call_args_list if c.kwargs.get('shell')]
+        self.assertIn('git fast-import --quiet --force --date-format=raw', commands)
+        self.assertIn('git push origin gh-pages --force', commands)
+        self.assertEqual(self._git('rev-list', '--count', 'gh-pages', cwd=remote_dir), '1')
+        self.assertEqual(self._remote_files(remote_dir), ['.nojekyll', 'b.png', 'index.html'])
+        self.assertEqual(os.listdir(os.path.join(tdir, 'cache')), ['gh_deploy_blobs.json'])
+
+    @tempdir(files={'site/index.html': 'page'})
+    def test_deploy_incremental_error(self, tdir):
+        config = load_config(remote_branch='gh-pages', site_dir=os.path.join(tdir, 'site'))
+        with self.assertRaises(Abort):
+            self._deploy(tdir, config)
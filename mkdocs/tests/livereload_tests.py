@@ -455,6 +455,33 @@ class BuildTests(unittest.TestCase):
                 "\n".join(cm.output), r"Failed to render an error message[\s\S]+/missing.+code 404"
             )
 
+    @tempdir({"search/index.html": "a page"})
+    def test_search_handler(self, site_dir):
+        with testing_server(site_dir) as server:
+            server.search_handler = lambda query, limit: [query, limit]
+            headers, output = do_request(server, "GET /search?q=foo%20bar&limit=3")
+            self.assertEqual(headers["_status"], "200 OK")
+            self.assertEqual(headers.get("content-type"), "application/json")
+            self.assertEqual(output, '{"query": "foo bar", "results": ["foo bar", 3]}')
+
+            _, output = do_request(server, "GET /search")
+            self.assertEqual(output, '{"query": "", "results": ["", 10]}')
+
+            _, output = do_request(server, "GET /search/")
+            self.assertEqual(output, "a page")
+
+    @tempdir({"search/index.html": "a page"})
+    def test_search_handler_with_mount_path(self, site_dir):
+        with testing_server(site_dir, mount_path="/sub") as server:
+            server.search_handler = lambda query, limit: [query, limit]
+            headers, output = do_request(server, "GET /sub/search?q=foo")
+            self.assertEqual(headers["_status"], "200 OK")
+            self.assertEqual(output, '{"query": "foo", "results": ["foo", 10]}')
+
+            with self.assertLogs("mkdocs.livereload"):
+                headers, _ = do_request(server, "GET /search?q=foo")
+            self.assertEqual(headers["_status"], "404 Not Found")
+
     @tempdir(
         {
             "test.html": "<!DOCTYPE html>\nhi",
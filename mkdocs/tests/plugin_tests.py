@@ -251,6 +251,75 @@ class TestPluginCollection(unittest.TestCase):
         collection['foo'] = plugin
         self.assertEqual(collection.on_pre_build(config={}), None)
 
+    def test_run_event_with_parsed_html(self):
+        class Document:
+            parsed = 0
+            serialized = 0
+
+            def __init__(self, html):
+                Document.parsed += 1
+                self.parts = [html]
+
+            def __str__(self):
+                Document.serialized += 1
+                return ''.join(self.parts)
+
+        class AppendPlugin(plugins.BasePlugin):
+            def __init__(self, text):
+                super().__init__()
+                self.text = text
+
+            @plugins.parsed_html(Document)
+            def on_page_content(self, doc, **kwargs) -> None:
+                assert isinstance(doc, Document)
+                doc.parts.append(self.text)
+
+        class PlainPlugin(plugins.BasePlugin):
+            @plugins.event_priority(-100)
+            def on_page_content(self, html, **kwargs) -> str:
+                return f'<{html}>'
+
+        collection = plugins.PluginCollection()
+        collection['a'] = AppendPlugin(' a')
+        collection['plain'] = PlainPlugin()
+        collection['b'] = AppendPlugin(' b')
+        self.assertEqual(
+            collection.on_page_content('content', page=None, config={}, files=[]),
+            '<content a b>',
+        )
+        self.assertEqual((Document.parsed, Document.serialized), (1, 1))
+
+        collection['c'] = AppendPlugin(' c')
+        collection.events['page_content'].append(collection.events['page_content'].pop(0))
+        self.assertEqual(
+            collection.on_page_content('content', page=None, config={}, files=[]),
+            '<content b c> a',
+        )
+        self.assertEqual((Document.parsed, Document.serialized), (3, 3))
+
+    def test_parsed_html_on_other_event(self):
+        class MarkdownPlugin(plugins.BasePlugin):
+            @plugins.parsed_html(list)
+            def on_page_markdown(self, markdown, **kwargs):
+                assert isinstance(markdown, str)
+                return markdown + '!'
+
+        collection = plugins.PluginCollection()
+        with self.assertLogs('mkdocs', level='WARNING') as cm:
+            collection['md'] = MarkdownPlugin()
+        self.assertEqual(
+            cm.output,
+            [
+                "WARNING:mkdocs.plugins:The 'parsed_html' decorator has no effect on "
+                "'on_page_markdown' (registered by plugin 'md'), only on 'on_page_content', "
+                "'on_post_page' and 'on_post_template'."
+            ],
+        )
+        # The handler still receives the string.
+        self.assertEqual(
+            collection.on_page_markdown('text', page=None, config={}, files=[]), 'text!'
+        )
+
     def test_run_undefined_event_on_collection(self):
         collection = plugins.PluginCollection()
         self.assertEqual(
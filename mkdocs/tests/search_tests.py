@@ -6,7 +6,7 @@ from unittest import mock
 
 from mkdocs.config.config_options import ValidationError
 from mkdocs.contrib import search
-from mkdocs.contrib.search import search_index
+from mkdocs.contrib.search import query_engine, search_index
 from mkdocs.structure.files import File
 from mkdocs.structure.pages import Page
 from mkdocs.structure.toc import get_toc
@@ -631,3 +631,159 @@ class SearchIndexTests(unittest.TestCase):
         self.assertEqual(mock_popen.call_count, 1)
         self.assertEqual(mock_popen_obj.communicate.call_count, 1)
         self.assertEqual(result, expected)
+
+    @mock.patch('subprocess.Popen', autospec=True)
+    def test_prebuild_index_worker(self, mock_popen):
+        mock_popen.return_value = mock.Mock()
+        mock_popen_obj = mock_popen.return_value
+        mock_popen_obj.poll.return_value = None
+        mock_popen_obj.stdout.readline.side_effect = [
+            'index null\n',
+            'index {"mock":"index"}\n',
+            'index {"mock":"index2"}\n',
+        ]
+        worker = search_index.NodeIndexWorker()
+
+        index = search_index.SearchIndex(prebuild_index='node')
+        index._add_entry('A', 'a', 'a/')
+        index._add_entry('B', 'b', 'b/')
+        result = json.loads(index.generate_search_index(worker=worker))
+        self.assertEqual(result['index'], {'mock': 'index'})
+
+        index = search_index.SearchIndex(prebuild_index='node')
+        index._add_entry('B', 'b', 'b/')
+        index._add_entry('C', 'c', 'c/')
+        result = json.loads(index.generate_search_index(worker=worker))
+        self.assertEqual(result['index'], {'mock': 'index2'})
+        self.assertEqual(result['docs'][1], {'title': 'C', 'text': 'c', 'location': 'c/'})
+
+        # The process is reused and only receives the documents that changed.
+        self.assertEqual(mock_popen.call_count, 1)
+        messages = [json.loads(c.args[0]) for c in mock_popen_obj.stdin.write.call_args_list]
+        self.assertEqual(
+            messages,
+            [
+                {'config': {'prebuild_index': 'node'}},
+                {
+                    'add': {
+                        '0': {'title': 'A', 'text': 'a', 'location': 'a/'},
+                        '1': {'title': 'B', 'text': 'b', 'location': 'b/'},
+                    },
+                    'remove': [],
+                    'build': ['0', '1'],
+                },
+                {
+                    'add': {'2': {'title': 'C', 'text': 'c', 'location': 'c/'}},
+                    'remove': ['0'],
+                    'build': ['1', '2'],
+                },
+            ],
+        )
+
+    @mock.patch('subprocess.Popen', autospec=True)
+    def test_prebuild_index_worker_restarts(self, mock_popen):
+        mock_popen.return_value = mock.Mock()
+        mock_popen_obj = mock_popen.return_value
+        mock_popen_obj.poll.return_value = None
+        mock_popen_obj.stdout.readline.side_effect = [
+            'index null\n',
+            'error "Some Error"\n',
+            'index null\n',
+            'index {"mock":"index"}\n',
+        ]
+        worker = search_index.NodeIndexWorker()
+
+        index = search_index.SearchIndex(prebuild_index='node')
+        with self.assertLogs('mkdocs') as cm:
+            result = json.loads(index.generate_search_index(worker=worker))
+        self.assertEqual(
+            '\n'.join(cm.output),
+            'WARNING:mkdocs.contrib.search.search_index:Failed to pre-build search index. Error: Some Error',
+        )
+        self.assertNotIn('index', result)
+
+        result = json.loads(index.generate_search_index(worker=worker))
+        self.assertEqual(result['index'], {'mock': 'index'})
+        self.assertEqual(mock_popen.call_count, 2)
+
+    def test_prebuild_index_worker_only_in_serve(self):
+        plugin = search.SearchPlugin()
+        plugin.on_startup(command='build', dirty=False)
+        self.assertIsNone(plugin._node_worker)
+        plugin.on_startup(command='serve', dirty=False)
+        self.assertIsInstance(plugin._node_worker, search_index.NodeIndexWorker)
+        plugin.on_shutdown()
+
+
+class SearchQueryEngineTests(unittest.TestCase):
+    def _engine(self):
+        index = search_index.SearchIndex(separator=r'[\s\-]+', min_search_length=3)
+        index._add_entry('Installation', 'How to install the package with pip.', 'install/')
+        index._add_entry('Configuration', 'Options for the theme and plugins.', 'config/')
+        index._add_entry('Plugins', 'Writing a plugin. Install it with pip.', 'plugins/')
+        index._add_entry('Theme', 'Customizing the theme templates.', 'config/#theme')
+        return query_engine.QueryEngine.from_search_index(index)
+
+    def _locations(self, results):
+        return [r['location'] for r in results]
+
+    def test_exact_match_prefers_title(self):
+        engine = self._engine()
+        self.assertEqual(self._locations(engine.search('theme')), ['config/#theme', 'config/'])
+
+    def test_multiple_terms(self):
+        engine = self._engine()
+        self.assertEqual(self._locations(engine.search('install pip')), ['install/', 'plugins/'])
+
+    def test_prefix_match(self):
+        engine = self._engine()
+        self.assertEqual(self._locations(engine.search('config')), ['config/'])
+        self.assertEqual(self._locations(engine.search('plug')), ['plugins/', 'config/'])
+        # Prefix matches only apply to terms of at least `min_search_length` characters.
+        self.assertEqual(engine.search('pl'), [])
+
+    def test_fuzzy_match(self):
+        engine = self._engine()
+        self.assertEqual(self._locations(engine.search('temlates')), ['config/#theme'])
+        self.assertEqual(self._locations(engine.search('instalation')), ['install/'])
+        self.assertEqual(engine.search('xyzzy'), [])
+
+    def test_result_format_and_limit(self):
+        engine = self._engine()
+        results = engine.search('the', limit=1)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(set(results[0]), {'location', 'title', 'summary', 'score'})
+        self.assertEqual(results[0]['summary'], 'Customizing the theme templates.')
+
+    def test_fuzzy_terms(self):
+        engine = query_engine.QueryEngine(
+            [{'title': '', 'text': 'cart carts card cord care bar', 'location': ''}]
+        )
+        self.assertEqual(
+            sorted(engine._fuzzy_terms('cart', 1)), [('card', 1), ('care', 1), ('carts', 1)]
+        )
+        # The first character is never considered a typo.
+        self.assertEqual(
+            sorted(engine._fuzzy_terms('cart', 2)),
+            [('card', 1), ('care', 1), ('carts', 1), ('cord', 2)],
+        )
+
+    def test_from_json(self):
+        index = search_index.SearchIndex(
+            separator=r'[\s\-]+', min_search_length=3, prebuild_index=False
+        )
+        index._add_entry('Home', 'Welcome to MkDocs', '')
+        engine = query_engine.QueryEngine.from_json(index.generate_search_index())
+        self.assertEqual(engine.search('welcome')[0]['title'], 'Home')
+
+    def test_plugin_search_uses_latest_build(self):
+        plugin = search.SearchPlugin()
+        plugin.load_config({})
+        plugin.on_pre_build(load_config())
+        plugin.search_index._add_entry('Home', 'first', '')
+        self.assertEqual(len(plugin.search('first')), 1)
+
+        plugin.on_pre_build(load_config())
+        plugin.search_index._add_entry('Home', 'second', '')
+        self.assertEqual(plugin.search('first'), [])
+        self.assertEqual(len(plugin.search('second')), 1)
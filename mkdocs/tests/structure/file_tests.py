@@ -1,9 +1,24 @@
 import os
+import re
 import sys
 import unittest
 from unittest import mock
 
-from mkdocs.structure.files import File, Files, _sort_files, file_sort_key, get_files
+import jinja2
+import pathspec.gitignore
+
+from mkdocs.structure.files import (
+    File,
+    Files,
+    InclusionLevel,
+    _AnyPatternMatcher,
+    _default_exclude,
+    _name_glob,
+    _sort_files,
+    file_sort_key,
+    get_files,
+    set_exclusions,
+)
 from mkdocs.tests.base import PathAssertionMixin, load_config, tempdir
 
 
@@ -285,6 +300,24 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         del f.name
         self.assertFalse(f.is_documentation_page())
 
+    def test_file_compact_attrs(self):
+        f = File('foo/bar.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+        self.assertEqual(f.url, 'foo/bar/')
+        self.assertPathsEqual(f.abs_src_path, '/path/to/docs/foo/bar.md')
+        self.assertPathsEqual(f.abs_dest_path, '/path/to/site/foo/bar/index.html')
+        self.assertEqual(vars(f), {})
+
+        # The absolute paths aren't stored, so they follow changes of the other attributes.
+        f.dest_uri = 'baz.html'
+        self.assertPathsEqual(f.abs_dest_path, '/path/to/site/baz.html')
+        f.src_uri = 'baz.md'
+        self.assertPathsEqual(f.abs_src_path, '/path/to/docs/baz.md')
+
+        # Plugins can still add their own attributes.
+        f.custom = 'value'
+        self.assertEqual(f.custom, 'value')
+        self.assertEqual(vars(f), {'custom': 'value'})
+
     def test_generated_file(self):
         f = File(
             'foo/bar.md',
@@ -320,6 +353,30 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
             self.assertEqual(f.content_bytes, 'вміст'.encode())
             self.assertEqual(f.edit_uri, None)
 
+    @tempdir()
+    def test_generated_file_from_factory(self, site_dir) -> None:
+        config = load_config(site_dir=site_dir, use_directory_urls=False)
+        config.plugins._current_plugin = 'foo'
+        calls = []
+
+        def chunks():
+            calls.append('chunks')
+            yield 'в'
+            yield 'міст'.encode()
+
+        for f in [
+            File.generated(config, 'foo/bar.json', content=lambda: 'вміст'),
+            File.generated(config, 'foo/bar.json', content=lambda: 'вміст'.encode()),
+            File.generated(config, 'foo/bar.json', content=chunks),
+        ]:
+            self.assertEqual(f.content_string, 'вміст')
+            self.assertEqual(f.content_bytes, 'вміст'.encode())
+            f.copy_file()
+            with open(os.path.join(site_dir, 'foo', 'bar.json'), encoding='utf-8') as fd:
+                self.assertEqual(fd.read(), 'вміст')
+        # The content is produced anew every time it's needed, rather than kept.
+        self.assertEqual(calls, ['chunks'] * 3)
+
     def test_files(self):
         fs = [
             File('index.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
@@ -388,6 +445,40 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
             os.path.normpath(os.path.join(ddir, 'favicon.ico')),
         )
 
+    @tempdir(files=['index.md'])
+    @tempdir(files=['main.html', 'css/style.css', 'js/script.js'])
+    def test_add_files_from_theme_cached(self, tdir, ddir):
+        config = load_config(docs_dir=ddir, theme={'name': None, 'custom_dir': tdir})
+
+        def theme_files():
+            files = Files([])
+            files.add_files_from_theme(config.theme.get_env(), config)
+            return [file.src_uri for file in files]
+
+        self.assertEqual(theme_files(), ['css/style.css', 'js/script.js'])
+        with mock.patch('os.scandir', wraps=os.scandir) as mock_scandir:
+            self.assertEqual(theme_files(), ['css/style.css', 'js/script.js'])
+        mock_scandir.assert_not_called()
+
+        # Adding a file to a subdirectory invalidates the index.
+        with open(os.path.join(tdir, 'css', 'extra.css'), 'w'):
+            pass
+        os.utime(os.path.join(tdir, 'css'), ns=(0, 0))
+        self.assertEqual(theme_files(), ['css/extra.css', 'css/style.css', 'js/script.js'])
+
+    @tempdir(files=['index.md'])
+    @tempdir(files=['main.html', 'style.css'])
+    def test_add_files_from_theme_custom_loader(self, tdir, ddir):
+        config = load_config(docs_dir=ddir, theme={'name': None, 'custom_dir': tdir})
+        env = config.theme.get_env()
+        env.loader = jinja2.ChoiceLoader(
+            [env.loader, jinja2.DictLoader({'extra.js': '', 'other.html': ''})]
+        )
+        files = Files([])
+        files.add_files_from_theme(env, config)
+        # Templates which aren't in a theme dir are skipped, as before.
+        self.assertEqual([file.src_uri for file in files], ['style.css'])
+
     def test_get_relative_url_use_directory_urls(self):
         to_files = [
             'index.md',
@@ -597,9 +688,172 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
             [f.src_uri for f in files if f.inclusion.is_included()],
             ['index.md', 'bar.css', 'bar.html', 'bar.jpg', 'bar.js', 'bar.md', 'readme.md'],
         )
+        # Excluded directories aren't walked at all, see `test_link_to_excluded_dir` for links into them.
         self.assertEqual(
             [f.src_uri for f in files if f.inclusion.is_excluded()],
-            ['.dotfile', 'templates/foo.html'],
+            ['.dotfile'],
+        )
+
+    @tempdir(
+        files=[
+            'index.md',
+            'api/index.md',
+            'api/node_modules/pkg/index.js',
+            'node_modules/pkg/index.js',
+            'vendor/a.md',
+            'vendor/keep/b.md',
+            '.git/HEAD',
+        ]
+    )
+    def test_get_files_prunes_excluded_dirs(self, tdir):
+        config = load_config(
+            docs_dir=tdir, exclude_docs='node_modules/\n/vendor/\n!/vendor/keep/\n'
+        )
+        with mock.patch('os.scandir', wraps=os.scandir) as mock_scandir:
+            files = get_files(config)
+        scanned = {os.path.relpath(c.args[0], tdir) for c in mock_scandir.call_args_list}
+        self.assertEqual(scanned, {'.', 'api', 'vendor', os.path.join('vendor', 'keep')})
+        self.assertEqual(
+            [(f.src_uri, f.inclusion.is_included()) for f in files],
+            [
+                ('index.md', True),
+                ('api/index.md', True),
+                ('vendor/a.md', False),
+                ('vendor/keep/b.md', True),
+            ],
+        )
+
+    def test_set_exclusions(self):
+        config = load_config(
+            exclude_docs='*.py\n/vendor/\n!/vendor/keep.md\nbuild/\ntmp*\n**/gen/\n/a/**/*.bak\n',
+            draft_docs='drafts/\n!drafts/ready/\n_*.md\n',
+            not_in_nav='/blog/\n*.html\n',
+        )
+        paths = [
+            'index.md',
+            'a.py',
+            'src/b.py',
+            '.hidden.md',
+            'sub/.hidden/c.md',
+            'templates/main.html',
+            'sub/templates/d.md',
+            'vendor/e.md',
+            'vendor/keep.md',
+            'vendor/sub/keep.md',
+            'x/build/f.md',
+            'build.md',
+            'drafts/g.md',
+            'drafts/ready/h.md',
+            'drafts/ready/_i.md',
+            'sub/_j.md',
+            'blog/k.md',
+            'blog/l.py',
+            'm.html',
+            'n/o.txt',
+            'tmp.md',
+            'p/tmpdir/q.md',
+            'r/gen/s.md',
+            'gen.md',
+            'a/b/c/t.bak',
+            'b/u.bak',
+        ]
+        exclude = _default_exclude + config.exclude_docs
+        files = [File(path, '/docs', '/site', use_directory_urls=True) for path in paths]
+        set_exclusions(files, config)
+
+        for file in files:
+            if exclude.match_file(file.src_uri):
+                expected = InclusionLevel.EXCLUDED
+            elif config.draft_docs.match_file(file.src_uri):
+                expected = InclusionLevel.DRAFT
+            elif config.not_in_nav.match_file(file.src_uri):
+                expected = InclusionLevel.NOT_IN_NAV
+            else:
+                expected = InclusionLevel.INCLUDED
+            with self.subTest(file.src_uri):
+                self.assertEqual(file.inclusion, expected)
+        self.assertEqual(
+            [f.src_uri for f in files if f.inclusion.is_included() and f.inclusion.is_in_nav()],
+            [
+                'index.md',
+                'sub/templates/d.md',
+                'vendor/keep.md',
+                'build.md',
+                'drafts/ready/h.md',
+                'n/o.txt',
+                'gen.md',
+                'b/u.bak',
+            ],
+        )
+
+    def test_name_glob(self):
+        spec = pathspec.gitignore.GitIgnoreSpec.from_lines(
+            [
+                '*.py',
+                '!keep.py',
+                'node_modules/',
+                'a?c*',
+                'foo/bar',
+                '/top',
+                '**/x',
+                '[ab].md',
+                '\\#x',
+                ' y ',
+            ]
+        )
+        self.assertEqual(
+            [_name_glob(pattern) for pattern in spec.patterns],
+            [
+                ('*.py', False),
+                ('keep.py', False),
+                ('node_modules', True),
+                ('a?c*', False),
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+            ],
+        )
+
+    def test_any_pattern_matcher_ignores_regex_text(self):
+        spec = pathspec.gitignore.GitIgnoreSpec.from_lines(['*.py', 'build/', 'a?c*.md'])
+        # The name patterns are recognized from their text, whatever their regex looks like.
+        for pattern in spec.patterns:
+            pattern.regex = re.compile(f'(?:{pattern.regex.pattern})')
+        matcher = _AnyPatternMatcher([spec])
+        self.assertEqual(matcher._whole_path.pattern, '(?!)')
+        for path in [
+            'a.py',
+            'x/b.py',
+            'build/c.md',
+            'x/build/d.md',
+            'build.md',
+            'abcd.md',
+            'x/a.md',
+        ]:
+            with self.subTest(path):
+                self.assertEqual(matcher.match(path), spec.match_file(path))
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "requires symlinks")
+    @tempdir(files=['index.md', 'foo/bar.md'])
+    def test_get_files_symlink_cycle(self, tdir):
+        try:
+            os.symlink(tdir, os.path.join(tdir, 'foo', 'loop'))
+            os.symlink(os.path.join(tdir, 'foo'), os.path.join(tdir, 'baz'))
+        except OSError:  # pragma: no cover
+            self.skipTest("cannot create symlinks")
+        config = load_config(docs_dir=tdir)
+        with self.assertLogs('mkdocs') as cm:
+            files = get_files(config)
+        self.assertEqual([f.src_uri for f in files], ['index.md', 'baz/bar.md', 'foo/bar.md'])
+        self.assertEqual(
+            '\n'.join(cm.output),
+            "WARNING:mkdocs.structure.files:Skipping the directory 'baz/loop' in the docs_dir "
+            "because it is a symlink to one of its parent directories.\n"
+            "WARNING:mkdocs.structure.files:Skipping the directory 'foo/loop' in the docs_dir "
+            "because it is a symlink to one of its parent directories.",
         )
 
     @tempdir(
@@ -731,6 +985,18 @@ class TestFiles(PathAssertionMixin, unittest.TestCase):
         self.assertEqual(len(files.src_uris), 6)
         self.assertFalse(extra_file.src_uri in files.src_uris)
 
+    def test_files_extend(self):
+        files = Files([File('a.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)])
+        files.extend(
+            File(f'api/{i}.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)
+            for i in range(3)
+        )
+        self.assertEqual([f.src_uri for f in files], ['a.md', 'api/0.md', 'api/1.md', 'api/2.md'])
+
+        with self.assertWarns(DeprecationWarning):
+            files.extend([File('a.md', '/path/to/docs', '/path/to/site', use_directory_urls=True)])
+        self.assertEqual([f.src_uri for f in files], ['api/0.md', 'api/1.md', 'api/2.md', 'a.md'])
+
     def test_files_move_to_end(self):
         fs = [
             File('a.md', '/path/to/docs', '/path/to/site', use_directory_urls=True),
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 
+import json
 import sys
 import unittest
 
@@ -131,6 +132,32 @@ class SiteNavigationTests(unittest.TestCase):
         self.assertEqual(len(site_navigation.items), 3)
         self.assertEqual(len(site_navigation.pages), 1)
 
+    def test_nav_to_json(self):
+        nav_cfg = [
+            {'Home': 'index.md'},
+            {'About': [{'License': 'about/license.md'}, {'External': 'http://example.com/'}]},
+        ]
+        cfg = load_config(nav=nav_cfg, site_url='http://example.com/')
+        fs = [
+            File(path, cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+            for path in ['index.md', 'about/license.md']
+        ]
+        site_navigation = get_navigation(Files(fs), cfg)
+        self.assertIsNone(site_navigation.json_url)
+        self.assertEqual(
+            json.loads(site_navigation.to_json()),
+            [
+                {'title': 'Home', 'url': ''},
+                {
+                    'title': 'About',
+                    'children': [
+                        {'title': 'License', 'url': 'about/license/'},
+                        {'title': 'External', 'url': 'http://example.com/', 'is_link': True},
+                    ],
+                },
+            ],
+        )
+
     def test_nav_absolute_links_with_validation(self):
         nav_cfg = [
             {'Home': 'index.md'},
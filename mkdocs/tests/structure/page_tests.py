@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import posixpath
 import sys
 import textwrap
 import unittest
@@ -10,7 +11,15 @@ import markdown
 
 from mkdocs.config.defaults import MkDocsConfig
 from mkdocs.structure.files import File, Files
-from mkdocs.structure.pages import Page, _ExtractTitleTreeprocessor, _RelativePathTreeprocessor
+from mkdocs.structure.pages import (
+    Page,
+    RenderCache,
+    TitleIndex,
+    _HTMLHandler,
+    _join_uri,
+    _LinkResolver,
+    _RelativePathTreeprocessor,
+)
 from mkdocs.tests.base import dedent, tempdir
 
 DOCS_DIR = os.path.join(
@@ -225,6 +234,20 @@ class PageTests(unittest.TestCase):
         self.assertEqual(pg.title, 'Foo')
         self.assertEqual(pg.toc, [])
 
+    def test_page_canonical_url_overwrite(self):
+        cfg = load_config(site_url='http://example.com/foo/')
+        fl = File('testing.md', cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+        pg = Page('Foo', fl, cfg)
+        fl.url = 'other/'
+        self.assertEqual(pg.abs_url, '/foo/other/')
+        pg.canonical_url = 'http://example.org/bar/'
+        self.assertEqual(pg.canonical_url, 'http://example.org/bar/')
+        self.assertEqual(pg.abs_url, '/bar/')
+        pg.abs_url = '/baz/'
+        self.assertEqual(pg.abs_url, '/baz/')
+        pg.custom = 'value'
+        self.assertEqual(pg.custom, 'value')
+
     def test_page_canonical_url_nested(self):
         cfg = load_config(site_url='http://example.com/foo/')
         fl = File('testing.md', cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
@@ -322,7 +345,11 @@ class PageTests(unittest.TestCase):
 
     def _test_extract_title(self, content, expected, extensions={}):
         md = markdown.Markdown(extensions=list(extensions.keys()), extension_configs=extensions)
-        extract_title_ext = _ExtractTitleTreeprocessor()
+        fl = File('index.md', 'docs', 'site', use_directory_urls=True)
+        cfg = load_config(
+            validation={'links': {'not_found': 'ignore', 'unrecognized_links': 'ignore'}}
+        )
+        extract_title_ext = _RelativePathTreeprocessor(fl, Files([fl]), cfg)
         extract_title_ext._register(md)
         md.convert(content)
         self.assertEqual(extract_title_ext.title, expected)
@@ -390,6 +417,19 @@ class PageTests(unittest.TestCase):
     def test_page_title_from_markdown_strip_comments(self):
         self._test_extract_title('''# foo <!-- comment with <em> --> bar''', expected='foo bar')
 
+    def test_page_title_from_markdown_custom_postprocessor(self):
+        class UpperPostprocessor(markdown.postprocessors.Postprocessor):
+            def run(self, text):
+                return text.upper()
+
+        class UpperExtension(markdown.extensions.Extension):
+            def extendMarkdown(self, md):
+                md.postprocessors.register(UpperPostprocessor(md), 'upper', 5)
+
+        self._test_extract_title(
+            '''# Hello *world*''', extensions={UpperExtension(): {}}, expected='HELLO WORLD'
+        )
+
     def test_page_title_from_markdown_strip_image(self):
         self._test_extract_title('''# Hi ![😄](hah.png)''', expected='Hi 😄')
         self._test_extract_title('''# Hi *-![😄](hah.png)-*''', expected='Hi -😄-')
@@ -750,6 +790,181 @@ class PageTests(unittest.TestCase):
             '\n'.join(cm.output), 'ERROR:mkdocs.structure.pages:File not found: missing.md'
         )
 
+    def test_page_render_anchor_ids(self):
+        cfg = load_config(markdown_extensions=['toc', 'attr_list', 'md_in_html'])
+        fl = File('testing.md', cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+        pg = Page(None, fl, cfg)
+        pg.markdown = dedent(
+            """
+            # Title
+
+            Text
+            {: #para }
+
+            <div id="block" markdown>
+            <a name="named">inline</a>
+            </div>
+
+            Inline <span id='inline'>HTML</span>.
+
+            <p data-x="1" ID = upper></p>
+
+                <a id="in-code"></a>
+            """
+        )
+        with mock.patch('mkdocs.structure.pages._HTMLHandler', wraps=_HTMLHandler) as handler:
+            pg.render(cfg, Files([fl]))
+        self.assertEqual(pg.title, 'Title')
+        self.assertEqual(
+            pg.present_anchor_ids, {'title', 'para', 'block', 'named', 'inline', 'upper'}
+        )
+        self.assertEqual(handler.call_count, 1)
+
+        pg.markdown = '# Title\n\nNo <b>anchors</b> in *HTML*.'
+        with mock.patch('mkdocs.structure.pages._HTMLHandler', wraps=_HTMLHandler) as handler:
+            pg.render(cfg, Files([fl]))
+        self.assertEqual(pg.present_anchor_ids, {'title'})
+        handler.assert_not_called()
+
+    @tempdir(
+        files={
+            'meta.md': '---\ntitle: From meta\n---\n\n# Heading',
+            'atx.md': '\n# Heading #\n\nText',
+            'setext.md': 'Heading\n=======\n\nText',
+            'h2.md': '## Heading',
+            'index.md': 'Text',
+        }
+    )
+    def test_page_scan_title(self, docs_dir):
+        cfg = load_config(docs_dir=docs_dir)
+        for name, expected in [
+            ('meta.md', 'From meta'),
+            ('atx.md', 'Heading'),
+            ('setext.md', 'Heading'),
+            ('h2.md', 'H2'),
+            ('index.md', 'Home'),
+        ]:
+            with self.subTest(name):
+                fl = File(name, cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+                pg = Page(None, fl, cfg)
+                self.assertIsNone(pg.title)
+                self.assertEqual(pg.scan_title(cfg), expected)
+                self.assertEqual(pg.title, expected)
+                self.assertIsNone(pg.markdown)
+
+    @tempdir(files={'page.md': '# Heading'})
+    @tempdir()
+    def test_page_scan_title_index(self, cache_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, cache_dir=cache_dir)
+        fl = File('page.md', cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+        index = TitleIndex.for_config(cfg)
+        self.assertEqual(Page(None, fl, cfg).scan_title(cfg, index), 'Heading')
+        index.save()
+
+        # The title is taken from the saved index while the file is unchanged.
+        index = TitleIndex.for_config(cfg)
+        with mock.patch('mkdocs.structure.pages._scan_source_title') as mock_scan:
+            self.assertEqual(Page(None, fl, cfg).scan_title(cfg, index), 'Heading')
+        mock_scan.assert_not_called()
+
+        with open(fl.abs_src_path, 'w') as f:
+            f.write('# Another heading')
+        self.assertEqual(Page(None, fl, cfg).scan_title(cfg, index), 'Another heading')
+
+    @tempdir(files={'page.md': '# Heading'})
+    @tempdir()
+    def test_page_scan_title_index_invalid(self, cache_dir, docs_dir):
+        cfg = load_config(docs_dir=docs_dir, cache_dir=cache_dir)
+        fl = File('page.md', cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+        path = os.path.join(cache_dir, 'page_titles.json')
+        for content in (
+            '["page.md"]',
+            '{"page.md": [1, 2, "Old"]}',
+            '{"version": 1, "entries": ["page.md"]}',
+            '{"version": 1, "entries": {"page.md": "Old"}}',
+            '{"version": 1, "entries": {"page.md": [1]}}',
+        ):
+            with self.subTest(content):
+                with open(path, 'w') as f:
+                    f.write(content)
+                index = TitleIndex.for_config(cfg)
+                self.assertEqual(Page(None, fl, cfg).scan_title(cfg, index), 'Heading')
+
+    @tempdir()
+    @mock.patch.object(RenderCache, '_memory', {})
+    def test_page_render_cache(self, cache_dir):
+        cfg = load_config(
+            cache_dir=cache_dir,
+            render_cache=True,
+            markdown_extensions=[{'toc': {'permalink': True}}, 'attr_list'],
+        )
+        source = dedent(
+            """
+            # Title [with a link](b.md)
+
+            See [b](b.md#sec "B & co"), ![img](img.png), [here](#title) and <foo@example.com>.
+            [Gone](c.md)
+            {: #para }
+            """
+        )
+
+        def render(*names, cache=None):
+            files = Files([File(name, cfg.docs_dir, cfg.site_dir, True) for name in names])
+            pg = Page(None, files.get_file_from_path('a.md'), cfg)
+            pg.markdown = source
+            pg.render(cfg, files, cache=cache)
+            links = {f.src_uri: anchors for f, anchors in pg.links_to_anchors.items()}
+            return (pg.content, pg.title, str(pg.toc), pg.present_anchor_ids, links)
+
+        with self.assertLogs('mkdocs') as cm:
+            expected = render('a.md', 'b.md', 'img.png')
+        self.assertIn('<a href="../b/#sec" title="B &amp; co">b</a>', expected[0])
+        with self.assertLogs('mkdocs') as cached_cm:
+            result = render('a.md', 'b.md', 'img.png', cache=RenderCache.for_config(cfg))
+        self.assertEqual(result, expected)
+        self.assertEqual(cached_cm.output, cm.output)
+
+        # Another build reads the page from `cache_dir` and only resolves the links again, even
+        # if the files are different.
+        RenderCache._memory.clear()
+        for names in (('a.md', 'b.md', 'img.png'), ('a.md', 'sub/b.md', 'img.png')):
+            with self.subTest(names=names):
+                with self.assertLogs('mkdocs') as cm:
+                    expected = render(*names)
+                with mock.patch('markdown.Markdown') as mock_md:
+                    with self.assertLogs('mkdocs') as cached_cm:
+                        result = render(*names, cache=RenderCache.for_config(cfg))
+                mock_md.assert_not_called()
+                self.assertEqual(result, expected)
+                self.assertEqual(cached_cm.output, cm.output)
+
+    def test_page_render_cache_config(self):
+        self.assertIsNone(RenderCache.for_config(load_config()))
+        cache = RenderCache.for_config(load_config(render_cache=True))
+        self.assertIsNone(cache.path)
+        self.assertEqual(
+            cache.config_key,
+            RenderCache.for_config(
+                load_config(render_cache=True, markdown_extensions=[])
+            ).config_key,
+        )
+        self.assertNotEqual(
+            cache.config_key,
+            RenderCache.for_config(
+                load_config(
+                    render_cache=True,
+                    markdown_extensions=[
+                        {'toc': {'slugify': markdown.extensions.toc.slugify_unicode}}
+                    ],
+                )
+            ).config_key,
+        )
+        # An extension that can't be compared between builds disables the cache.
+        cfg = load_config(
+            render_cache=True, markdown_extensions=[{'toc': {'slugify': lambda value, sep: value}}]
+        )
+        self.assertIsNone(RenderCache.for_config(cfg))
+
 
 class SourceDateEpochTests(unittest.TestCase):
     def setUp(self):
@@ -1380,3 +1595,52 @@ class RelativePathExtensionTests(unittest.TestCase):
             exp_true='test.png, test.png.md, foo/test.png, foo/test.png.md',
             exp_false='test.png, test.png.md',
         )
+
+
+class LinkResolverTests(unittest.TestCase):
+    def test_join_uri(self):
+        for src_dir in '', 'foo', 'foo/bar', '.hidden':
+            for path in (
+                'a.md',
+                'a/b.md',
+                '../a.md',
+                './a.md',
+                'a//b.md',
+                'a/./b.md',
+                'a/../b.md',
+                'a/',
+                '/a.md',
+                '.',
+                '..',
+                '.a.md',
+                '../../../a.md',
+            ):
+                with self.subTest(src_dir=src_dir, path=path):
+                    self.assertEqual(
+                        _join_uri(src_dir, path),
+                        posixpath.normpath(posixpath.join(src_dir, path).lstrip('/')),
+                    )
+
+    def test_resolve_link(self):
+        cfg = load_config()
+        fs = [
+            File(f, cfg.docs_dir, cfg.site_dir, cfg.use_directory_urls)
+            for f in ('index.md', 'foo/a.md', 'foo/b.md', 'foo/img.png')
+        ]
+        files = Files(fs[:3])
+        resolver = _LinkResolver.for_files(files)
+        self.assertIs(_LinkResolver.for_files(files), resolver)
+
+        link = resolver.resolve_link('foo/a.md', 'b.md?x=1#sec')
+        self.assertEqual(link, ('foo/b.md', fs[2], 'x=1', 'sec'))
+        self.assertIs(resolver.resolve_link('foo/b.md', 'b.md?x=1#sec'), link)
+        for url in 'https://example.com/', '/foo/a.md', '#sec', 'missing.md', 'img.png':
+            with self.subTest(url=url):
+                self.assertIsNone(resolver.resolve_link('foo/a.md', url))
+
+        # Adding files resets the resolver.
+        files.append(fs[3])
+        resolver = _LinkResolver.for_files(files)
+        self.assertEqual(
+            resolver.resolve_link('foo/a.md', 'img.png'), ('foo/img.png', fs[3], '', '')
+        )
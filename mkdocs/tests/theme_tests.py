@@ -35,6 +35,7 @@ class ThemeTests(unittest.TestCase):
                 'hljs_style': 'github',
                 'hljs_style_dark': 'github-dark',
                 'hljs_languages': [],
+                'client_navigation': False,
                 'navigation_depth': 2,
                 'nav_style': 'primary',
                 'shortcuts': {'help': 191, 'next': 78, 'previous': 80, 'search': 83},
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+import os
+import tarfile
+import unittest
+import zipfile
+
+from mkdocs import utils
+from mkdocs.structure.files import File
+from mkdocs.tests.base import PathAssertionMixin, tempdir
+from mkdocs.utils.archive import SiteArchive, archive_format
+
+
+class SiteArchiveTests(PathAssertionMixin, unittest.TestCase):
+    def test_archive_format(self):
+        for name, fmt in [
+            ('site.zip', 'zip'),
+            ('site.tar', 'tar'),
+            ('out/site.tar.gz', 'gz'),
+            ('SITE.TGZ', 'gz'),
+            ('site.tar.bz2', 'bz2'),
+            ('site.tar.xz', 'xz'),
+        ]:
+            with self.subTest(name):
+                self.assertEqual(archive_format(name), fmt)
+        with self.assertRaises(ValueError):
+            archive_format('site.gz')
+
+    @tempdir(files={'docs/a.png': 'image'})
+    def test_write_outputs(self, tdir):
+        site_dir = os.path.join(tdir, 'site')
+        for name in 'site.tar.xz', 'site.zip':
+            with self.subTest(name):
+                path = os.path.join(tdir, name)
+                archive = SiteArchive(path, site_dir, mtime=1700000000)
+                archive.open()
+                try:
+                    utils.write_file(b'old page', os.path.join(site_dir, 'index.html'))
+                    utils.copy_file(
+                        os.path.join(tdir, 'docs', 'a.png'), os.path.join(site_dir, 'img', 'a.png')
+                    )
+                    f = File('b.txt', None, site_dir, use_directory_urls=False)
+                    f._content = lambda: iter(['chunk1', 'chunk2'])
+                    f.copy_file()
+                    # A file written again replaces the previous version when extracting.
+                    with self.assertLogs('mkdocs', level='INFO') as cm:
+                        utils.write_file(b'page', os.path.join(site_dir, 'index.html'))
+                    self.assertIn("only its last version will be extracted", cm.output[0])
+                    # Paths outside of the site_dir are still written to disk.
+                    utils.write_file(b'other', os.path.join(tdir, 'other.txt'))
+                finally:
+                    archive.close()
+                self.assertIsNone(SiteArchive.current)
+                self.assertPathNotExists(site_dir)
+                self.assertPathIsFile(tdir, 'other.txt')
+
+                self.assertEqual(sorted(os.listdir(tdir)), sorted(['docs', name, 'other.txt']))
+
+                if name.endswith('.zip'):
+                    with zipfile.ZipFile(path) as zf:
+                        entries = [(info.filename, zf.read(info)) for info in zf.infolist()]
+                    self.assertEqual(
+                        entries,
+                        [
+                            ('img/a.png', b'image'),
+                            ('b.txt', b'chunk1chunk2'),
+                            ('index.html', b'page'),
+                        ],
+                    )
+                else:
+                    with tarfile.open(path) as tf:
+                        entries = [(m.name, tf.extractfile(m).read()) for m in tf.getmembers()]
+                        self.assertEqual(tf.extractfile('index.html').read(), b'page')
+                    self.assertEqual(
+                        entries,
+                        [
+                            ('index.html', b'old page'),
+                            ('img/a.png', b'image'),
+                            ('b.txt', b'chunk1chunk2'),
+                            ('index.html', b'page'),
+                        ],
+                    )
+                os.remove(path)
+                os.remove(os.path.join(tdir, 'other.txt'))
+
+    @tempdir(files={'site.tar': 'old'})
+    def test_discard(self, tdir):
+        path = os.path.join(tdir, 'site.tar')
+        archive = SiteArchive(path, os.path.join(tdir, 'site'))
+        archive.open()
+        utils.write_file(b'page', os.path.join(tdir, 'site', 'index.html'))
+        archive.discard()
+        self.assertIsNone(SiteArchive.current)
+        with open(path) as f:
+            self.assertEqual(f.read(), 'old')
+        self.assertEqual(os.listdir(tdir), ['site.tar'])
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import unittest
+from unittest import mock
+
+import markdown
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils.highlight import HighlightCache
+
+try:
+    import pygments  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    pygments = None  # type: ignore[assignment]
+
+
+@unittest.skipIf(pygments is None, "Pygments is not installed")
+class HighlightCacheTests(unittest.TestCase):
+    def _render(self, source, **options):
+        md = markdown.Markdown(
+            extensions=['fenced_code', 'codehilite'], extension_configs={'codehilite': options}
+        )
+        return md.convert(source)
+
+    @tempdir()
+    def test_highlight_cache(self, cache_dir):
+        source = '```python\nprint("hello")\n```'
+        expected = self._render(source)
+        from markdown.extensions import codehilite
+
+        cache = HighlightCache(cache_dir)
+        with cache.activate():
+            self.assertEqual(self._render(source), expected)
+            self.assertEqual(self._render(source), expected)
+            # Different options are a different entry.
+            self.assertNotEqual(self._render(source, linenums=True), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+        self.assertIs(codehilite.highlight, pygments.highlight)
+
+        # Another process reuses the highlighted code from the cache directory.
+        cache = HighlightCache(cache_dir)
+        with mock.patch.object(pygments, 'highlight', wraps=pygments.highlight) as mock_highlight:
+            with mock.patch.object(codehilite, 'highlight', mock_highlight):
+                with cache.activate():
+                    self.assertEqual(self._render(source), expected)
+                    self.assertEqual(
+                        self._render('```python\nx = 1\n```'), self._render('```python\nx = 1\n```')
+                    )
+        self.assertEqual(mock_highlight.call_count, 1)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_highlight_cache_in_memory(self):
+        source = '```python\nprint("hello")\n```'
+        cache = HighlightCache()
+        with cache.activate():
+            self.assertEqual(self._render(source), self._render(source))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
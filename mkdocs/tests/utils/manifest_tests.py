@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import hashlib
+import os
+import unittest
+from unittest import mock
+
+from mkdocs.tests.base import tempdir
+from mkdocs.utils import manifest
+
+
+class ManifestTests(unittest.TestCase):
+    def test_content_type(self):
+        for name, expected in [
+            ('index.html', 'text/html'),
+            ('img/a.PNG', 'image/png'),
+            ('sitemap.xml.gz', 'application/gzip'),
+            ('CNAME', 'application/octet-stream'),
+        ]:
+            with self.subTest(name):
+                self.assertEqual(manifest.content_type(name), expected)
+
+    @tempdir(files={'index.html': 'page', 'img/a.png': 'image', 'manifest.json': '{}'})
+    def test_build_manifest(self, site_dir):
+        files = manifest.build_manifest(site_dir, exclude=os.path.join(site_dir, 'manifest.json'))
+        self.assertEqual(list(files), ['index.html', 'img/a.png'])
+        self.assertEqual(files['index.html']['size'], 4)
+        self.assertEqual(files['index.html']['sha256'], hashlib.sha256(b'page').hexdigest())
+        self.assertEqual(files['img/a.png']['content_type'], 'image/png')
+
+        # Unchanged files aren't read again.
+        with open(os.path.join(site_dir, 'index.html'), 'w') as f:
+            f.write('edit')
+        with mock.patch.object(manifest, '_file_sha256', return_value='new') as mock_hash:
+            new_files = manifest.build_manifest(site_dir, files)
+        mock_hash.assert_has_calls([mock.call(os.path.join(site_dir, 'index.html'))])
+        self.assertEqual(mock_hash.call_count, 2)  # index.html, manifest.json
+        self.assertEqual(new_files['index.html']['sha256'], 'new')
+        self.assertEqual(new_files['img/a.png'], files['img/a.png'])
+
+    @tempdir(files={'site/index.html': 'page'})
+    def test_write_output_manifest(self, tdir):
+        path = os.path.join(tdir, 'out', 'manifest.json')
+        manifest.write_output_manifest(os.path.join(tdir, 'site'), path)
+        files = manifest.load_manifest(path)
+        self.assertEqual(list(files), ['index.html'])
+        self.assertEqual(os.listdir(os.path.join(tdir, 'out')), ['manifest.json'])
+
+    @tempdir(files={'a.json': '{"files": {}}', 'b.json': 'foo'})
+    def test_load_invalid_manifest(self, tdir):
+        for name, msg in [
+            ('a.json', 'is a manifest of an unsupported version: None'),
+            ('b.json', 'is not a valid manifest: Expecting value'),
+        ]:
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, msg):
+                    manifest.load_manifest(os.path.join(tdir, name))
+
+    def test_diff_manifests(self):
+        def entry(sha256, content_type='text/html'):
+            return manifest.ManifestEntry(
+                size=1, sha256=sha256, content_type=content_type, mtime_ns=0
+            )
+
+        old = {'a': entry('1'), 'b': entry('2'), 'c': entry('3'), 'd': entry('4')}
+        new = {'e': entry('5'), 'b': entry('2'), 'c': entry('3', 'text/plain'), 'a': entry('9')}
+        new['b']['mtime_ns'] = 1
+        self.assertEqual(
+            manifest.diff_manifests(old, new),
+            manifest.ManifestDiff(added=['e'], changed=['a', 'c'], removed=['d']),
+        )
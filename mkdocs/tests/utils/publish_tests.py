@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+
+import os
+import unittest
+from unittest import mock
+
+from mkdocs.tests.base import PathAssertionMixin, tempdir
+from mkdocs.utils.publish import StagingDirectory
+
+
+class StagingDirectoryTests(PathAssertionMixin, unittest.TestCase):
+    def _publish(self, staging):
+        thread = staging.publish()
+        if thread is not None:
+            thread.join()
+
+    @tempdir()
+    def test_publish_new(self, root_dir):
+        staging = StagingDirectory(os.path.join(root_dir, 'site'))
+        staging.prepare()
+        self.assertPathIsDir(root_dir, '.site.staging')
+        with open(os.path.join(staging.path, 'index.html'), 'w') as f:
+            f.write('new')
+        self._publish(staging)
+        self.assertPathIsFile(root_dir, 'site', 'index.html')
+        self.assertEqual(os.listdir(root_dir), ['site'])
+
+    @tempdir(files={'site/index.html': 'old', 'site/old.html': 'old'})
+    def test_publish_replace(self, root_dir):
+        for exchange in True, False:
+            with self.subTest(exchange=exchange):
+                staging = StagingDirectory(os.path.join(root_dir, 'site'))
+                staging.prepare()
+                with open(os.path.join(staging.path, 'index.html'), 'w') as f:
+                    f.write('new')
+                if exchange:
+                    self._publish(staging)
+                else:
+                    with mock.patch('mkdocs.utils.publish._exchange', return_value=False):
+                        self._publish(staging)
+                self.assertEqual(os.listdir(root_dir), ['site'])
+                self.assertEqual(os.listdir(os.path.join(root_dir, 'site')), ['index.html'])
+
+    @tempdir(files={'site/index.html': 'old', '.site.staging/a.html': '', '.site.old-1/b.html': ''})
+    def test_prepare_removes_leftovers(self, root_dir):
+        staging = StagingDirectory(os.path.join(root_dir, 'site'))
+        staging.prepare()
+        self.assertEqual(os.listdir(staging.path), [])
+        staging.discard()
+        for name in os.listdir(root_dir):
+            if name.startswith('.site.old-'):
+                # Removed in the background.
+                continue
+            self.assertEqual(name, 'site')
+        self.assertPathIsFile(root_dir, 'site', 'index.html')
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+import os
+import unittest
+
+from mkdocs import utils
+from mkdocs.tests.base import PathAssertionMixin, tempdir
+from mkdocs.utils.sync import FileSync, SyncStats
+
+
+class FileSyncTests(PathAssertionMixin, unittest.TestCase):
+    def _sync(self, src_dir, site_dir, manifest, names, **kwargs):
+        sync = FileSync(site_dir, manifest, **kwargs)
+        return sync.sync([(os.path.join(src_dir, name), name) for name in names])
+
+    def _touch(self, path, offset):
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + offset))
+
+    @tempdir(files={'a.png': 'aaaa', 'img/b.pdf': 'bb'})
+    @tempdir()
+    @tempdir()
+    def test_copy_then_skip(self, cache_dir, site_dir, src_dir):
+        manifest = os.path.join(cache_dir, 'static_files.json')
+        stats = self._sync(src_dir, site_dir, manifest, ['a.png', 'img/b.pdf'])
+        self.assertEqual(stats.skipped, 0)
+        self.assertEqual(stats.copied + stats.linked, 6)
+        self.assertPathIsFile(site_dir, 'img', 'b.pdf')
+        self.assertPathIsFile(manifest)
+
+        stats = self._sync(src_dir, site_dir, manifest, ['a.png', 'img/b.pdf'])
+        self.assertEqual(stats, SyncStats(skipped=6))
+
+    @tempdir(files={'a.png': 'aaaa', 'b.png': 'bb'})
+    @tempdir()
+    @tempdir()
+    def test_copy_modified(self, cache_dir, site_dir, src_dir):
+        manifest = os.path.join(cache_dir, 'static_files.json')
+        self._sync(src_dir, site_dir, manifest, ['a.png', 'b.png'])
+        with open(os.path.join(src_dir, 'a.png'), 'w') as f:
+            f.write('new')
+        stats = self._sync(src_dir, site_dir, manifest, ['a.png', 'b.png'])
+        self.assertEqual(stats.skipped, 2)
+        self.assertEqual(stats.copied + stats.linked, 3)
+        with open(os.path.join(site_dir, 'a.png')) as f:
+            self.assertEqual(f.read(), 'new')
+
+    @tempdir(files={'a.png': 'aaaa'})
+    @tempdir()
+    @tempdir()
+    def test_copy_modified_destination(self, cache_dir, site_dir, src_dir):
+        manifest = os.path.join(cache_dir, 'static_files.json')
+        self._sync(src_dir, site_dir, manifest, ['a.png'])
+        with open(os.path.join(site_dir, 'a.png'), 'w') as f:
+            f.write('overwritten')
+        stats = self._sync(src_dir, site_dir, manifest, ['a.png'])
+        self.assertEqual(stats.skipped, 0)
+        with open(os.path.join(site_dir, 'a.png')) as f:
+            self.assertEqual(f.read(), 'aaaa')
+
+    @tempdir(files={'a.png': 'aaaa'})
+    @tempdir()
+    @tempdir()
+    def test_checksum(self, cache_dir, site_dir, src_dir):
+        manifest = os.path.join(cache_dir, 'static_files.json')
+        src = os.path.join(src_dir, 'a.png')
+        self._sync(src_dir, site_dir, manifest, ['a.png'], checksum=True)
+        self._touch(src, 10**9)
+        stats = self._sync(src_dir, site_dir, manifest, ['a.png'], checksum=True)
+        self.assertEqual(stats, SyncStats(skipped=4))
+
+        # Without checksums, a changed mtime is enough to copy the file again.
+        self._touch(src, 10**9)
+        stats = self._sync(src_dir, site_dir, manifest, ['a.png'])
+        self.assertEqual(stats.skipped, 0)
+
+    @tempdir(files={'a.png': 'aaaa'})
+    @tempdir()
+    def test_hardlink(self, site_dir, src_dir):
+        stats = self._sync(src_dir, site_dir, None, ['a.png'], hardlink=True)
+        self.assertEqual(stats, SyncStats(linked=4))
+        src, dest = os.path.join(src_dir, 'a.png'), os.path.join(site_dir, 'a.png')
+        self.assertTrue(os.path.samefile(src, dest))
+
+        # Writing the output never modifies the linked source file.
+        utils.write_file(b'page', dest)
+        with open(src) as f:
+            self.assertEqual(f.read(), 'aaaa')
+
+    @tempdir(files={'a.png': 'aaaa', 'b.png': 'bb'})
+    @tempdir()
+    @tempdir()
+    def test_remove_stale(self, cache_dir, site_dir, src_dir):
+        manifest = os.path.join(cache_dir, 'static_files.json')
+        self._sync(src_dir, site_dir, manifest, ['a.png', 'b.png'])
+
+        sync = FileSync(site_dir, manifest)
+        self.assertEqual(sync.tracked_paths(), {'a.png', 'b.png'})
+        sync.sync([(os.path.join(src_dir, 'a.png'), 'a.png')], dirty=True)
+        self.assertPathIsFile(site_dir, 'b.png')
+        self.assertEqual(sync.tracked_paths(), {'a.png', 'b.png'})
+
+        sync.sync([(os.path.join(src_dir, 'a.png'), 'a.png')])
+        self.assertPathNotExists(site_dir, 'b.png')
+        self.assertEqual(sync.tracked_paths(), {'a.png'})
+
+    @tempdir(files={'a.png': 'aaaa'})
+    @tempdir()
+    @tempdir()
+    @tempdir()
+    def test_manifest_of_other_directory(self, cache_dir, other_dir, site_dir, src_dir):
+        manifest = os.path.join(cache_dir, 'static_files.json')
+        self._sync(src_dir, other_dir, manifest, ['a.png'])
+        self.assertEqual(FileSync(site_dir, manifest).tracked_paths(), set())
+
+    @tempdir(files={'a.png': 'aaaa'})
+    @tempdir(files={'a.png': 'old'})
+    def test_dirty_without_manifest(self, site_dir, src_dir):
+        self._touch(os.path.join(site_dir, 'a.png'), 10**9)
+        sync = FileSync(site_dir)
+        stats = sync.sync([(os.path.join(src_dir, 'a.png'), 'a.png')], dirty=True)
+        self.assertEqual(stats, SyncStats(skipped=4))
+        with open(os.path.join(site_dir, 'a.png')) as f:
+            self.assertEqual(f.read(), 'old')
+
+        stats = FileSync(site_dir).sync([(os.path.join(src_dir, 'a.png'), 'a.png')])
+        self.assertEqual(stats.skipped, 0)
+
+    def test_stats_str(self):
+        self.assertEqual(
+            str(SyncStats(copied=512, linked=3 * 1024**2, skipped=5 * 1024**3)),
+            '512 B copied, 3.0 MiB linked, 5.0 GiB skipped',
+        )
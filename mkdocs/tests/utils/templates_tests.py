@@ -1,9 +1,14 @@
+import os
 import unittest
 from textwrap import dedent
+from unittest import mock
 
+import jinja2
 import yaml
 
-from mkdocs.tests.base import load_config
+from mkdocs.structure.files import File, Files
+from mkdocs.structure.nav import get_navigation
+from mkdocs.tests.base import load_config, tempdir
 from mkdocs.utils import templates
 
 
@@ -47,3 +52,159 @@ class UtilsTemplatesTests(unittest.TestCase):
                 '<script src="here/plain_string.mjs"></script>',
             ],
         )
+
+    @tempdir(files={'page.html': '{% trans %}Hello{% endtrans %}, {{ name }}!'})
+    @tempdir()
+    @mock.patch.object(templates.BytecodeCache, '_memory', {})
+    def test_bytecode_cache(self, cache_dir, templates_dir):
+        def render(bytecode_cache, newstyle=False):
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(templates_dir),
+                bytecode_cache=bytecode_cache,
+                extensions=['jinja2.ext.i18n'],
+            )
+            env.install_null_translations(newstyle=newstyle)  # type: ignore[attr-defined]
+            return env.get_template('page.html').render(name='World')
+
+        cache = templates.BytecodeCache(os.path.join(cache_dir, 'jinja'))
+        with mock.patch.object(cache, 'dump_bytecode', wraps=cache.dump_bytecode) as mock_dump:
+            self.assertEqual(render(cache), 'Hello, World!')
+            self.assertEqual(render(cache), 'Hello, World!')
+            mock_dump.assert_called_once()
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir, 'jinja'))), 1)
+
+        # Another process reads the compiled template from the directory.
+        templates.BytecodeCache._memory.clear()
+        cache = templates.BytecodeCache(os.path.join(cache_dir, 'jinja'))
+        with mock.patch.object(jinja2.Environment, 'compile') as mock_compile:
+            self.assertEqual(render(cache), 'Hello, World!')
+        mock_compile.assert_not_called()
+
+        # Differently configured environments compile the template differently.
+        self.assertEqual(render(cache, newstyle=True), 'Hello, World!')
+        self.assertEqual(len(templates.BytecodeCache._memory), 2)
+
+        with open(os.path.join(templates_dir, 'page.html'), 'w') as f:
+            f.write('Bye, {{ name }}!')
+        self.assertEqual(render(cache), 'Bye, World!')
+
+    @tempdir(files={'page.html': '{{ name|greet }}'})
+    @tempdir()
+    @mock.patch.object(templates.BytecodeCache, '_memory', {})
+    def test_bytecode_cache_filters(self, cache_dir, templates_dir):
+        def render(greet):
+            env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(templates_dir),
+                bytecode_cache=templates.BytecodeCache(os.path.join(cache_dir, 'jinja')),
+            )
+            env.filters['greet'] = greet
+            return env.get_template('page.html').render(name='World', greeting='Hi')
+
+        self.assertEqual(render(lambda value: f'Hello, {value}!'), 'Hello, World!')
+        # A filter that takes the context is called differently by the compiled code.
+        greet = templates.contextfilter(lambda context, value: f"{context['greeting']}, {value}!")
+        self.assertEqual(render(greet), 'Hi, World!')
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir, 'jinja'))), 2)
+
+    def test_nav_fragment(self):
+        config = load_config(
+            nav=[
+                {'Home': 'index.md'},
+                {'A': [{'One': 'a/one.md'}, {'Two': 'a/two.md'}]},
+                {'B': [{'Three': 'b/three.md'}, {'Link': 'https://example.com/'}]},
+            ]
+        )
+        files = Files(
+            [
+                File(name, config.docs_dir, config.site_dir, config.use_directory_urls)
+                for name in ('index.md', 'a/one.md', 'a/two.md', 'b/three.md')
+            ]
+        )
+        nav = get_navigation(files, config)
+        env = jinja2.Environment(autoescape=True, extensions=[templates.NavFragmentExtension])
+        env.filters['url'] = templates.url_filter
+        rendered = []
+        env.globals['rendered'] = lambda item: rendered.append(item.title) or ''
+        template = env.from_string(
+            dedent(
+                '''
+                {%- for nav_item in nav %}
+                {%- navfragment nav_item %}
+                {{ rendered(nav_item) }}<a href="{{ nav_item.url|url }}">{{ nav_item.title }}</a>
+                {%- for nav_item in nav_item.children or [] %}
+                {%- navfragment nav_item %}
+                {{ rendered(nav_item) }}<a href="{{ nav_item.url|url }}"
+                {%- if nav_item.active %} class="active"{% endif %}>{{ nav_item.title }}</a>
+                {%- endnavfragment %}
+                {%- endfor %}
+                {%- endnavfragment %}
+                {%- endfor %}
+                '''
+            )
+        )
+
+        def render_pages():
+            output = []
+            for page in nav.pages:
+                page.active = True
+                output.append(template.render(nav=nav, page=page, base_url='unused'))
+                page.active = False
+            output.append(template.render(nav=nav, page=None, base_url='/root'))
+            return output
+
+        with mock.patch.object(
+            templates.NavFragmentExtension, '_render', lambda *args, caller: caller()
+        ):
+            expected = render_pages()
+        self.assertIn('<a href="./" class="active">Two</a>', expected[2])
+        self.assertIn('<a href="../../b/three/">Three</a>', expected[2])
+        self.assertIn('<a href="/root/a/two/">Two</a>', expected[4])
+
+        rendered.clear()
+        self.assertEqual(render_pages(), expected)
+        # An item is rendered for every page where it's active, and once for all the other pages.
+        # Items in a section that isn't active are rendered with the section, and once more on
+        # their own when the section is active.
+        self.assertEqual(
+            sorted(rendered),
+            ['A'] * 3
+            + ['B'] * 2
+            + ['Home'] * 2
+            + ['Link'] * 2
+            + ['One'] * 3
+            + ['Three'] * 2
+            + ['Two'] * 3,
+        )
+
+    def test_nav_fragment_replaced_url_filter(self):
+        env = jinja2.Environment(extensions=[templates.NavFragmentExtension])
+        env.filters['url'] = templates.contextfilter(
+            lambda context, value: f"{context['page']}/{value}"
+        )
+        template = env.from_string(
+            '{% navfragment nav_item %}{{ nav_item|url }}{% endnavfragment %}'
+        )
+        self.assertEqual(template.render(nav_item='item', page='a'), 'a/item')
+        self.assertEqual(template.render(nav_item='item', page='b'), 'b/item')
+
+    @tempdir(files={'nav.html': '{{ page }}'})
+    @tempdir(
+        files={
+            'base.html': "{% navfragment nav_item %}{% include 'nav.html' %}{% endnavfragment %}",
+            'nav.html': '{{ page }}',
+        }
+    )
+    def test_nav_fragment_overridden_template(self, theme_dir, custom_dir):
+        for dirs, expected in (
+            ([theme_dir], ['a', 'a']),
+            ([custom_dir, theme_dir], ['a', 'b']),
+        ):
+            with self.subTest(dirs=dirs):
+                env = jinja2.Environment(
+                    loader=jinja2.FileSystemLoader(dirs),
+                    extensions=[templates.NavFragmentExtension],
+                )
+                env.filters['url'] = templates.url_filter
+                template = env.get_template('base.html')
+                rendered = [template.render(nav_item='item', page=page) for page in 'ab']
+                self.assertEqual(rendered, expected)
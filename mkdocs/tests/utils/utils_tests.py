@@ -110,6 +110,17 @@ class UtilsTests(unittest.TestCase):
         self.assertEqual(utils.get_relative_url('/', '.'), './')
         self.assertEqual(utils.get_relative_url('/', '/.'), './')
 
+    def test_get_relative_url_caches_bounded(self):
+        for func in utils._url_node, utils._normalized_url_node, utils._get_norm_url:
+            with self.subTest(func.__name__):
+                self.assertIsNotNone(func.cache_info().maxsize)
+
+        self.assertEqual(utils.get_relative_url('a/b/c.png', 'a/d/'), '../b/c.png')
+        # Nodes that were evicted from the caches still work together with new ones.
+        utils._normalized_url_node.cache_clear()
+        self.assertEqual(utils.get_relative_url('a/b/c.png', 'a/b/e/'), '../c.png')
+        self.assertEqual(utils.get_relative_url('a/d/', 'a/b/c.html'), '../d/')
+
     def test_normalize_url(self):
         def test(path, base, expected):
             self.assertEqual(utils.normalize_url(path, _Page(base)), expected)
@@ -298,6 +309,16 @@ class UtilsTests(unittest.TestCase):
             with self.assertRaises(exceptions.ConfigurationError):
                 utils.yaml_load(fd)
 
+    @tempdir(files=['.hidden', 'a.txt', 'b/c.txt', 'b/d.txt', 'e/f.txt', 'g/h/i.txt'])
+    def test_clean_directory_keep(self, tdir):
+        utils.clean_directory(tdir, keep={'b/c.txt', 'g/h/i.txt', 'missing.txt'})
+        found = sorted(
+            os.path.relpath(os.path.join(root, name), tdir).replace(os.sep, '/')
+            for root, dirs, names in os.walk(tdir)
+            for name in names
+        )
+        self.assertEqual(found, ['.hidden', 'b/c.txt', 'g/h/i.txt'])
+
     @tempdir()
     @tempdir()
     def test_copy_files(self, src_dir, dst_dir):
@@ -449,6 +470,27 @@ class UtilsTests(unittest.TestCase):
         )
         self.assertEqual(meta.get_data(doc), (doc, {}))
 
+    def test_mm_meta_data_crlf(self):
+        doc = 'Title: Foo\r\n    Bar\r\n\r\nDoc\r\nbody'
+        self.assertEqual(meta.get_data(doc), ('Doc\nbody', {'title': 'Foo Bar'}))
+
+    def test_split_data_offset(self):
+        for doc, body, data in [
+            ('---\nfoo: bar\n...\n\nDoc body', 'Doc body', {'foo': 'bar'}),
+            ('---\nfoo: bar\nDoc body', '---\nfoo: bar\nDoc body', {}),
+            ('foo: bar\n\n\nDoc body', 'Doc body', {'foo': 'bar'}),
+            ('foo: bar', '', {'foo': 'bar'}),
+        ]:
+            with self.subTest(doc):
+                offset, result = meta.split_data(doc)
+                self.assertEqual((doc[offset:], result), (body, data))
+
+    def test_yaml_meta_data_cached_copy(self):
+        doc = '---\ntags: [foo]\n---\nDoc body'
+        _, data = meta.get_data(doc)
+        data['tags'].append('bar')
+        self.assertEqual(meta.get_data(doc), ('Doc body', {'tags': ['foo']}))
+
 
 class ThemeUtilsTests(unittest.TestCase):
     def setUp(self):
@@ -155,12 +155,22 @@ class Theme(MutableMapping[str, Any]):
         self.static_templates.update(theme_config.pop('static_templates', []))
         self.__vars.update(theme_config)
 
-    def get_env(self) -> jinja2.Environment:
-        """Return a Jinja environment for the theme."""
+    def get_env(self, bytecode_cache: jinja2.BytecodeCache | None = None) -> jinja2.Environment:
+        """
+        Return a Jinja environment for the theme.
+
+        The templates are compiled only once for the process, unless they change, or also kept
+        compiled by `bytecode_cache` if it's given.
+        """
         loader = jinja2.FileSystemLoader(self.dirs)
         # No autoreload because editing a template in the middle of a build is not useful.
-        env = jinja2.Environment(loader=loader, auto_reload=False)
+        env = jinja2.Environment(
+            loader=loader,
+            auto_reload=False,
+            bytecode_cache=bytecode_cache or templates.BytecodeCache(),
+        )
         env.filters['url'] = templates.url_filter
         env.filters['script_tag'] = templates.script_tag_filter
+        env.add_extension(templates.NavFragmentExtension)
         localization.install_translations(env, self.locale, self.dirs)
         return env
@@ -22,6 +22,84 @@ function applyTopPadding() {
     });
 }
 
+function navItemUrl(url) {
+    // Absolute URLs are used as they are, others are relative to the root of the site.
+    if (/^([a-z][a-z0-9+.-]*:|\/|#)/i.test(url)) {
+        return url;
+    }
+    return base_url.replace(/\/?$/, '/') + url;
+}
+
+function isActiveNavItem(item, pageUrl) {
+    if (item.children) {
+        return item.children.some(function(child) {
+            return isActiveNavItem(child, pageUrl);
+        });
+    }
+    return !item.is_link && item.url === pageUrl;
+}
+
+function createNavLink(item, className, active) {
+    var link = document.createElement('a');
+    link.href = item.children ? '#' : navItemUrl(item.url);
+    link.className = className;
+    if (active) {
+        link.classList.add('active');
+        link.setAttribute('aria-current', 'page');
+    }
+    link.innerHTML = item.title;
+    return link;
+}
+
+function createNavItems(items, pageUrl, level) {
+    // The same markup as `base.html` and `nav-sub.html` render when the navigation is inlined.
+    return items.map(function(item) {
+        var li = document.createElement('li');
+        var active = isActiveNavItem(item, pageUrl);
+        var link;
+        if (level === 0) {
+            li.className = 'nav-item';
+            link = createNavLink(item, 'nav-link', active);
+            if (item.children) {
+                li.classList.add('dropdown');
+                link.classList.add('dropdown-toggle');
+                link.setAttribute('role', 'button');
+                link.setAttribute('data-bs-toggle', 'dropdown');
+                link.setAttribute('aria-expanded', 'false');
+            }
+        } else if (item.children) {
+            li.className = 'dropdown-submenu';
+            link = createNavLink(item, 'dropdown-item', false);
+        } else {
+            link = createNavLink(item, 'dropdown-item', active);
+        }
+        li.appendChild(link);
+        if (item.children) {
+            var menu = document.createElement('ul');
+            menu.className = 'dropdown-menu';
+            createNavItems(item.children, pageUrl, level + 1).forEach(function(child) {
+                menu.appendChild(child);
+            });
+            li.appendChild(menu);
+        }
+        return li;
+    });
+}
+
+function loadNav(container) {
+    // Render the navigation from the JSON file written when `client_navigation` is enabled.
+    return fetch(container.getAttribute('data-mkdocs-nav'))
+        .then(function(response) {
+            return response.json();
+        })
+        .then(function(items) {
+            var pageUrl = container.getAttribute('data-mkdocs-page-url');
+            createNavItems(items, pageUrl, 0).forEach(function(item) {
+                container.appendChild(item);
+            });
+        });
+}
+
 document.addEventListener("DOMContentLoaded", function () {
     var search_term = getSearchTerm();
     var search_modal = new bootstrap.Modal(document.getElementById('mkdocs_search_modal'));
@@ -128,30 +206,41 @@ document.addEventListener("DOMContentLoaded", function () {
         }
     }
 
-    document.querySelectorAll('.dropdown-submenu > a').forEach(function(item) {
-        item.addEventListener('click', function(e) {
-            if (item.nextElementSibling.classList.contains('show')) {
-                hideInnerDropdown(item);
-            } else {
-                showInnerDropdown(item);
-            }
+    function bindDropdowns(root) {
+        root.querySelectorAll('.dropdown-submenu > a').forEach(function(item) {
+            item.addEventListener('click', function(e) {
+                if (item.nextElementSibling.classList.contains('show')) {
+                    hideInnerDropdown(item);
+                } else {
+                    showInnerDropdown(item);
+                }
 
-            e.stopPropagation();
-            e.preventDefault();
+                e.stopPropagation();
+                e.preventDefault();
+            });
         });
-    });
 
-    document.querySelectorAll('.dropdown-menu').forEach(function(menu) {
-        menu.parentElement.addEventListener('hide.bs.dropdown', function() {
-            menu.scrollTop = 0;
-            var dropdown = menu.querySelector('.dropdown-submenu > a');
-            if (dropdown) {
-                dropdown.classList.remove('open');
-            }
-            menu.querySelectorAll('.dropdown-menu .dropdown-menu').forEach(function(submenu) {
-                submenu.classList.remove('show');
+        root.querySelectorAll('.dropdown-menu').forEach(function(menu) {
+            menu.parentElement.addEventListener('hide.bs.dropdown', function() {
+                menu.scrollTop = 0;
+                var dropdown = menu.querySelector('.dropdown-submenu > a');
+                if (dropdown) {
+                    dropdown.classList.remove('open');
+                }
+                menu.querySelectorAll('.dropdown-menu .dropdown-menu').forEach(function(submenu) {
+                    submenu.classList.remove('show');
+                });
             });
         });
+    }
+
+    bindDropdowns(document);
+
+    document.querySelectorAll('[data-mkdocs-nav]').forEach(function(container) {
+        loadNav(container).then(function() {
+            bindDropdowns(container);
+            applyTopPadding();
+        });
     });
 
     applyTopPadding();
@@ -6,3 +6,91 @@
  */
 
 $('div.rst-content table').addClass('docutils');
+
+/*
+ * Render the navigation from the JSON file written when the `client_navigation`
+ * theme option is enabled, with the same markup as `base.html` and `nav.html`
+ * render otherwise. Then call `callback`.
+ */
+
+function navItemUrl(url) {
+    // Absolute URLs are used as they are, others are relative to the root of the site.
+    if (/^([a-z][a-z0-9+.-]*:|\/|#)/i.test(url)) {
+        return url;
+    }
+    return base_url.replace(/\/?$/, '/') + url;
+}
+
+function isActiveNavItem(item, options) {
+    if (item.children) {
+        return item.children.some(function (child) {
+            return isActiveNavItem(child, options);
+        });
+    }
+    return !item.is_link && item.url === options.pageUrl;
+}
+
+function renderNavItem(item, navlevel, options) {
+    var active = isActiveNavItem(item, options);
+    var link = $('<a>')
+        .attr('class', (item.is_link ? '' : 'reference internal') + (active ? ' current' : ''))
+        .html(item.title);
+    if (!item.children) {
+        link.attr('href', active ? '#' : navItemUrl(item.url));
+    }
+    var nodes = [link];
+    navlevel += 1;
+    if (navlevel <= options.depth) {
+        if (item.children && item.children.length) {
+            nodes.push(renderNavList(item.children, navlevel, options).toggleClass('current', active));
+        } else if (active && options.toc.length) {
+            nodes.push(options.toc);
+        }
+    }
+    return nodes;
+}
+
+function renderNavList(items, navlevel, options) {
+    var list = $('<ul>');
+    items.forEach(function (item) {
+        $('<li>')
+            .addClass('toctree-l' + navlevel)
+            .toggleClass('current', isActiveNavItem(item, options))
+            .append(renderNavItem(item, navlevel, options))
+            .appendTo(list);
+    });
+    return list;
+}
+
+function loadNav(callback) {
+    var container = $('.wy-menu-vertical [data-mkdocs-nav]');
+    if (!container.length) {
+        callback();
+        return;
+    }
+    var options = {
+        pageUrl: container.attr('data-mkdocs-page-url'),
+        homepageUrl: container.attr('data-mkdocs-homepage-url'),
+        depth: parseInt(container.attr('data-navigation-depth'), 10),
+        // The table of contents of the current page is rendered into the page.
+        toc: $('#mkdocs-page-toc').detach().removeAttr('id hidden')
+    };
+    $.getJSON(container.attr('data-mkdocs-nav'))
+        .done(function (items) {
+            items.forEach(function (item) {
+                if (item.children) {
+                    $('<p class="caption"><span class="caption-text"></span></p>')
+                        .children().html(item.title).end()
+                        .appendTo(container);
+                    renderNavList(item.children, 1, options)
+                        .toggleClass('current', isActiveNavItem(item, options))
+                        .appendTo(container);
+                } else if (item.is_link || item.url !== options.homepageUrl) {
+                    renderNavList([item], 1, options)
+                        .toggleClass('current', isActiveNavItem(item, options))
+                        .appendTo(container);
+                }
+            });
+        })
+        .always(callback);
+}
@@ -6,6 +6,7 @@ and structure of the site and pages in the site.
 """
 from __future__ import annotations
 
+import contextlib
 import functools
 import logging
 import os
@@ -17,7 +18,17 @@ import warnings
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import PurePath
-from typing import TYPE_CHECKING, Collection, Iterable, MutableSequence, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Collection,
+    Generic,
+    Iterable,
+    MutableSequence,
+    TypeVar,
+    overload,
+)
 from urllib.parse import urlsplit
 
 if sys.version_info >= (3, 10):
@@ -26,6 +37,7 @@ else:
     from importlib_metadata import EntryPoint, entry_points
 
 from mkdocs import exceptions
+from mkdocs.utils.archive import SiteArchive
 from mkdocs.utils.yaml import get_yaml_loader, yaml_load  # noqa: F401 - legacy re-export
 
 if TYPE_CHECKING:
@@ -115,38 +127,70 @@ def copy_file(source_path: str, output_path: str) -> None:
     Copy source_path to output_path, making sure any parent directories exist.
 
     The output_path may be a directory.
+
+    If the build output goes into an archive, the file is added to the archive instead.
     """
+    if output_path.endswith(('/', os.sep)) or os.path.isdir(output_path):
+        output_path = os.path.join(output_path, os.path.basename(source_path))
+    archive = SiteArchive.current
+    if archive is not None and archive.write_file(output_path, source_path):
+        return
     output_dir = os.path.dirname(output_path)
     os.makedirs(output_dir, exist_ok=True)
-    if os.path.isdir(output_path):
-        output_path = os.path.join(output_path, os.path.basename(source_path))
     shutil.copyfile(source_path, output_path)
 
 
 def write_file(content: bytes, output_path: str) -> None:
-    """Write content to output_path, making sure any parent directories exist."""
+    """
+    Write content to output_path, making sure any parent directories exist.
+
+    If the build output goes into an archive, the content is added to the archive instead.
+    """
+    archive = SiteArchive.current
+    if archive is not None and archive.write_bytes(output_path, content):
+        return
     output_dir = os.path.dirname(output_path)
     os.makedirs(output_dir, exist_ok=True)
+    # Replace rather than truncate an existing file, which may be hardlinked to a source file.
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(output_path)
     with open(output_path, 'wb') as f:
         f.write(content)
 
 
-def clean_directory(directory: str) -> None:
-    """Remove the content of a directory recursively but not the directory itself."""
+def clean_directory(directory: str, keep: Collection[str] = ()) -> None:
+    """
+    Remove the content of a directory recursively but not the directory itself.
+
+    Files whose paths relative to the directory (with '/' separators) are in `keep` are left alone.
+    """
     if not os.path.exists(directory):
         return
 
+    keep_dirs = {posixpath.dirname(path) for path in keep}
+    for path in list(keep_dirs):
+        while path:
+            path = posixpath.dirname(path)
+            keep_dirs.add(path)
+
     for entry in os.listdir(directory):
         # Don't remove hidden files from the directory. We never copy files
         # that are hidden, so we shouldn't delete them either.
         if entry.startswith('.'):
             continue
+        _clean_entry(directory, entry, keep, keep_dirs)
 
-        path = os.path.join(directory, entry)
-        if os.path.isdir(path):
-            shutil.rmtree(path, True)
+
+def _clean_entry(directory: str, rel_path: str, keep: Collection[str], keep_dirs: set[str]) -> None:
+    path = os.path.join(directory, *rel_path.split('/'))
+    if os.path.isdir(path):
+        if rel_path in keep_dirs and not os.path.islink(path):
+            for entry in os.listdir(path):
+                _clean_entry(directory, f'{rel_path}/{entry}', keep, keep_dirs)
         else:
-            os.unlink(path)
+            shutil.rmtree(path, True)
+    elif rel_path not in keep:
+        os.unlink(path)
 
 
 def is_markdown_file(path: str) -> bool:
@@ -166,12 +210,40 @@ def is_error_template(path: str) -> bool:
     return bool(_ERROR_TEMPLATE_RE.match(path))
 
 
-@functools.lru_cache(maxsize=None)
-def _norm_parts(path: str) -> list[str]:
+# The URL caches are bounded, so that they don't keep growing during a long `mkdocs serve` session.
+_URL_CACHE_SIZE = 2**14
+
+
+class _URLNode:
+    """A normalized URL path, as a node in a tree of its parent directories."""
+
+    __slots__ = ('path', 'parent', 'depth')
+
+    path: str
+    parent: _URLNode | None
+    depth: int
+
+    def __init__(self, path: str, parent: _URLNode | None) -> None:
+        self.path = path
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+
+
+_ROOT_URL_NODE = _URLNode('', None)
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _url_node(path: str) -> _URLNode:
     if not path.startswith('/'):
         path = '/' + path
-    path = posixpath.normpath(path)[1:]
-    return path.split('/') if path else []
+    return _normalized_url_node(posixpath.normpath(path)[1:])
+
+
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
+def _normalized_url_node(path: str) -> _URLNode:
+    if not path:
+        return _ROOT_URL_NODE
+    return _URLNode(path, _normalized_url_node(path.rpartition('/')[0]))
 
 
 def get_relative_url(url: str, other: str) -> str:
@@ -189,16 +261,29 @@ def get_relative_url(url: str, other: str) -> str:
     if '.' in basename:
         other = dirname
 
-    other_parts = _norm_parts(other)
-    dest_parts = _norm_parts(url)
-    common = 0
-    for a, b in zip(other_parts, dest_parts):
-        if a != b:
-            break
-        common += 1
-
-    rel_parts = ['..'] * (len(other_parts) - common) + dest_parts[common:]
-    relurl = '/'.join(rel_parts) or '.'
+    # Both paths are nodes of the same tree, so the result only takes walking up from them to
+    # their common ancestor, which doesn't depend on the number of other pages.
+    dest = _url_node(url)
+    base = _url_node(other)
+    common = dest
+    while common.depth > base.depth:
+        common = common.parent  # type: ignore[assignment]
+    levels_up = 0
+    while base.depth > common.depth:
+        base = base.parent  # type: ignore[assignment]
+        levels_up += 1
+    # Paths rather than nodes are compared, as a node evicted from the cache may have been
+    # created again for the same path.
+    while base.path != common.path:
+        base = base.parent  # type: ignore[assignment]
+        common = common.parent  # type: ignore[assignment]
+        levels_up += 1
+
+    rest = dest.path[len(common.path) + 1 :] if common.path else dest.path
+    if rest:
+        relurl = '../' * levels_up + rest
+    else:
+        relurl = '/'.join(['..'] * levels_up) or '.'
     return relurl + '/' if url.endswith('/') else relurl
 
 
@@ -216,7 +301,7 @@ def normalize_url(path: str, page: Page | None = None, base: str = '') -> str:
     return posixpath.join(base, path)
 
 
-@functools.lru_cache(maxsize=None)
+@functools.lru_cache(maxsize=_URL_CACHE_SIZE)
 def _get_norm_url(path: str) -> tuple[str, int]:
     if not path:
         path = '.'
@@ -316,6 +401,17 @@ def get_markdown_title(markdown_src: str) -> str | None:
     return None
 
 
+# Any of these makes `PurePath(path).as_posix()` different from the path itself.
+_UNNORMALIZED_PATH_RE = re.compile(r'//|(?:^|/)\.(?:/|$)|/$' + (r'|[\\:]' if os.sep != '/' else ''))
+
+
+def _as_posix(path: str) -> str:
+    """The same as `PurePath(path).as_posix()`, which is slow for a path that's already normal."""
+    if path and _UNNORMALIZED_PATH_RE.search(path) is None:
+        return path
+    return PurePath(path).as_posix()
+
+
 def find_or_create_node(branch, key):
     """
     Given a list, look for dictionary with a key matching key and return it's
@@ -341,14 +437,22 @@ def nest_paths(paths):
     the pages config.
     """
     nested = []
+    # The branch for each directory, instead of searching for it with `find_or_create_node`.
+    branches = {'': nested}
 
     for path in paths:
-        parts = PurePath(path).parent.parts
-
-        branch = nested
-        for part in parts:
-            part = dirname_to_title(part)
-            branch = find_or_create_node(branch, part)
+        posix_path = _as_posix(path)
+        parent = posixpath.dirname(posix_path) if not posix_path.startswith('/') else None
+        if parent is None or parent not in branches:
+            parent_path = PurePath(path).parent
+            branch = nested
+            for part in parent_path.parts:
+                part = dirname_to_title(part)
+                branch = find_or_create_node(branch, part)
+            if parent is not None:
+                branches[parent] = branch
+        else:
+            branch = branches[parent]
 
         branch.append(path)
 
@@ -398,6 +502,53 @@ class weak_property:
         return self.func(instance)
 
 
+class _slot_property(Generic[T]):
+    """
+    Like `cached_property`, but keeps the value in the slot named `_<name>` instead of `__dict__`.
+
+    With `cache=False` the value is derived on every access, and the slot only holds a value that
+    was assigned explicitly.
+    """
+
+    def __init__(self, func: Callable[[Any], T], *, cache: bool = True) -> None:
+        self.func = func
+        self.cache = cache
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = owner.__dict__[f'_{name}']
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> _slot_property[T]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> T:
+        ...
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return self.slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        value = self.func(instance)
+        if self.cache:
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: object, value: T) -> None:
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance: object) -> None:
+        try:
+            self.slot.__delete__(instance)
+        except AttributeError:
+            if self.cache:
+                raise
+
+
 def __getattr__(name: str):
     if name == 'warning_filter':
         warnings.warn(
@@ -0,0 +1,209 @@
+"""Writing the output of a build into a tar or zip archive instead of the site directory."""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import io
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from typing import IO, BinaryIO, ClassVar, Iterable
+
+log = logging.getLogger(__name__)
+
+# The earliest time that can be stored in a zip file (1980-01-01).
+_DEFAULT_MTIME = 315532800
+
+_FORMATS = {
+    '.zip': 'zip',
+    '.tar': 'tar',
+    '.tar.gz': 'gz',
+    '.tgz': 'gz',
+    '.tar.bz2': 'bz2',
+    '.tar.xz': 'xz',
+}
+
+
+def archive_format(path: str) -> str:
+    """Return the format of an archive ('zip', 'tar', 'gz', 'bz2' or 'xz') from its file name."""
+    name = os.path.basename(path).lower()
+    for suffix, fmt in _FORMATS.items():
+        if name.endswith(suffix):
+            return fmt
+    raise ValueError(
+        f"Unsupported archive type '{path}', the name should end with one of: {', '.join(_FORMATS)}"
+    )
+
+
+class SiteArchive:
+    """
+    An archive that receives the files that a build would write into `site_dir`.
+
+    While it is open, it is the `current` archive: `utils.write_file`, `utils.copy_file` and
+    `File.copy_file` then add their output under `site_dir` to the archive as it is produced,
+    instead of writing it to disk.
+
+    The entries are added in the order in which the build writes them, and all of them get the
+    same modification time - `SOURCE_DATE_EPOCH` if that's set - so that building the same site
+    twice produces the same archive. The archive is written to a temporary file first, which only
+    replaces `path` on `close()`.
+
+    A build may write the same file more than once, with the last version winning, as it does in
+    `site_dir`. A tar file then contains each version, and extracting it keeps the last one. In a
+    zip file, the previous version is left out of the central directory, which is what readers go
+    by, so the archive contains the name only once.
+    """
+
+    current: ClassVar[SiteArchive | None] = None
+    """The archive that outputs are being written into, if any."""
+
+    def __init__(self, path: str, site_dir: str, *, mtime: int | None = None) -> None:
+        self.path = os.path.abspath(path)
+        self.format = archive_format(path)
+        self.site_dir = os.path.abspath(site_dir)
+        if mtime is None:
+            mtime = int(os.environ.get('SOURCE_DATE_EPOCH', _DEFAULT_MTIME))
+        self.mtime = max(mtime, _DEFAULT_MTIME) if self.format == 'zip' else mtime
+        self._names: set[str] = set()
+        self._file: BinaryIO | None = None
+        self._gzip: gzip.GzipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._zip: zipfile.ZipFile | None = None
+
+    def open(self) -> None:
+        """Start writing the archive and make it the `current` one."""
+        if SiteArchive.current is not None:
+            raise RuntimeError("Another archive is being written already.")
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(f'{self.path}.{os.getpid()}.tmp', 'wb')
+        if self.format == 'zip':
+            self._zip = zipfile.ZipFile(self._file, 'w', zipfile.ZIP_DEFLATED)
+        else:
+            fileobj: IO[bytes] = self._file
+            if self.format == 'gz':
+                # Not through `tarfile`, which would store the current time in the gzip header.
+                self._gzip = gzip.GzipFile(
+                    filename='', mode='wb', fileobj=self._file, mtime=self.mtime
+                )
+                fileobj = self._gzip  # type: ignore[assignment]
+            mode = 'w|' if self.format in ('tar', 'gz') else f'w|{self.format}'
+            self._tar = tarfile.open(fileobj=fileobj, mode=mode, format=tarfile.PAX_FORMAT)
+        SiteArchive.current = self
+
+    def close(self) -> None:
+        """Finish writing the archive and put it at its `path`."""
+        self._finish(complete=True)
+
+    def discard(self) -> None:
+        """Stop writing the archive and remove it, leaving any previous file at `path` alone."""
+        self._finish(complete=False)
+
+    def _finish(self, complete: bool) -> None:
+        SiteArchive.current = None
+        if self._file is None:
+            return
+        tmp_path = self._file.name
+        try:
+            for f in self._zip, self._tar, self._gzip, self._file:
+                if f is not None:
+                    f.close()
+        except BaseException:
+            complete = False
+            raise
+        finally:
+            self._file = self._gzip = self._tar = self._zip = None
+            if complete:
+                os.replace(tmp_path, self.path)
+            else:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+    def name_for(self, output_path: str) -> str | None:
+        """Return the name in the archive of a path in `site_dir`, or None if it's outside of it."""
+        rel_path = os.path.relpath(os.path.abspath(output_path), self.site_dir)
+        if rel_path == os.curdir or rel_path.startswith(os.pardir) or os.path.isabs(rel_path):
+            return None
+        return rel_path.replace(os.sep, '/')
+
+    def write_bytes(self, output_path: str, content: bytes) -> bool:
+        """Add an entry with the content. Returns False if `output_path` is outside of `site_dir`."""
+        name = self.name_for(output_path)
+        if name is None:
+            return False
+        if self._zip is not None:
+            with self._open_zip_entry(name, len(content)) as f:
+                f.write(content)
+        else:
+            self._add_tar_entry(name, len(content), io.BytesIO(content))
+        return True
+
+    def write_file(self, output_path: str, source_path: str) -> bool:
+        """Add an entry copied from the source file. Returns False if outside of `site_dir`."""
+        name = self.name_for(output_path)
+        if name is None:
+            return False
+        with open(source_path, 'rb') as src:
+            size = os.fstat(src.fileno()).st_size
+            if self._zip is not None:
+                with self._open_zip_entry(name, size) as f:
+                    shutil.copyfileobj(src, f)
+            else:
+                self._add_tar_entry(name, size, src)
+        return True
+
+    def write_chunks(self, output_path: str, chunks: Iterable[bytes]) -> bool:
+        """Add an entry with the content produced in chunks. Returns False if outside of `site_dir`."""
+        name = self.name_for(output_path)
+        if name is None:
+            return False
+        # A tar entry starts with its size, so the chunks are collected first.
+        with tempfile.SpooledTemporaryFile(max_size=16 * 2**20) as buf:
+            for chunk in chunks:
+                buf.write(chunk)
+            size = buf.tell()
+            buf.seek(0)
+            if self._zip is not None:
+                with self._open_zip_entry(name, size) as f:
+                    shutil.copyfileobj(buf, f)  # type: ignore[misc]
+            else:
+                self._add_tar_entry(name, size, buf)  # type: ignore[arg-type]
+        return True
+
+    def _check_name(self, name: str) -> bool:
+        """Return whether the name was written before, which is logged."""
+        if name not in self._names:
+            self._names.add(name)
+            return False
+        log.info(
+            f"The file '{name}' is written into the archive more than once, "
+            f"only its last version will be extracted."
+        )
+        return True
+
+    def _add_tar_entry(self, name: str, size: int, fileobj: IO[bytes]) -> None:
+        assert self._tar is not None
+        # When extracting, a later entry with the same name overwrites the previous one.
+        self._check_name(name)
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = self.mtime
+        info.mode = 0o644
+        self._tar.addfile(info, fileobj)
+
+    def _open_zip_entry(self, name: str, size: int) -> IO[bytes]:
+        assert self._zip is not None
+        if self._check_name(name):
+            # The previous entry's data stays in the file, but without it in the central
+            # directory the name appears only once, with the content written last.
+            previous = self._zip.NameToInfo.pop(name)
+            self._zip.filelist.remove(previous)
+        info = zipfile.ZipInfo(name, date_time=time.gmtime(self.mtime)[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        info.file_size = size
+        return self._zip.open(info, 'w')
@@ -0,0 +1,247 @@
+"""Committing a built site to a branch with `git fast-import`, sending only the blobs that changed."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shlex
+import subprocess
+import tempfile
+from typing import IO, Dict, NamedTuple, Tuple
+
+log = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 2**20
+
+# The id of the empty blob, used for the '.nojekyll' file.
+_EMPTY_BLOB = 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+
+_BLOB_CACHE_NAME = 'gh_deploy_blobs.json'
+
+Tree = Dict[str, Tuple[str, str]]
+"""The (mode, blob id) of each file in a tree, by its path."""
+
+
+class GitImportError(Exception):
+    """A git command failed."""
+
+
+class _SiteFile(NamedTuple):
+    abs_path: str
+    mode: str
+    blob: str
+
+
+def _git_command(args: tuple[str, ...], shell: bool) -> str | list[str]:
+    # Like `ghp_import` does with its `use_shell` option.
+    if shell:
+        return ' '.join(shlex.quote(arg) for arg in ('git', *args))
+    return ['git', *args]
+
+
+def _git(*args: str, input: bytes | None = None, shell: bool = False) -> bytes:
+    try:
+        proc = subprocess.run(
+            _git_command(args, shell), input=input, capture_output=True, shell=shell
+        )
+    except FileNotFoundError:
+        raise GitImportError("Could not find git - is it installed and on your path?")
+    if proc.returncode != 0:
+        error = proc.stderr.decode('utf-8', 'replace').strip()
+        raise GitImportError(error or f"'git {args[0]}' failed with exit code {proc.returncode}")
+    return proc.stdout
+
+
+def _rev_parse(ref: str, shell: bool = False) -> str | None:
+    try:
+        args = ('rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}')
+        return _git(*args, shell=shell).decode().strip()
+    except GitImportError:
+        return None
+
+
+def _list_tree(commit: str, shell: bool = False) -> Tree:
+    tree: Tree = {}
+    for entry in _git('ls-tree', '-r', '-z', '--full-tree', commit, shell=shell).split(b'\0'):
+        if not entry:
+            continue
+        info, _, path = entry.partition(b'\t')
+        mode, kind, blob = info.decode().split(' ')
+        if kind == 'blob':
+            tree[os.fsdecode(path)] = (mode, blob)
+    return tree
+
+
+def _blob_id(path: str) -> str:
+    """Return the id that git gives to a file's content."""
+    h = hashlib.sha1(f'blob {os.path.getsize(path)}\0'.encode())
+    with open(path, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _quote_path(path: str) -> bytes:
+    if path.startswith('"') or '\n' in path:
+        path = '"' + path.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+    return os.fsencode(path)
+
+
+class _BlobCache:
+    """The blob ids of the files in `site_dir` from the previous deployment, by size and mtime."""
+
+    def __init__(self, cache_dir: str | None) -> None:
+        self.path = os.path.join(cache_dir, _BLOB_CACHE_NAME) if cache_dir else None
+        self.entries: dict[str, list] = {}
+        if self.path and os.path.isfile(self.path):
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                log.debug(f"Not using the cache of blob ids: {e}")
+
+    def get(self, rel_path: str, st: os.stat_result) -> str | None:
+        entry = self.entries.get(rel_path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def save(self, files: dict[str, _SiteFile]) -> None:
+        if not self.path:
+            return
+        entries = {}
+        for rel_path, f in files.items():
+            if f.abs_path:
+                st = os.stat(f.abs_path)
+                entries[rel_path] = [st.st_size, st.st_mtime_ns, f.blob]
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as fp:
+                json.dump(entries, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log.debug(f"Could not save the cache of blob ids: {e}")
+
+
+def _scan_site(site_dir: str, cache: _BlobCache) -> dict[str, _SiteFile]:
+    files: dict[str, _SiteFile] = {}
+    for dirpath, dirnames, filenames in os.walk(site_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            abs_path = os.path.join(dirpath, filename)
+            rel_path = os.path.relpath(abs_path, site_dir).replace(os.sep, '/')
+            mode = '100755' if os.access(abs_path, os.X_OK) else '100644'
+            blob = cache.get(rel_path, os.stat(abs_path)) or _blob_id(abs_path)
+            files[rel_path] = _SiteFile(abs_path, mode, blob)
+    # Like ghp-import does, so that GitHub Pages doesn't process the site with Jekyll.
+    files.setdefault('.nojekyll', _SiteFile('', '100644', _EMPTY_BLOB))
+    return files
+
+
+def _write_data(out: IO[bytes], abs_path: str) -> None:
+    if not abs_path:
+        out.write(b'data 0\n\n')
+        return
+    with open(abs_path, 'rb') as f:
+        out.write(b'data %d\n' % os.fstat(f.fileno()).st_size)
+        while chunk := f.read(_CHUNK_SIZE):
+            out.write(chunk)
+    out.write(b'\n')
+
+
+def commit_site(
+    site_dir: str,
+    *,
+    remote: str,
+    branch: str,
+    message: str,
+    no_history: bool = False,
+    cache_dir: str | None = None,
+    shell: bool = False,
+) -> str | None:
+    """
+    Commit the content of `site_dir` to `branch`, like `ghp_import` does.
+
+    Only the files whose content isn't in the previous commit of the branch are sent to
+    `git fast-import`, and the commit records only the changes from that commit. The branch starts
+    from `remote`'s version of it, if that is known. Returns the id of the new commit, or None if
+    the files are the same as in the previous commit, in which case nothing is committed.
+
+    The blob ids of the files are kept in `cache_dir`, so that files with the same size and
+    modification time as in the previous deployment aren't read again. With `shell`, git is
+    invoked through the shell.
+    """
+    _git('rev-parse', shell=shell)
+    local = _rev_parse(f'refs/heads/{branch}', shell)
+    head = _rev_parse(f'refs/remotes/{remote}/{branch}', shell) or local
+    old_tree = _list_tree(head, shell) if head else {}
+
+    cache = _BlobCache(cache_dir)
+    files = _scan_site(site_dir, cache)
+    new_tree = {rel_path: (f.mode, f.blob) for rel_path, f in files.items()}
+    if head is not None and new_tree == old_tree:
+        if head != local:
+            _git('update-ref', f'refs/heads/{branch}', head, shell=shell)
+        cache.save(files)
+        return None
+
+    parent = None if no_history else head
+    base = old_tree if parent else {}
+    known_blobs = {blob for _, blob in old_tree.values()}
+    ident = _git('var', 'GIT_COMMITTER_IDENT', shell=shell).decode().strip()
+
+    marks: dict[str, int] = {}
+    changes = []
+    # stderr goes to a file, so that the process can't block on it while it's being fed.
+    with tempfile.TemporaryFile() as stderr, subprocess.Popen(
+        _git_command(('fast-import', '--quiet', '--force', '--date-format=raw'), shell),
+        stdin=subprocess.PIPE,
+        stderr=stderr,
+        shell=shell,
+    ) as proc:
+        assert proc.stdin is not None
+        try:
+            for rel_path, f in files.items():
+                if base.get(rel_path) == (f.mode, f.blob):
+                    continue
+                ref = f.blob
+                if f.blob not in known_blobs:
+                    if f.blob not in marks:
+                        marks[f.blob] = len(marks) + 1
+                        proc.stdin.write(b'blob\nmark :%d\n' % marks[f.blob])
+                        _write_data(proc.stdin, f.abs_path)
+                    ref = f':{marks[f.blob]}'
+                path = _quote_path(rel_path)
+                changes.append(b'M %s %s %s\n' % (f.mode.encode(), ref.encode(), path))
+            changes.extend(b'D %s\n' % _quote_path(p) for p in base if p not in files)
+
+            msg = message.encode('utf-8')
+            proc.stdin.write(b'commit refs/heads/%s\n' % branch.encode())
+            proc.stdin.write(b'committer %s\n' % ident.encode())
+            proc.stdin.write(b'data %d\n%s\n' % (len(msg), msg))
+            if parent is not None:
+                proc.stdin.write(b'from %s\n' % parent.encode())
+            proc.stdin.writelines(changes)
+            proc.stdin.write(b'\n')
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        if proc.wait() != 0:
+            stderr.seek(0)
+            error = stderr.read().decode('utf-8', 'replace').strip()
+            raise GitImportError(error or "'git fast-import' failed.")
+
+    cache.save(files)
+    log.debug(
+        f"Committed {len(changes)} changed files of {len(files)} to '{branch}', "
+        f"sending {len(marks)} new blobs."
+    )
+    return _git('rev-parse', f'refs/heads/{branch}', shell=shell).decode().strip()
+
+
+def push_branch(remote: str, branch: str, *, force: bool = False, shell: bool = False) -> None:
+    """Push `branch` to `remote`."""
+    _git('push', remote, branch, *(['--force'] if force else []), shell=shell)
@@ -0,0 +1,147 @@
+"""A cache of code highlighted with Pygments, shared between pages, builds and processes."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+try:
+    import pygments  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover
+    pygments = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from mkdocs.config.defaults import MkDocsConfig
+
+log = logging.getLogger(__name__)
+
+# Markdown extensions that call `highlight` through their own module's namespace.
+_HIGHLIGHT_MODULES = ('markdown.extensions.codehilite', 'pymdownx.highlight')
+
+_MEMORY_SIZE = 2**12
+
+
+class HighlightCache:
+    """
+    The HTML produced by `pygments.highlight`, by the lexer, the formatter and their options, and
+    a hash of the code.
+
+    While the cache is active, Markdown extensions that highlight code with Pygments get the
+    result from the cache if the same code was highlighted the same way before. The results are
+    kept in memory, and also as one file each in `cache_dir` if it's given, which is written
+    atomically, so several processes can share it.
+    """
+
+    def __init__(self, cache_dir: str | None = None) -> None:
+        self.path = os.path.join(cache_dir, 'highlight') if cache_dir else None
+        self._memory: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_config(cls, config: MkDocsConfig) -> HighlightCache | None:
+        if not config.highlight_cache or pygments is None:
+            return None
+        return cls(config.cache_dir)
+
+    @staticmethod
+    def _key(code: str, lexer: Any, formatter: Any) -> str | None:
+        try:
+            description = repr(
+                (
+                    pygments.__version__,
+                    type(lexer).__module__,
+                    type(lexer).__qualname__,
+                    sorted(lexer.options.items()),
+                    type(formatter).__module__,
+                    type(formatter).__qualname__,
+                    sorted(formatter.options.items()),
+                )
+            )
+        except Exception:
+            return None
+        # An option without a meaningful `repr` can't be part of the key.
+        if ' at 0x' in description:
+            return None
+        h = hashlib.sha256(description.encode('utf-8'))
+        h.update(b'\0')
+        h.update(code.encode('utf-8', 'surrogatepass'))
+        return h.hexdigest()
+
+    def _get(self, key: str) -> str | None:
+        if (result := self._memory.get(key)) is not None:
+            return result
+        if self.path:
+            try:
+                with open(os.path.join(self.path, key[:2], key), encoding='utf-8') as f:
+                    result = f.read()
+            except (OSError, ValueError):
+                return None
+            self._remember(key, result)
+        return result
+
+    def _set(self, key: str, result: str) -> None:
+        self._remember(key, result)
+        if not self.path:
+            return
+        path = os.path.join(self.path, key[:2], key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(result)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.debug(f"Could not cache highlighted code: {e}")
+
+    def _remember(self, key: str, result: str) -> None:
+        if len(self._memory) >= _MEMORY_SIZE:
+            del self._memory[next(iter(self._memory))]
+        self._memory[key] = result
+
+    def _highlight(self, original: Callable, code, lexer, formatter, outfile=None):
+        if outfile is not None or not isinstance(code, str):
+            return original(code, lexer, formatter, outfile)
+        key = self._key(code, lexer, formatter)
+        if key is None:
+            return original(code, lexer, formatter)
+        if (result := self._get(key)) is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        result = original(code, lexer, formatter)
+        if isinstance(result, str):
+            self._set(key, result)
+        return result
+
+    @contextlib.contextmanager
+    def activate(self) -> Iterator[None]:
+        """Make the Markdown extensions that highlight code with Pygments use the cache."""
+        # Markdown's own extension is imported up front, as it may not be loaded until the first
+        # page is rendered.
+        importlib.import_module(_HIGHLIGHT_MODULES[0])
+        patched = []
+        for name in _HIGHLIGHT_MODULES:
+            module = sys.modules.get(name)
+            original = getattr(module, 'highlight', None)
+            if original is not None and original is pygments.highlight:
+
+                def highlight(code, lexer, formatter, outfile=None, original=original):
+                    return self._highlight(original, code, lexer, formatter, outfile)
+
+                setattr(module, 'highlight', highlight)
+                patched.append((module, original))
+        try:
+            yield
+        finally:
+            for module, original in patched:
+                setattr(module, 'highlight', original)
+            if self.hits or self.misses:
+                log.debug(
+                    f"Highlighted code: {self.hits} blocks from the cache, {self.misses} new."
+                )
@@ -0,0 +1,143 @@
+"""A manifest of the files in a built site, to find out what changed between two builds."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+from typing import Dict, NamedTuple, TypedDict
+
+log = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+_CHUNK_SIZE = 2**20
+
+_ENCODING_TYPES = {
+    'gzip': 'application/gzip',
+    'bzip2': 'application/x-bzip2',
+    'xz': 'application/x-xz',
+    'br': 'application/x-brotli',
+}
+
+
+class ManifestEntry(TypedDict):
+    size: int
+    sha256: str
+    content_type: str
+    mtime_ns: int
+
+
+Manifest = Dict[str, ManifestEntry]
+"""The entries of a manifest, by the path of the file relative to `site_dir` (with '/')."""
+
+
+class ManifestDiff(NamedTuple):
+    added: list[str]
+    changed: list[str]
+    removed: list[str]
+
+
+def content_type(path: str) -> str:
+    """Return the content type that a file is served with, guessed from its name."""
+    mime_type, encoding = mimetypes.guess_type(path, strict=False)
+    if encoding is not None:
+        return _ENCODING_TYPES.get(encoding, 'application/octet-stream')
+    return mime_type or 'application/octet-stream'
+
+
+def _file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def build_manifest(
+    site_dir: str, previous: Manifest | None = None, *, exclude: str | None = None
+) -> Manifest:
+    """
+    Collect the size, hash and content type of every file in `site_dir`.
+
+    The hash of a file is reused from the `previous` manifest if its size and modification time
+    are still the same, so files that the build skipped aren't read again. `exclude` is a path
+    to leave out, such as the manifest itself.
+    """
+    previous = previous or {}
+    exclude = os.path.abspath(exclude) if exclude else None
+    result: Manifest = {}
+    for dirpath, dirnames, filenames in os.walk(site_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            if exclude is not None and os.path.abspath(path) == exclude:
+                continue
+            st = os.stat(path)
+            rel_path = os.path.relpath(path, site_dir).replace(os.sep, '/')
+            old = previous.get(rel_path)
+            if old is not None and old['size'] == st.st_size and old['mtime_ns'] == st.st_mtime_ns:
+                sha256 = old['sha256']
+            else:
+                sha256 = _file_sha256(path)
+            result[rel_path] = ManifestEntry(
+                size=st.st_size,
+                sha256=sha256,
+                content_type=content_type(filename),
+                mtime_ns=st.st_mtime_ns,
+            )
+    return result
+
+
+def load_manifest(path: str) -> Manifest:
+    """Read a manifest file. Raises `ValueError` if it isn't one."""
+    with open(path, encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"'{path}' is not a valid manifest: {e}")
+    if not isinstance(data, dict) or not isinstance(data.get('files'), dict):
+        raise ValueError(f"'{path}' is not a valid manifest.")
+    if data.get('version') != MANIFEST_VERSION:
+        raise ValueError(
+            f"'{path}' is a manifest of an unsupported version: {data.get('version')!r}"
+        )
+    return data['files']
+
+
+def write_manifest(path: str, files: Manifest) -> None:
+    """Write a manifest file, replacing any previous one only once it's complete."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'files': files}, f, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def write_output_manifest(site_dir: str, path: str) -> None:
+    """Write the manifest of `site_dir` to `path`, reusing hashes from the manifest already there."""
+    previous = None
+    if os.path.isfile(path):
+        try:
+            previous = load_manifest(path)
+        except (OSError, ValueError) as e:
+            log.debug(f"Not reusing the previous output manifest: {e}")
+    files = build_manifest(site_dir, previous, exclude=path)
+    write_manifest(path, files)
+    log.debug(f"Wrote the manifest of {len(files)} output files to '{path}'")
+
+
+def diff_manifests(old: Manifest, new: Manifest) -> ManifestDiff:
+    """Compare two manifests, listing the paths that were added, changed and removed."""
+    added, changed = [], []
+    for rel_path, entry in new.items():
+        old_entry = old.get(rel_path)
+        if old_entry is None:
+            added.append(rel_path)
+        elif any(old_entry.get(k) != entry.get(k) for k in ('size', 'sha256', 'content_type')):
+            changed.append(rel_path)
+    removed = [rel_path for rel_path in old if rel_path not in new]
+    return ManifestDiff(sorted(added), sorted(changed), sorted(removed))
@@ -34,6 +34,8 @@ Extracts, parses and transforms MultiMarkdown style data from documents.
 """
 from __future__ import annotations
 
+import copy
+import functools
 import re
 from typing import Any
 
@@ -52,6 +54,11 @@ YAML_RE = re.compile(r'^-{3}[ \t]*\n(.*?\n)(?:\.{3}|-{3})[ \t]*\n', re.UNICODE |
 META_RE = re.compile(r'^[ ]{0,3}(?P<key>[A-Za-z0-9_-]+):\s*(?P<value>.*)')
 META_MORE_RE = re.compile(r'^([ ]{4}|\t)(\s*)(?P<value>.*)')
 
+# The same as `YAML_RE`, split into the opening line and the first closing line after it, so
+# that the end of the front matter is found without backtracking through it.
+_YAML_START_RE = re.compile(r'-{3}[ \t]*\n')
+_YAML_END_RE = re.compile(r'\n(?:\.{3}|-{3})[ \t]*\n')
+
 
 def get_data(doc: str) -> tuple[str, dict[str, Any]]:
     """
@@ -59,28 +66,51 @@ def get_data(doc: str) -> tuple[str, dict[str, Any]]:
 
     Returns a tuple of document and a data dict.
     """
-    data = {}
-
-    # First try YAML
-    if m := YAML_RE.match(doc):
-        try:
-            data = yaml.load(m.group(1), SafeLoader)
-            if isinstance(data, dict):
-                doc = doc[m.end() :].lstrip('\n')
-            else:
-                data = {}  # type: ignore[unreachable]
-        except Exception:
-            pass
-        return doc, data
+    if (span := _match_yaml(doc)) is None and '\r' in doc:
+        # MultiMarkdown style meta-data is looked for in the document with normalized newlines.
+        doc = doc.replace('\r\n', '\n').replace('\r', '\n')
+    offset, data = _split_yaml(doc, span) if span else _split_multimarkdown(doc)
+    return doc[offset:], data
+
+
+def split_data(doc: str) -> tuple[int, dict[str, Any]]:
+    """
+    Extract meta-data from the start of a text document, without copying the rest of it.
+
+    Returns a tuple of the offset where the document's content starts, and a data dict.
+    Unlike `get_data`, newlines aren't normalized, so a lone carriage return doesn't end a line.
+    """
+    if span := _match_yaml(doc):
+        return _split_yaml(doc, span)
+    return _split_multimarkdown(doc)
+
+
+def _match_yaml(doc: str) -> tuple[int, int, int] | None:
+    """Return the start and end of the YAML front matter's content, and the end of the whole."""
+    if m := _YAML_START_RE.match(doc):
+        if end := _YAML_END_RE.search(doc, m.end()):
+            return m.end(), end.start() + 1, end.end()
+    return None
 
-    # No YAML delimiters. Try MultiMarkdown style
-    lines = doc.replace('\r\n', '\n').replace('\r', '\n').split('\n')
 
+def _split_yaml(doc: str, span: tuple[int, int, int]) -> tuple[int, dict[str, Any]]:
+    data = _load_yaml(doc[span[0] : span[1]])
+    if data is None:
+        return 0, {}
+    return _skip_newlines(doc, span[2]), data
+
+
+def _split_multimarkdown(doc: str) -> tuple[int, dict[str, Any]]:
+    data: dict[str, Any] = {}
     key = None
-    while lines:
-        line = lines.pop(0)
+    pos = 0
+    while pos < len(doc):
+        line_end = doc.find('\n', pos)
+        next_pos = len(doc) if line_end == -1 else line_end + 1
+        line = doc[pos:next_pos].rstrip('\n')
 
         if line.strip() == '':
+            pos = next_pos
             break  # blank line - done
         if m1 := META_RE.match(line):
             key = m1.group('key').lower().strip()
@@ -95,6 +125,27 @@ def get_data(doc: str) -> tuple[str, dict[str, Any]]:
                 # Add another line to existing key
                 data[key] += ' {}'.format(m2.group('value').strip())
             else:
-                lines.insert(0, line)
                 break  # no meta data - done
-    return '\n'.join(lines).lstrip('\n'), data
+        pos = next_pos
+    return _skip_newlines(doc, pos), data
+
+
+def _skip_newlines(doc: str, pos: int) -> int:
+    while doc.startswith('\n', pos):
+        pos += 1
+    return pos
+
+
+def _load_yaml(text: str) -> dict[str, Any] | None:
+    data = _load_yaml_cached(text)
+    # The cached data is shared, so each page gets its own copy to modify.
+    return copy.deepcopy(data) if data is not None else None
+
+
+@functools.lru_cache(maxsize=2**12)
+def _load_yaml_cached(text: str) -> dict[str, Any] | None:
+    try:
+        data = yaml.load(text, SafeLoader)
+    except Exception:
+        return None
+    return data if isinstance(data, dict) else None
@@ -0,0 +1,96 @@
+"""Building into a staging directory, then swapping it into the place of the site directory."""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+# `renameat2` flag to atomically exchange two paths (Linux 3.15+).
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
+
+
+class StagingDirectory:
+    """
+    A hidden sibling of `site_dir` that a build is written into, instead of `site_dir` itself.
+
+    `publish()` then puts it in the place of `site_dir`, so that a web server serving `site_dir`
+    switches from the old site to the complete new one at once. The old tree is removed in a
+    background thread.
+    """
+
+    def __init__(self, site_dir: str) -> None:
+        self.site_dir = os.path.abspath(site_dir)
+        parent, name = os.path.split(self.site_dir)
+        self.path = os.path.join(parent, f'.{name}.staging')
+        self._old_prefix = os.path.join(parent, f'.{name}.old-')
+
+    def prepare(self) -> None:
+        """Create an empty staging directory, removing the leftovers of previous builds."""
+        if os.path.lexists(self.path):
+            log.debug(f"Removing the leftover staging directory '{self.path}'")
+            _remove_tree(self.path)
+        parent = os.path.dirname(self.path)
+        for name in os.listdir(parent) if os.path.isdir(parent) else ():
+            path = os.path.join(parent, name)
+            if path.startswith(self._old_prefix):
+                _remove_tree_async(path)
+        os.makedirs(self.path)
+
+    def publish(self) -> threading.Thread | None:
+        """
+        Put the staging directory in the place of the site directory.
+
+        Returns the thread removing the old site directory, if there was one.
+        """
+        if not os.path.lexists(self.site_dir):
+            os.rename(self.path, self.site_dir)
+            return None
+        old_path = f'{self._old_prefix}{time.time_ns()}'
+        if _exchange(self.path, self.site_dir):
+            os.rename(self.path, old_path)
+        else:
+            # Not atomic, but the site directory is only missing between the two renames.
+            os.rename(self.site_dir, old_path)
+            os.rename(self.path, self.site_dir)
+        return _remove_tree_async(old_path)
+
+    def discard(self) -> None:
+        """Remove the staging directory, leaving the site directory as it was."""
+        _remove_tree(self.path)
+
+
+def _exchange(a: str, b: str) -> bool:
+    """Atomically exchange the two paths, if the platform and file system support it."""
+    if not sys.platform.startswith('linux'):
+        return False
+    import ctypes
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    renameat2 = getattr(libc, 'renameat2', None)
+    if renameat2 is None:
+        return False
+    if renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EINVAL):
+        return False
+    raise OSError(err, os.strerror(err), a, None, b)
+
+
+def _remove_tree(path: str) -> None:
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _remove_tree_async(path: str) -> threading.Thread:
+    log.debug(f"Removing the old site directory '{path}' in the background")
+    thread = threading.Thread(target=_remove_tree, args=(path,), name='mkdocs-remove-old-site')
+    thread.start()
+    return thread
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 import copy
+import re
 from typing import TYPE_CHECKING, Callable
 
 import markdown
+import markdown.extensions.footnotes
+import markdown.postprocessors
+import markdown.serializers
 import markdown.treeprocessors
+from markdown.util import STX
 
 if TYPE_CHECKING:
     from xml.etree import ElementTree as etree
@@ -19,12 +24,82 @@ except AttributeError:
 # TODO: Most of this file will become unnecessary after https://github.com/Python-Markdown/markdown/pull/1441
 
 
+# The postprocessors that only replace placeholders, which all start with `STX`.
+_PLACEHOLDER_POSTPROCESSORS: tuple[type, ...] = (
+    markdown.postprocessors.RawHtmlPostprocessor,
+    markdown.postprocessors.AndSubstitutePostprocessor,
+    markdown.extensions.footnotes.FootnotePostprocessor,
+)
+# TODO: This will become unnecessary after min-versions have Markdown >=3.4
+if isinstance(
+    _unescape_pp := getattr(markdown.postprocessors, 'UnescapePostprocessor', None), type
+):
+    _PLACEHOLDER_POSTPROCESSORS += (_unescape_pp,)
+
+_TAG_RE = re.compile(r'<[^>]*>')
+
+
 def get_heading_text(el: etree.Element, md: markdown.Markdown) -> str:
-    el = copy.deepcopy(el)
-    _remove_anchorlink(el)
-    _remove_fnrefs(el)
-    _extract_alt_texts(el)
-    return _strip_tags(_render_inner_html(el, md))
+    text = _get_inner_text(el, md)
+    if text is None:
+        el = copy.deepcopy(el)
+        _remove_anchorlink(el)
+        _remove_fnrefs(el)
+        _extract_alt_texts(el)
+        text = _render_inner_html(el, md)
+    return _strip_tags(text)
+
+
+def _get_inner_text(el: etree.Element, md: markdown.Markdown) -> str | None:
+    """
+    Return the text of the element like `_render_inner_html` would, without its inner tags.
+
+    The text is collected directly from the element and its children, and the postprocessors
+    only run if there are placeholders to replace. Returns None if the result could differ from
+    rendering the element, such as for unknown postprocessors or comments.
+    """
+    if not all(isinstance(pp, _PLACEHOLDER_POSTPROCESSORS) for pp in md.postprocessors):
+        return None
+    parts: list[str] = []
+    children = list(el)
+    # Same as `_remove_anchorlink`.
+    if children and children[-1].tag == 'a' and children[-1].get('class') == 'headerlink':
+        children.pop()
+    if el.text:
+        parts.append(el.text)
+    for child in children:
+        if not _collect_text(child, parts):
+            return None
+    escape = markdown.serializers._escape_cdata  # type: ignore[attr-defined]
+    text = _unescape(''.join(map(escape, parts)))
+    if STX in text:
+        for pp in md.postprocessors:
+            text = pp.run(text)
+    # A '<' could have matched the '>' of a child's tag when it was rendered.
+    if children and '<' in text:
+        return None
+    return text
+
+
+def _collect_text(el: etree.Element, parts: list[str]) -> bool:
+    tag = el.tag
+    if not isinstance(tag, str) or tag.lower() in ('script', 'style') or '{' in tag:
+        return False
+    if any(STX in value for value in el.attrib.values()):
+        return False
+    if tag == 'sup' and el.get('id', '').startswith('fnref'):
+        pass  # Same as `_remove_fnrefs`.
+    elif tag == 'img':
+        parts.append(el.get('alt') or '')  # Same as `_extract_alt_texts`.
+    else:
+        if el.text:
+            parts.append(el.text)
+        for child in el:
+            if not _collect_text(child, parts):
+                return False
+    if el.tail:
+        parts.append(el.tail)
+    return True
 
 
 def _strip_tags(text: str) -> str:
@@ -33,8 +108,8 @@ def _strip_tags(text: str) -> str:
     while (start := text.find('<!--')) != -1 and (end := text.find('-->', start)) != -1:
         text = text[:start] + text[end + 3 :]
 
-    while (start := text.find('<')) != -1 and (end := text.find('>', start)) != -1:
-        text = text[:start] + text[end + 1 :]
+    # Same as repeatedly cutting from the first '<' to the next '>', but in one pass.
+    text = _TAG_RE.sub('', text)
 
     # Collapse whitespace
     text = ' '.join(text.split())
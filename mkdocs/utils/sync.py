@@ -0,0 +1,321 @@
+"""Copying of static files to the site directory, skipping the ones that haven't changed."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import errno
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import threading
+from typing import Any, Iterable, NamedTuple
+
+log = logging.getLogger(__name__)
+
+# The `FICLONE` ioctl creates a copy-on-write clone of a file (btrfs, XFS, bcachefs, ...).
+_FICLONE = 0x40049409 if sys.platform.startswith('linux') else None
+
+# Errors meaning that a way of copying isn't available here, so the next one should be tried.
+_UNSUPPORTED = frozenset(
+    getattr(errno, name)
+    for name in ('EXDEV', 'EPERM', 'EINVAL', 'ENOTTY', 'EOPNOTSUPP', 'ENOTSUP', 'ENOSYS', 'EMLINK')
+    if hasattr(errno, name)
+)
+
+_MANIFEST_VERSION = 1
+
+
+class SyncStats(NamedTuple):
+    copied: int = 0
+    """Bytes that were copied."""
+    linked: int = 0
+    """Bytes that were hardlinked or cloned without copying the data."""
+    skipped: int = 0
+    """Bytes of files that were already up to date."""
+
+    def __add__(self, other: tuple) -> SyncStats:  # type: ignore[override]
+        return SyncStats(*(a + b for a, b in zip(self, other)))
+
+    def __str__(self) -> str:
+        return ', '.join(f'{_format_size(size)} {name}' for name, size in self._asdict().items())
+
+
+class FileSync:
+    """
+    Copy files into a destination directory using a pool of threads.
+
+    Each file is hardlinked (only if `hardlink` is enabled), cloned with a reflink or
+    `copy_file_range` where the file system supports it, or else copied normally.
+
+    If a `manifest_path` is given, the size and modification time of each source and destination
+    file are recorded there, and on the next sync the files that still match are skipped. With
+    `checksum` enabled, a source file whose modification time changed but whose content hash is
+    the same is skipped as well.
+
+    If `previous_dir` is given, `dest_dir` is a new directory that is going to replace it (see
+    `mkdocs.utils.publish`). Unchanged files are then hardlinked from `previous_dir`, and the
+    manifest keeps describing `previous_dir`.
+    """
+
+    def __init__(
+        self,
+        dest_dir: str,
+        manifest_path: str | None = None,
+        *,
+        previous_dir: str | None = None,
+        hardlink: bool = False,
+        checksum: bool = False,
+        max_workers: int | None = None,
+    ) -> None:
+        self.dest_dir = os.path.abspath(dest_dir)
+        self.manifest_path = manifest_path
+        self.previous_dir = os.path.abspath(previous_dir) if previous_dir else None
+        self.hardlink = hardlink
+        self.checksum = checksum
+        self.max_workers = max_workers
+        self._can_clone = _FICLONE is not None
+        self._can_copy_range = hasattr(os, 'copy_file_range')
+        self._lock = threading.Lock()
+        self._manifest: dict[str, dict] = self._load_manifest()
+
+    def _load_manifest(self) -> dict[str, dict]:
+        if not self.manifest_path:
+            return {}
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.debug(f"Ignoring unreadable static files manifest '{self.manifest_path}': {e}")
+            return {}
+        if data.get('version') != _MANIFEST_VERSION or data.get('dest_dir') != self._manifest_dir:
+            return {}
+        return data.get('files', {})
+
+    def _save_manifest(self) -> None:
+        if not self.manifest_path:
+            return
+        data = {
+            'version': _MANIFEST_VERSION,
+            'dest_dir': self._manifest_dir,
+            'files': self._manifest,
+        }
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        tmp_path = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, self.manifest_path)
+
+    @property
+    def _manifest_dir(self) -> str:
+        return self.previous_dir or self.dest_dir
+
+    def tracked_paths(self) -> set[str]:
+        """Return the destination paths (relative, with '/' separators) recorded by the last sync."""
+        return set(self._manifest)
+
+    def sync(self, files: Iterable[tuple[str, str]], *, dirty: bool = False) -> SyncStats:
+        """
+        Copy each `(abs_src_path, dest_uri)` pair into the destination directory.
+
+        Files recorded by the previous sync but not part of this one are removed, unless `dirty`
+        is true. With `dirty`, a destination file that isn't in the manifest is also considered up
+        to date if it is newer than its source.
+        """
+        by_dest = {dest_uri: src for src, dest_uri in files}
+        old_manifest = self._manifest
+        new_manifest: dict[str, dict] = {}
+
+        def process(item: tuple[str, str]) -> SyncStats:
+            dest_uri, src = item
+            record, stats = self._sync_file(src, dest_uri, old_manifest.get(dest_uri), dirty)
+            if record is not None:
+                with self._lock:
+                    new_manifest[dest_uri] = record
+            return stats
+
+        stats = SyncStats()
+        if len(by_dest) > 1:
+            with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+                for result in executor.map(process, by_dest.items()):
+                    stats += result
+        else:
+            for item in by_dest.items():
+                stats += process(item)
+
+        if dirty:
+            for dest_uri, record in old_manifest.items():
+                new_manifest.setdefault(dest_uri, record)
+        else:
+            for dest_uri in old_manifest.keys() - by_dest.keys():
+                self._remove_stale(dest_uri, old_manifest[dest_uri])
+
+        self._manifest = new_manifest
+        try:
+            self._save_manifest()
+        except OSError as e:
+            log.warning(f"Failed to write the static files manifest: {e}")
+        return stats
+
+    def _sync_file(
+        self, src: str, dest_uri: str, record: dict | None, dirty: bool
+    ) -> tuple[dict | None, SyncStats]:
+        dest = os.path.join(self.dest_dir, *dest_uri.split('/'))
+        src_stat = os.stat(src)
+        dest_stat = _stat_or_none(dest)
+        # The file that may be up to date: the destination itself, or its previous version.
+        existing, existing_stat = dest, dest_stat
+        if dest_stat is None and self.previous_dir is not None and record is not None:
+            existing = os.path.join(self.previous_dir, *dest_uri.split('/'))
+            existing_stat = _stat_or_none(existing)
+
+        if existing_stat is not None:
+            if (
+                existing_stat is dest_stat
+                and os.path.samestat(src_stat, existing_stat)
+                and not self._is_link(record)
+            ):
+                # The source is in the site directory already (e.g. written there by a plugin).
+                return None, SyncStats(skipped=src_stat.st_size)
+            if record is not None and _stat_key(existing_stat) == record['dest']:
+                record = self._check_source(src, src_stat, record)
+                if record is not None and self._reuse(existing, dest):
+                    log.debug(f"Skip copying unmodified file: '{dest_uri}'")
+                    return record, SyncStats(skipped=src_stat.st_size)
+            elif (
+                dirty
+                and record is None
+                and dest_stat is not None
+                and dest_stat.st_mtime >= src_stat.st_mtime
+            ):
+                log.debug(f"Skip copying unmodified file: '{dest_uri}'")
+                return self._make_record(src_stat, dest_stat, src), SyncStats(
+                    skipped=src_stat.st_size
+                )
+
+        log.debug(f"Copying media file: '{dest_uri}'")
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if dest_stat is not None:
+            # Never write through an existing file: it may be a hardlink to a source file.
+            os.unlink(dest)
+        how = self._copy(src, dest)
+        record = self._make_record(src_stat, os.stat(dest), src)
+        record['how'] = how
+        if how == 'copied':
+            return record, SyncStats(copied=src_stat.st_size)
+        return record, SyncStats(linked=src_stat.st_size)
+
+    def _check_source(self, src: str, src_stat: os.stat_result, record: dict) -> dict | None:
+        """Return the record updated for the source file if it is unchanged, otherwise None."""
+        src_key = _stat_key(src_stat)
+        if src_key == record['src']:
+            return record
+        if self.checksum and src_key[0] == record['src'][0]:
+            if _file_digest(src) == record.get('sha256'):
+                return dict(record, src=src_key)
+        return None
+
+    @staticmethod
+    def _reuse(existing: str, dest: str) -> bool:
+        """Hardlink the previous version of a file, unless it is the destination already."""
+        if existing == dest:
+            return True
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        try:
+            os.link(existing, dest)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            return False
+        return True
+
+    @staticmethod
+    def _is_link(record: dict | None) -> bool:
+        return record is not None and record.get('how') == 'hardlinked'
+
+    def _make_record(self, src_stat: os.stat_result, dest_stat: os.stat_result, src: str) -> dict:
+        record: dict[str, Any] = {'src': _stat_key(src_stat), 'dest': _stat_key(dest_stat)}
+        if self.checksum:
+            record['sha256'] = _file_digest(src)
+        return record
+
+    def _copy(self, src: str, dest: str) -> str:
+        if self.hardlink:
+            try:
+                os.link(src, dest)
+                return 'hardlinked'
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED:
+                    raise
+                log.debug(f"Hardlinks are not available, copying files instead: {e}")
+                self.hardlink = False
+
+        with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+            if self._can_clone:
+                import fcntl
+
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())  # type: ignore[arg-type]
+                    return 'cloned'
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED:
+                        raise
+                    self._can_clone = False
+            if self._can_copy_range:
+                try:
+                    _copy_range(fsrc.fileno(), fdst.fileno())
+                    return 'copied'
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED:
+                        raise
+                    self._can_copy_range = False
+                    fsrc.seek(0)
+                    fdst.seek(0)
+                    fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+        return 'copied'
+
+    def _remove_stale(self, dest_uri: str, record: dict) -> None:
+        dest = os.path.join(self.dest_dir, *dest_uri.split('/'))
+        try:
+            if _stat_key(os.stat(dest)) == record['dest']:
+                log.debug(f"Removing stale file: '{dest_uri}'")
+                os.unlink(dest)
+        except OSError:
+            pass
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _stat_key(st: os.stat_result) -> list[int]:
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _copy_range(src_fd: int, dest_fd: int) -> None:
+    while os.copy_file_range(src_fd, dest_fd, 1 << 30):  # type: ignore[attr-defined]
+        pass
+
+
+def _format_size(size: float) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if size < 1024 or unit == 'GiB':
+            break
+        size /= 1024
+    return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
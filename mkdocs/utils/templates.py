@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence, TypedDict
+import logging
+import os
+import re
+from typing import TYPE_CHECKING, Any, Callable, Sequence, TypedDict
 
 if TYPE_CHECKING:
     import datetime
 
-from markupsafe import Markup
+import jinja2
+import jinja2.ext
+from jinja2 import nodes
+from markupsafe import Markup, escape
 
 try:
     from jinja2 import pass_context as contextfilter  # type: ignore
@@ -21,6 +27,16 @@ if TYPE_CHECKING:
     from mkdocs.structure.nav import Navigation
     from mkdocs.structure.pages import Page
 
+log = logging.getLogger(__name__)
+
+_BYTECODE_MEMORY_SIZE = 2**10
+
+# Stands for a URL in a cached fragment of the nav, until it's made relative to the current page.
+_NAV_URL_PLACEHOLDER = '\x02mkdocs-nav-url:{}\x03'
+_NAV_URL_PLACEHOLDER_RE = re.compile('\x02mkdocs-nav-url:([0-9]+)\x03')
+# The templates that themes include to render the items of the nav.
+_NAV_TEMPLATES = ('nav.html', 'nav-sub.html')
+
 
 class TemplateContext(TypedDict):
     nav: Navigation
@@ -37,6 +53,10 @@ class TemplateContext(TypedDict):
 @contextfilter
 def url_filter(context: TemplateContext, value: str) -> str:
     """A Template filter to normalize URLs."""
+    environment = getattr(context, 'environment', None)
+    nav_fragments = getattr(environment, 'mkdocs_nav_fragments', None)
+    if nav_fragments is not None and nav_fragments._urls is not None:
+        return nav_fragments._defer_url(str(value), context.eval_ctx.autoescape)  # type: ignore[attr-defined]
     return normalize_url(str(value), page=context['page'], base=context['base_url'])
 
 
@@ -53,3 +73,222 @@ def script_tag_filter(context: TemplateContext, extra_script: ExtraScriptValue)
             html += ' async'
     html += '></script>'
     return Markup(html).format(url_filter(context, str(extra_script)), extra_script)
+
+
+# The attributes that Jinja 2 uses instead of `jinja_pass_arg`.
+_LEGACY_PASS_ARGS = (
+    'contextfilter',
+    'evalcontextfilter',
+    'environmentfilter',
+    'contextfunction',
+    'evalcontextfunction',
+    'environmentfunction',
+)
+
+
+def _pass_arg(func: Any) -> str | None:
+    """Return which argument Jinja passes first to a filter or test, if any."""
+    pass_arg = getattr(func, 'jinja_pass_arg', None)
+    if pass_arg is not None:
+        return pass_arg.name
+    for name in _LEGACY_PASS_ARGS:
+        if getattr(func, name, False) is True:
+            return name
+    return None
+
+
+def _environment_key(environment: jinja2.Environment) -> str:
+    """
+    Describe the settings of `environment` that are known to change the compiled code of a template.
+
+    These are the syntax and the options of the environment, its extensions, and the names of its
+    filters and tests together with the argument that Jinja passes to each of them first, if any.
+    """
+
+    def describe(value):
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        return f'{getattr(value, "__module__", "")}.{getattr(value, "__qualname__", type(value))}'
+
+    return repr(
+        (
+            environment.block_start_string,
+            environment.block_end_string,
+            environment.variable_start_string,
+            environment.variable_end_string,
+            environment.comment_start_string,
+            environment.comment_end_string,
+            environment.line_statement_prefix,
+            environment.line_comment_prefix,
+            environment.trim_blocks,
+            environment.lstrip_blocks,
+            environment.newline_sequence,
+            environment.keep_trailing_newline,
+            environment.optimized,
+            environment.is_async,
+            describe(environment.autoescape),
+            describe(environment.finalize),
+            sorted(environment.extensions),
+            getattr(environment, 'newstyle_gettext', None),
+            describe(environment.code_generator_class),
+            sorted((name, _pass_arg(f)) for name, f in environment.filters.items()),
+            sorted((name, _pass_arg(f)) for name, f in environment.tests.items()),
+        )
+    )
+
+
+class BytecodeCache(jinja2.BytecodeCache):
+    """
+    Templates compiled by Jinja, kept for the process and also in `directory` if it's given.
+
+    A template is compiled again only if its source changed, so the rebuilds of `mkdocs serve`
+    and the later builds with the same `cache_dir` don't compile the theme's templates again.
+    Unlike Jinja's own caches, the settings of the environment that the compiled code is known to
+    depend on are a part of the key, see `_environment_key`. So a template is also compiled again
+    if a plugin replaces a filter by one that takes the context differently, for example.
+    """
+
+    _memory: dict[str, bytes] = {}
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory
+
+    @classmethod
+    def for_config(cls, config: MkDocsConfig) -> BytecodeCache:
+        cache_dir = config.get('cache_dir')
+        return cls(os.path.join(cache_dir, 'jinja') if cache_dir else None)
+
+    def get_bucket(
+        self, environment: jinja2.Environment, name: str, filename: str | None, source: str
+    ) -> jinja2.bccache.Bucket:
+        name = f'{_environment_key(environment)}|{name}'
+        return super().get_bucket(environment, name, filename, source)
+
+    def load_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        data = self._memory.get(bucket.key)
+        if data is None and self.directory:
+            try:
+                with open(os.path.join(self.directory, bucket.key), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                return
+            self._remember(bucket.key, data)
+        if data is not None:
+            bucket.bytecode_from_string(data)
+
+    def dump_bytecode(self, bucket: jinja2.bccache.Bucket) -> None:
+        data = bucket.bytecode_to_string()
+        self._remember(bucket.key, data)
+        if not self.directory:
+            return
+        path = os.path.join(self.directory, bucket.key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.debug(f"Could not cache the compiled template: {e}")
+
+    @classmethod
+    def _remember(cls, key: str, data: bytes) -> None:
+        memory = cls._memory
+        if len(memory) >= _BYTECODE_MEMORY_SIZE:
+            del memory[next(iter(memory))]
+        memory[key] = data
+
+
+class NavFragmentExtension(jinja2.ext.Extension):
+    """
+    Adds the `{% navfragment nav_item %}...{% endnavfragment %}` tag to cache the HTML of the nav.
+
+    The body of the tag is rendered only once per navigation item that isn't active, and then
+    reused for all pages, with the URLs passed through the `url` filter made relative to each
+    page. So the body must not depend on the current page in any other way while `nav_item` is
+    not active, which holds for the items that don't contain the current page.
+
+    The body is rendered for each page as usual if the `url` filter is replaced, or if the
+    templates for the items of the nav come from another directory than the template of the tag,
+    such as the `custom_dir`, as they could depend on the page.
+    """
+
+    tags = {'navfragment'}
+
+    def __init__(self, environment: jinja2.Environment) -> None:
+        super().__init__(environment)
+        environment.extend(mkdocs_nav_fragments=self)
+        self._fragments: dict[tuple[int, str], tuple[Any, str, list[tuple[str, bool]]]] = {}
+        # The URLs of the fragment being rendered for the cache, if any.
+        self._urls: list[tuple[str, bool]] | None = None
+        # Whether the fragments of each tag can be cached, by the template file of the tag.
+        self._cacheable: dict[str | None, bool] = {}
+
+    def parse(self, parser: jinja2.parser.Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        item = parser.parse_expression()
+        body = parser.parse_statements(('name:endnavfragment',), drop_needle=True)
+        args = [
+            item,
+            nodes.Const(f'{parser.name}:{lineno}'),
+            nodes.Const(parser.filename),
+            nodes.ContextReference(),
+        ]
+        return nodes.CallBlock(self.call_method('_render', args), [], [], body).set_lineno(lineno)
+
+    def _defer_url(self, value: str, autoescape: bool) -> str:
+        assert self._urls is not None
+        self._urls.append((value, autoescape))
+        return _NAV_URL_PLACEHOLDER.format(len(self._urls) - 1)
+
+    def _is_cacheable(self, filename: str | None) -> bool:
+        if self.environment.filters.get('url') is not url_filter:
+            return False
+        cacheable = self._cacheable.get(filename)
+        if cacheable is None:
+            cacheable = True
+            loader = self.environment.loader
+            if filename is not None and loader is not None:
+                directory = os.path.dirname(os.path.abspath(filename))
+                for name in _NAV_TEMPLATES:
+                    try:
+                        path = loader.get_source(self.environment, name)[1]
+                    except jinja2.TemplateNotFound:
+                        continue
+                    if path is None or os.path.dirname(os.path.abspath(path)) != directory:
+                        cacheable = False
+            self._cacheable[filename] = cacheable
+        return cacheable
+
+    def _render(
+        self,
+        item: Any,
+        site: str,
+        filename: str | None,
+        context: jinja2.runtime.Context,
+        caller: Callable,
+    ):
+        if self._urls is not None or getattr(item, 'active', False):
+            return caller()
+        if not self._is_cacheable(filename):
+            return caller()
+        key = (id(item), site)
+        entry = self._fragments.get(key)
+        # The item is kept in the entry, so that its `id` isn't reused by another object.
+        if entry is None or entry[0] is not item:
+            self._urls = []
+            try:
+                html = caller()
+            finally:
+                urls, self._urls = self._urls, None
+            entry = self._fragments[key] = (item, html, urls)
+        html, urls = entry[1], entry[2]
+        if not urls:
+            return html
+        page, base = context.get('page'), context.get('base_url', '')
+        resolved = []
+        for value, autoescape in urls:
+            url = normalize_url(value, page=page, base=base)
+            resolved.append(str(escape(url)) if autoescape else url)
+        result = _NAV_URL_PLACEHOLDER_RE.sub(lambda m: resolved[int(m[1])], html)
+        return Markup(result) if isinstance(html, Markup) else result